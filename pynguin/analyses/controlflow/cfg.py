@@ -11,7 +11,6 @@ import sys
 from typing import Dict, List, Optional, Tuple, cast
 
 from bytecode import Bytecode, ControlFlowGraph
-from networkx import NetworkXError, diameter
 
 import pynguin.analyses.controlflow.programgraph as pg
 
@@ -92,10 +91,8 @@ class CFG(pg.ProgramGraph[pg.ProgramGraphNode]):
         Returns:
             The reversed control-flow graph
         """
-        reversed_cfg = CFG(cfg.bytecode_cfg())
-        # pylint: disable=attribute-defined-outside-init
-        reversed_cfg._graph = cfg._graph.reverse(copy=True)
-        return reversed_cfg
+        # pylint: disable=protected-access
+        return cfg._copy_to(CFG(cfg.bytecode_cfg()), reverse=True)
 
     def reversed(self) -> CFG:
         """Provides the reversed graph of this graph.
@@ -115,12 +112,9 @@ class CFG(pg.ProgramGraph[pg.ProgramGraphNode]):
         Returns:
             The copied graph
         """
-        copy = CFG(
-            ControlFlowGraph()
-        )  # TODO(fk) Cloning the bytecode cfg is complicated.
-        # pylint: disable=attribute-defined-outside-init
-        copy._graph = cfg._graph.copy()
-        return copy
+        # TODO(fk) Cloning the bytecode cfg is complicated.
+        # pylint: disable=protected-access
+        return cfg._copy_to(CFG(ControlFlowGraph()))
 
     def copy(self) -> CFG:
         """Provides a copy of the control-flow graph.
@@ -199,7 +193,7 @@ class CFG(pg.ProgramGraph[pg.ProgramGraphNode]):
         Returns:
             McCabe's cyclocmatic complexity number
         """
-        return len(self._graph.edges) - len(self._graph.nodes) + 2
+        return len(self.edges) - len(self._nodes) + 2
 
     @property
     def diameter(self) -> int:
@@ -209,13 +203,21 @@ class CFG(pg.ProgramGraph[pg.ProgramGraphNode]):
             The diameter of the graph
         """
         if self._diameter is None:
-            # Do this computation lazily
-            try:
-                self._diameter = diameter(self._graph, usebounds=True)
-            except NetworkXError:
-                # It seems like NetworkX makes some assumptions on the graph which
-                # are not documented (or which I could not find at least) that caused
-                # these errors.
-                # If the diameter computation fails for some reason, use an upper bound
-                self._diameter = len(self._graph.edges)
+            # Do this computation lazily.  The diameter is only defined for
+            # strongly-connected graphs, which control-flow graphs with an entry and
+            # an exit node are not, thus, use the number of edges as an upper bound.
+            self._diameter = len(self.edges)
+            if self._is_strongly_connected():
+                self._diameter = max(
+                    max(self.get_shortest_path_lengths(node).values())
+                    for node in self._nodes.values()
+                )
         return self._diameter
+
+    def _is_strongly_connected(self) -> bool:
+        if not self._nodes:
+            return False
+        node = next(iter(self._nodes.values()))
+        return len(self.get_shortest_path_lengths(node)) == len(self._nodes) and len(
+            self.reversed().get_shortest_path_lengths(node)
+        ) == len(self._nodes)
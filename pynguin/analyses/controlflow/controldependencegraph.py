@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass
-from typing import Set
+from typing import Dict, List, Tuple
 
 import pynguin.analyses.controlflow.cfg as cfg
 import pynguin.analyses.controlflow.dominatortree as pdt
@@ -24,65 +24,243 @@ class ControlDependenceGraph(pg.ProgramGraph[pg.ProgramGraphNode]):
     def compute(graph: cfg.CFG) -> ControlDependenceGraph:
         """Computes the control-dependence graph for a given control-flow graph.
 
+        The post-dominator tree of the augmented control-flow graph is represented by
+        the immediate post-dominators of its integer-indexed nodes, such that the
+        checks for post-dominance and the least common ancestors are walks up the
+        tree.
+
         Args:
             graph: The control-flow graph
 
         Returns:
             The control-dependence graph
         """
-        augmented_cfg = ControlDependenceGraph._create_augmented_graph(graph)
-        post_dominator_tree = pdt.DominatorTree.compute_post_dominator_tree(
-            augmented_cfg
+        nodes, successors = ControlDependenceGraph._create_augmented_graph(graph)
+        post_dominators, depths = ControlDependenceGraph._get_post_dominators(
+            successors
         )
-        cdg = ControlDependenceGraph()
-        nodes = augmented_cfg.nodes
 
+        cdg = ControlDependenceGraph()
         for node in nodes:
             cdg.add_node(node)
 
-        # Find matching edges in the CFG.
-        edges: Set[ControlDependenceGraph._Edge] = set()
-        for source in nodes:
-            for target in augmented_cfg.get_successors(source):
-                if source not in post_dominator_tree.get_transitive_successors(target):
-                    edges.add(
-                        ControlDependenceGraph._Edge(source=source, target=target)
+        # Find matching edges in the CFG, i.e., edges whose target does not
+        # post-dominate their source, together with the least common ancestor of
+        # their nodes in the post-dominator tree.
+        edges: Dict[ControlDependenceGraph._Edge, int] = {}
+        for source, targets in enumerate(successors):
+            for target in targets:
+                least_common_ancestor = (
+                    ControlDependenceGraph._get_least_common_ancestor(
+                        post_dominators, depths, source, target
                     )
+                )
+                if least_common_ancestor != target or source == target:
+                    edges[
+                        ControlDependenceGraph._Edge(
+                            source=nodes[source], target=nodes[target]
+                        )
+                    ] = least_common_ancestor
 
         # Mark nodes in the PDT and construct edges for them.
-        for edge in edges:
-            least_common_ancestor = post_dominator_tree.get_least_common_ancestor(
-                edge.source, edge.target
-            )
-            current = edge.target
+        indices = {node: index for index, node in enumerate(nodes)}
+        for edge, least_common_ancestor in edges.items():
+            current = indices[edge.target]
             while current != least_common_ancestor:
-                cdg.add_edge(edge.source, current)
-                predecessors = post_dominator_tree.get_predecessors(current)
-                assert len(predecessors) == 1, (
-                    "Cannot have more than one predecessor in a tree, this violates a "
-                    + "tree invariant"
-                )
-                current = predecessors.pop()
+                cdg.add_edge(edge.source, nodes[current])
+                current = post_dominators[current]
 
-            if least_common_ancestor is edge.source:
-                cdg.add_edge(edge.source, least_common_ancestor)
+            if nodes[least_common_ancestor] is edge.source:
+                cdg.add_edge(edge.source, edge.source)
 
         return pg.filter_dead_code_nodes(cdg, entry_node_index=-sys.maxsize)
 
     @staticmethod
-    def _create_augmented_graph(graph: cfg.CFG) -> cfg.CFG:
+    def _get_post_dominators(
+        successors: List[List[int]],
+    ) -> Tuple[List[int], List[int]]:
+        """Computes the post-dominator tree of the augmented control-flow graph.
+
+        Args:
+            successors: The successors of every node of the augmented graph
+
+        Returns:
+            The immediate post-dominator and the depth in the post-dominator tree of
+            every node
+        """
+        predecessors: List[List[int]] = [[] for _ in successors]
+        for source, targets in enumerate(successors):
+            for target in targets:
+                predecessors[target].append(source)
+        exit_node = next(
+            index for index, targets in enumerate(successors) if not targets
+        )
+        ControlDependenceGraph._connect_infinite_loops(predecessors, exit_node)
+        post_dominators = pdt.compute_immediate_dominators(predecessors, exit_node)
+        depths = ControlDependenceGraph._get_depths(post_dominators, exit_node)
+        return post_dominators, depths
+
+    @staticmethod
+    def _create_augmented_graph(
+        graph: cfg.CFG,
+    ) -> Tuple[List[pg.ProgramGraphNode], List[List[int]]]:
         entry_node = graph.entry_node
         assert entry_node, "Cannot work with CFG without entry node"
         exit_nodes = graph.exit_nodes
-        augmented_graph = graph.copy()
+        nodes, successors = graph.get_adjacency_lists()
         start_node = pg.ProgramGraphNode(index=-sys.maxsize, is_artificial=True)
-        augmented_graph.add_node(start_node)
-        augmented_graph.add_edge(start_node, entry_node)
-        for exit_node in exit_nodes:
-            augmented_graph.add_edge(start_node, exit_node)
-        return augmented_graph
+        indices = {node: index for index, node in enumerate(nodes)}
+        nodes.append(start_node)
+        successors.append(
+            list(
+                dict.fromkeys(
+                    [indices[entry_node]] + [indices[node] for node in exit_nodes]
+                )
+            )
+        )
+        return nodes, successors
+
+    @staticmethod
+    def _connect_infinite_loops(predecessors: List[List[int]], exit_node: int) -> None:
+        """Connects the nodes that cannot reach the exit node to the exit node.
+
+        Nodes in infinite loops have no post-dominators.  Like an edge from the loop
+        to the exit node, an edge from the exit node to one node of the loop in the
+        reversed graph makes all nodes of the loop reachable in it.
+
+        Args:
+            predecessors: The predecessors of every node, i.e., the successors in
+                the reversed graph, which are modified in place
+            exit_node: The exit node
+        """
+        reachable = [False] * len(predecessors)
+        for root in [exit_node, *range(len(predecessors))]:
+            if reachable[root]:
+                continue
+            if root != exit_node:
+                predecessors[exit_node].append(root)
+            reachable[root] = True
+            stack = [root]
+            while stack:
+                for predecessor in predecessors[stack.pop()]:
+                    if not reachable[predecessor]:
+                        reachable[predecessor] = True
+                        stack.append(predecessor)
+
+    @staticmethod
+    def _get_depths(dominators: List[int], root: int) -> List[int]:
+        """Computes the depths of the nodes in a tree of immediate dominators.
+
+        Args:
+            dominators: The immediate dominator of every node
+            root: The root of the tree, which has to contain all nodes
+
+        Returns:
+            The depth of every node in the tree
+        """
+        depths = [-1] * len(dominators)
+        depths[root] = 0
+        for node in range(len(dominators)):
+            path: List[int] = []
+            current = node
+            while depths[current] < 0:
+                path.append(current)
+                current = dominators[current]
+            depth = depths[current]
+            for ancestor in reversed(path):
+                depth += 1
+                depths[ancestor] = depth
+        return depths
+
+    @staticmethod
+    def _get_least_common_ancestor(
+        dominators: List[int], depths: List[int], first: int, second: int
+    ) -> int:
+        while depths[first] > depths[second]:
+            first = dominators[first]
+        while depths[second] > depths[first]:
+            second = dominators[second]
+        while first != second:
+            first = dominators[first]
+            second = dominators[second]
+        return first
 
     @dataclass(eq=True, frozen=True)
     class _Edge:
         source: pg.ProgramGraphNode
         target: pg.ProgramGraphNode
+
+
+class ApproachLevelIndex:
+    """Indexes the approach levels between the predicate nodes of a CDG.
+
+    The approach level from one predicate node to another is the length of the
+    shortest path between them in the control-dependence graph.  The index is
+    computed once per code object, such that computing a control-flow distance
+    only requires a lookup instead of a search in the graph.
+    """
+
+    def __init__(
+        self,
+        predicate_nodes: Dict[int, pg.ProgramGraphNode],
+        approach_levels: Dict[int, List[Tuple[int, int]]],
+    ) -> None:
+        """Creates a new index.
+
+        Args:
+            predicate_nodes: Maps the predicate ids to their nodes
+            approach_levels: Maps the id of every predicate to the approach levels
+                from the predicates from which it can be reached
+        """
+        self._predicate_nodes = predicate_nodes
+        self._approach_levels = approach_levels
+
+    @staticmethod
+    def compute(graph: ControlDependenceGraph) -> ApproachLevelIndex:
+        """Computes the approach levels between all predicate nodes of a CDG.
+
+        Args:
+            graph: The control-dependence graph
+
+        Returns:
+            The index of the approach levels
+        """
+        predicate_nodes = {
+            node.predicate_id: node
+            for node in graph.nodes
+            if node.predicate_id is not None
+        }
+        approach_levels: Dict[int, List[Tuple[int, int]]] = {
+            predicate_id: [] for predicate_id in predicate_nodes
+        }
+        for source_id, source in predicate_nodes.items():
+            for target, length in graph.get_shortest_path_lengths(source).items():
+                if target.predicate_id is not None and target is not source:
+                    approach_levels[target.predicate_id].append((length, source_id))
+        for levels in approach_levels.values():
+            levels.sort()
+        return ApproachLevelIndex(predicate_nodes, approach_levels)
+
+    def get_node(self, predicate_id: int) -> pg.ProgramGraphNode:
+        """Provides the node of the given predicate.
+
+        Args:
+            predicate_id: The id of the predicate
+
+        Returns:
+            The node of the predicate
+        """
+        return self._predicate_nodes[predicate_id]
+
+    def get_approach_levels(self, predicate_id: int) -> List[Tuple[int, int]]:
+        """Provides the approach levels from the predicates from which the given
+        predicate can be reached.
+
+        Args:
+            predicate_id: The id of the target predicate
+
+        Returns:
+            A list of approach levels and ids of source predicates, which is sorted
+            by ascending approach level
+        """
+        return self._approach_levels[predicate_id]
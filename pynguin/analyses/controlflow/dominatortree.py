@@ -7,13 +7,124 @@
 """Provides an implementation of a dominator tree."""
 from __future__ import annotations
 
-import queue
-from typing import Dict, Set
+from typing import List, Sequence, Tuple
 
 import pynguin.analyses.controlflow.cfg as cfg
 import pynguin.analyses.controlflow.programgraph as pg
 
 
+def compute_immediate_dominators(
+    successors: Sequence[Sequence[int]], entry: int
+) -> List[int]:
+    """Computes the immediate dominator of every node of a graph.
+
+    The nodes of the graph are identified by the integers from zero to the number
+    of nodes, and the graph is given as adjacency lists.  Uses the iterative
+    algorithm of Cooper, Harvey, and Kennedy, which intersects the dominator sets
+    of the predecessors of a node by walking up the partial dominator tree in
+    terms of the postorder numbers of the nodes.  Processing the nodes in reverse
+    postorder reaches the fixed point after a few passes over the nodes.
+
+    See: K. D. Cooper, T. J. Harvey, and K. Kennedy.  A Simple, Fast Dominance
+    Algorithm.  Software Practice and Experience 4, 2001.
+
+    Args:
+        successors: The successors of every node of the graph
+        entry: The entry node of the graph
+
+    Returns:
+        The immediate dominator of every node.  The entry node is its own immediate
+        dominator, nodes that are not reachable from the entry node have -1.
+    """
+    number = len(successors)
+    postorder = _compute_postorder(successors, entry)
+    postorder_numbers = [-1] * number
+    for postorder_number, node in enumerate(postorder):
+        postorder_numbers[node] = postorder_number
+
+    predecessors: List[List[int]] = [[] for _ in range(number)]
+    for node in postorder:
+        for successor in successors[node]:
+            predecessors[successor].append(node)
+
+    dominators = [-1] * number
+    dominators[entry] = entry
+    reverse_postorder = postorder[-2::-1]
+    changed = True
+    while changed:
+        changed = False
+        for node in reverse_postorder:
+            new_dominator = -1
+            for predecessor in predecessors[node]:
+                if dominators[predecessor] == -1:
+                    # Not yet processed in this pass.
+                    continue
+                if new_dominator == -1:
+                    new_dominator = predecessor
+                else:
+                    new_dominator = _intersect(
+                        predecessor, new_dominator, dominators, postorder_numbers
+                    )
+            if dominators[node] != new_dominator:
+                dominators[node] = new_dominator
+                changed = True
+    return dominators
+
+
+def _compute_postorder(successors: Sequence[Sequence[int]], entry: int) -> List[int]:
+    """Computes the postorder of the nodes that are reachable from the entry node by
+    an iterative depth-first search.
+
+    Args:
+        successors: The successors of every node of the graph
+        entry: The entry node of the graph
+
+    Returns:
+        The reachable nodes in postorder
+    """
+    postorder: List[int] = []
+    visited = [False] * len(successors)
+    visited[entry] = True
+    stack: List[Tuple[int, int]] = [(entry, 0)]
+    while stack:
+        node, position = stack[-1]
+        node_successors = successors[node]
+        while position < len(node_successors) and visited[node_successors[position]]:
+            position += 1
+        if position < len(node_successors):
+            successor = node_successors[position]
+            stack[-1] = (node, position + 1)
+            visited[successor] = True
+            stack.append((successor, 0))
+        else:
+            stack.pop()
+            postorder.append(node)
+    return postorder
+
+
+def _intersect(
+    first: int, second: int, dominators: List[int], postorder_numbers: List[int]
+) -> int:
+    """Finds the common dominator of two nodes by walking up the partial dominator
+    tree.
+
+    Args:
+        first: The first node
+        second: The second node
+        dominators: The partial immediate dominators of the nodes
+        postorder_numbers: The postorder numbers of the nodes
+
+    Returns:
+        The nearest common dominator of both nodes
+    """
+    while first != second:
+        while postorder_numbers[first] < postorder_numbers[second]:
+            first = dominators[first]
+        while postorder_numbers[second] < postorder_numbers[first]:
+            second = dominators[second]
+    return first
+
+
 class DominatorTree(pg.ProgramGraph[pg.ProgramGraphNode]):
     """Implements a dominator tree."""
 
@@ -39,8 +150,8 @@ class DominatorTree(pg.ProgramGraph[pg.ProgramGraphNode]):
         Returns:
             The post-dominator tree for the control-flow graph
         """
-        reversed_cfg = graph.reversed()
-        return DominatorTree.compute(reversed_cfg)
+        nodes, successors = graph.get_adjacency_lists(reverse=True)
+        return DominatorTree._compute(nodes, successors)
 
     @staticmethod
     def compute_dominance_tree(graph: cfg.CFG) -> DominatorTree:
@@ -52,83 +163,36 @@ class DominatorTree(pg.ProgramGraph[pg.ProgramGraphNode]):
         Returns:
             The dominance tree for the control-flow graph
         """
-        dominance: Dict[
-            pg.ProgramGraphNode, Set[pg.ProgramGraphNode]
-        ] = DominatorTree._calculate_dominance(graph)
-        for dominance_node, nodes in dominance.items():
-            nodes.discard(dominance_node)
-        dominance_tree = DominatorTree()
-        entry_node = graph.entry_node
-        assert entry_node is not None
-        dominance_tree.add_node(entry_node)
-
-        node_queue: queue.SimpleQueue = queue.SimpleQueue()
-        node_queue.put(entry_node)
-        while not node_queue.empty():
-            node: pg.ProgramGraphNode = node_queue.get()
-            for current, dominators in dominance.items():
-                if node in dominators:
-                    dominators.remove(node)
-                    if len(dominators) == 0:
-                        dominance_tree.add_node(current)
-                        dominance_tree.add_edge(node, current)
-                        node_queue.put(current)
-        return dominance_tree
+        nodes, successors = graph.get_adjacency_lists()
+        return DominatorTree._compute(nodes, successors)
 
     @staticmethod
-    def _calculate_dominance(
-        graph: cfg.CFG,
-    ) -> Dict[pg.ProgramGraphNode, Set[pg.ProgramGraphNode]]:
-        dominance_map: Dict[pg.ProgramGraphNode, Set[pg.ProgramGraphNode]] = {}
-        entry = graph.entry_node
-        assert entry, "Cannot work with a graph without entry nodes"
-        entry_dominators: Set[pg.ProgramGraphNode] = {entry}
-        dominance_map[entry] = entry_dominators
-
-        for node in graph.nodes:
-            if node == entry:
-                continue
-            all_nodes: Set[pg.ProgramGraphNode] = set(graph.nodes)
-            dominance_map[node] = all_nodes
-
-        changed: bool = True
-        while changed:
-            changed = False
-            for node in graph.nodes:
-                if node == entry:
-                    continue
-                current_dominators = dominance_map.get(node)
-                new_dominators = DominatorTree._calculate_dominators(
-                    graph, dominance_map, node
-                )
-
-                if current_dominators != new_dominators:
-                    changed = True
-                    dominance_map[node] = new_dominators
-                    break
-
-        return dominance_map
+    def _compute(
+        nodes: List[pg.ProgramGraphNode], successors: List[List[int]]
+    ) -> DominatorTree:
+        entry = DominatorTree._get_entry(successors)
+        dominators = compute_immediate_dominators(successors, entry)
+        children: List[List[int]] = [[] for _ in nodes]
+        for node, dominator in enumerate(dominators):
+            if dominator != -1 and node != entry:
+                children[dominator].append(node)
+
+        # Add the nodes in breadth-first order, i.e., parents before their children.
+        dominance_tree = DominatorTree()
+        dominance_tree.add_node(nodes[entry])
+        node_queue = [entry]
+        for node in node_queue:
+            for child in children[node]:
+                dominance_tree.add_node(nodes[child])
+                dominance_tree.add_edge(nodes[node], nodes[child])
+                node_queue.append(child)
+        return dominance_tree
 
     @staticmethod
-    def _calculate_dominators(
-        graph: cfg.CFG,
-        dominance_map: Dict[pg.ProgramGraphNode, Set[pg.ProgramGraphNode]],
-        node: pg.ProgramGraphNode,
-    ) -> Set[pg.ProgramGraphNode]:
-        dominators: Set[pg.ProgramGraphNode] = {node}
-        intersection: Set[pg.ProgramGraphNode] = set()
-        predecessors = graph.get_predecessors(node)
-        if not predecessors:
-            return set()
-
-        first_time: bool = True
-        for predecessor in predecessors:
-            predecessor_dominators = dominance_map.get(predecessor)
-            assert predecessor_dominators is not None, "Cannot be None"
-            if first_time:
-                intersection = intersection.union(predecessor_dominators)
-                first_time = False
-            else:
-                intersection.intersection_update(predecessor_dominators)
-        intersection = intersection.union(dominators)
-        return intersection
+    def _get_entry(successors: List[List[int]]) -> int:
+        has_predecessors = [False] * len(successors)
+        for node_successors in successors:
+            for successor in node_successors:
+                has_predecessors[successor] = True
+        assert not all(has_predecessors), "Cannot work with a graph without entry nodes"
+        return has_predecessors.index(False)
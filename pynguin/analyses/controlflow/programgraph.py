@@ -5,11 +5,14 @@
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
 """Provides base classes of a program graph."""
-from typing import Any, Generic, Optional, Set, TypeVar
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
 
 import networkx as nx
 from bytecode import BasicBlock
-from networkx import lowest_common_ancestor
 from networkx.drawing.nx_pydot import to_pydot
 
 
@@ -91,17 +94,172 @@ class ProgramGraphNode:
 
 
 N = TypeVar("N", bound=ProgramGraphNode)  # pylint: disable=invalid-name
+G = TypeVar("G", bound="ProgramGraph")  # pylint: disable=invalid-name
+
+
+@dataclass(frozen=True)
+class _CompactAdjacency:
+    """The edges of a program graph in the compressed sparse row (CSR) format.
+
+    The nodes are identified by their positions in the graph.  The successors of
+    all nodes are stored consecutively in one array, such that the successors of
+    the node at position i are located between the i-th and the (i+1)-th offset.
+    The predecessors are stored alike.  The arrays are never modified, thus, copies
+    of a graph share them.
+    """
+
+    successor_offsets: array
+    successors: array
+    predecessor_offsets: array
+    predecessors: array
+
+    def successors_of(self, position: int) -> array:
+        """Provides the successors of a node.
+
+        Args:
+            position: The position of the node
+
+        Returns:
+            The positions of the successors of the node
+        """
+        return self.successors[
+            self.successor_offsets[position] : self.successor_offsets[position + 1]
+        ]
+
+    def predecessors_of(self, position: int) -> array:
+        """Provides the predecessors of a node.
+
+        Args:
+            position: The position of the node
+
+        Returns:
+            The positions of the predecessors of the node
+        """
+        return self.predecessors[
+            self.predecessor_offsets[position] : self.predecessor_offsets[position + 1]
+        ]
+
+    def reversed(self) -> _CompactAdjacency:
+        """Provides the edges in reversed direction.
+
+        Returns:
+            The reversed edges
+        """
+        return _CompactAdjacency(
+            successor_offsets=self.predecessor_offsets,
+            successors=self.predecessors,
+            predecessor_offsets=self.successor_offsets,
+            predecessors=self.successors,
+        )
 
 
 class ProgramGraph(Generic[N]):
     """Provides a base implementation for a program graph.
 
-    Internally, this program graph uses the `NetworkX` library to hold the graph and
-    do all the operations on it.
+    The graph identifies its nodes by their indices.  While the graph is built, its
+    edges are stored in adjacency maps.  The first query compacts them into arrays
+    of node positions in the CSR format, which need less memory than the maps and
+    are queried by slicing.  Modifying a compacted graph expands it again.  The
+    `NetworkX` library is only used to export the graph to DOT.
     """
 
     def __init__(self) -> None:
-        self._graph = nx.DiGraph()
+        # The nodes of the graph by their index, in insertion order.
+        self._nodes: Dict[int, N] = {}
+        # The successors of every node by their index, in insertion order, while the
+        # graph is built.
+        self._successor_map: Optional[Dict[int, Dict[int, None]]] = {}
+        # The edges in the CSR format, while the graph is queried, together with the
+        # nodes by their position and the positions of the nodes by their index.
+        self._compact: Optional[_CompactAdjacency] = None
+        self._node_list: List[N] = []
+        self._positions: Dict[int, int] = {}
+        # Attributes are rarely used, they are only stored for the DOT export.
+        self._node_attributes: Dict[int, Dict[str, Any]] = {}
+        self._edge_attributes: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+    def _expand(self) -> Dict[int, Dict[int, None]]:
+        """Provides the adjacency maps for modifying the graph.
+
+        Returns:
+            The successors of every node by their index
+        """
+        if self._successor_map is None:
+            compact = self._compact
+            assert compact is not None
+            nodes = self._node_list
+            self._successor_map = {
+                node.index: dict.fromkeys(
+                    nodes[successor].index
+                    for successor in compact.successors_of(position)
+                )
+                for position, node in enumerate(nodes)
+            }
+        self._compact = None
+        return self._successor_map
+
+    def _get_compact(self) -> _CompactAdjacency:
+        """Provides the compacted edges of the graph for querying it.
+
+        Returns:
+            The edges of the graph in the CSR format
+        """
+        if self._compact is None:
+            successor_map = self._successor_map
+            assert successor_map is not None
+            self._node_list = list(self._nodes.values())
+            self._positions = {
+                index: position for position, index in enumerate(self._nodes)
+            }
+            successor_offsets = array("i", [0])
+            successors = array("i")
+            predecessor_lists: List[List[int]] = [[] for _ in self._node_list]
+            for position, index in enumerate(self._nodes):
+                for successor in successor_map[index]:
+                    successor_position = self._positions[successor]
+                    successors.append(successor_position)
+                    predecessor_lists[successor_position].append(position)
+                successor_offsets.append(len(successors))
+            predecessor_offsets = array("i", [0])
+            predecessors = array("i")
+            for node_predecessors in predecessor_lists:
+                predecessors.extend(node_predecessors)
+                predecessor_offsets.append(len(predecessors))
+            self._compact = _CompactAdjacency(
+                successor_offsets=successor_offsets,
+                successors=successors,
+                predecessor_offsets=predecessor_offsets,
+                predecessors=predecessors,
+            )
+            self._successor_map = None
+        return self._compact
+
+    def _copy_to(self, graph: G, reverse: bool = False) -> G:
+        """Copies the nodes and edges of this graph into an empty graph.
+
+        Args:
+            graph: The empty graph
+            reverse: Whether the edges shall be reversed
+
+        Returns:
+            The given graph
+        """
+        compact = self._get_compact()
+        # pylint: disable=protected-access
+        graph._nodes = dict(self._nodes)
+        graph._node_list = self._node_list
+        graph._positions = self._positions
+        graph._successor_map = None
+        graph._compact = compact.reversed() if reverse else compact
+        graph._node_attributes = {
+            index: dict(attributes)
+            for index, attributes in self._node_attributes.items()
+        }
+        graph._edge_attributes = {
+            ((target, source) if reverse else (source, target)): dict(attributes)
+            for (source, target), attributes in self._edge_attributes.items()
+        }
+        return graph
 
     def add_node(self, node: N, **attr: Any) -> None:
         """Add a node to the graph
@@ -110,7 +268,12 @@ class ProgramGraph(Generic[N]):
             node: The node
             attr: A dict of attributes that will be attached to the node
         """
-        self._graph.add_node(node, **attr)
+        successor_map = self._expand()
+        if node.index not in self._nodes:
+            self._nodes[node.index] = node
+            successor_map[node.index] = {}
+        if attr:
+            self._node_attributes.setdefault(node.index, {}).update(attr)
 
     def add_edge(self, start: N, end: N, **attr: Any) -> None:
         """Add an edge between two nodes to the graph
@@ -120,7 +283,32 @@ class ProgramGraph(Generic[N]):
             end: The end node of the edge
             attr: A dict of attributes that will be attached to the edge.
         """
-        self._graph.add_edge(start, end, **attr)
+        self.add_node(start)
+        self.add_node(end)
+        self._expand()[start.index][end.index] = None
+        if attr:
+            self._edge_attributes.setdefault((start.index, end.index), {}).update(attr)
+
+    def remove_nodes(self, nodes: Iterable[N]) -> None:
+        """Removes nodes and their edges from the graph.
+
+        Args:
+            nodes: The nodes to remove
+        """
+        indices = {node.index for node in nodes}
+        successor_map = self._expand()
+        for index in indices:
+            del self._nodes[index]
+            del successor_map[index]
+            self._node_attributes.pop(index, None)
+        for successors in successor_map.values():
+            for index in indices.intersection(successors):
+                del successors[index]
+        self._edge_attributes = {
+            edge: attributes
+            for edge, attributes in self._edge_attributes.items()
+            if edge[0] not in indices and edge[1] not in indices
+        }
 
     def get_predecessors(self, node: N) -> Set[N]:
         """Provides a set of all direct predecessors of a node.
@@ -131,10 +319,9 @@ class ProgramGraph(Generic[N]):
         Returns:
             A set of direct predecessors of the node
         """
-        predecessors: Set[N] = set()
-        for predecessor in self._graph.predecessors(node):
-            predecessors.add(predecessor)
-        return predecessors
+        predecessors = self._get_compact().predecessors_of(self._positions[node.index])
+        nodes = self._node_list
+        return {nodes[predecessor] for predecessor in predecessors}
 
     def get_successors(self, node: N) -> Set[N]:
         """Provides a set of all direct successors of a node.
@@ -145,10 +332,9 @@ class ProgramGraph(Generic[N]):
         Returns:
             A set of direct successors of the node
         """
-        successors: Set[N] = set()
-        for successor in self._graph.successors(node):
-            successors.add(successor)
-        return successors
+        successors = self._get_compact().successors_of(self._positions[node.index])
+        nodes = self._node_list
+        return {nodes[successor] for successor in successors}
 
     @property
     def nodes(self) -> Set[N]:
@@ -157,19 +343,23 @@ class ProgramGraph(Generic[N]):
         Returns:
             The set of all nodes in the graph
         """
-        return {
-            node
-            for node in self._graph.nodes  # pylint: disable=unnecessary-comprehension
-        }
+        return set(self._nodes.values())
 
     @property
-    def graph(self) -> nx.DiGraph:
-        """The internal graph.
+    def edges(self) -> List[Tuple[N, N]]:
+        """Provides all edges of the graph.
 
         Returns:
-            The internal graph
+            The edges, ordered by their start nodes in the order of insertion, and by
+            their end nodes in the order of insertion of the edges
         """
-        return self._graph
+        compact = self._get_compact()
+        nodes = self._node_list
+        return [
+            (node, nodes[successor])
+            for position, node in enumerate(nodes)
+            for successor in compact.successors_of(position)
+        ]
 
     @property
     def entry_node(self) -> Optional[N]:
@@ -178,8 +368,9 @@ class ProgramGraph(Generic[N]):
         Returns:
             The entry node of the graph
         """
-        for node in self._graph.nodes:
-            if len(self.get_predecessors(node)) == 0:
+        offsets = self._get_compact().predecessor_offsets
+        for position, node in enumerate(self._node_list):
+            if offsets[position] == offsets[position + 1]:
                 return node
         return None
 
@@ -190,11 +381,60 @@ class ProgramGraph(Generic[N]):
         Returns:
             The set of exit nodes of the graph
         """
-        exit_nodes: Set[N] = set()
-        for node in self._graph.nodes:
-            if len(self.get_successors(node)) == 0:
-                exit_nodes.add(node)
-        return exit_nodes
+        offsets = self._get_compact().successor_offsets
+        return {
+            node
+            for position, node in enumerate(self._node_list)
+            if offsets[position] == offsets[position + 1]
+        }
+
+    def get_adjacency_lists(
+        self, reverse: bool = False
+    ) -> Tuple[List[N], List[List[int]]]:
+        """Provides the graph as adjacency lists of the positions of its nodes.
+
+        Args:
+            reverse: Whether the edges of the graph shall be reversed
+
+        Returns:
+            The nodes of the graph in the order of their positions, and the positions
+            of the successors of every node
+        """
+        compact = self._get_compact()
+        if reverse:
+            compact = compact.reversed()
+        return list(self._node_list), [
+            compact.successors_of(position).tolist()
+            for position in range(len(self._node_list))
+        ]
+
+    def get_shortest_path_lengths(self, node: N) -> Dict[N, int]:
+        """Computes the lengths of the shortest paths from a node to all nodes that
+        are reachable from it.
+
+        Args:
+            node: The node to start with
+
+        Returns:
+            The length of the shortest path to every reachable node, including the
+            node itself
+        """
+        compact = self._get_compact()
+        start = self._positions[node.index]
+        lengths = {start: 0}
+        frontier = [start]
+        length = 0
+        while frontier:
+            length += 1
+            next_frontier: List[int] = []
+            for position in frontier:
+                for successor in compact.successors_of(position):
+                    if successor not in lengths:
+                        lengths[successor] = length
+                        next_frontier.append(successor)
+            frontier = next_frontier
+        nodes = self._node_list
+        return {nodes[position]: length for position, length in lengths.items()}
 
     def get_transitive_successors(self, node: N) -> Set[N]:
         """Calculates the transitive closure (the transitive successors) of a node.
@@ -205,31 +445,68 @@ class ProgramGraph(Generic[N]):
         Returns:
             The transitive closure of the node
         """
-        return self._get_transitive_successors(node, set())
-
-    def _get_transitive_successors(self, node: N, done: Set[N]) -> Set[N]:
-        successors: Set[N] = set()
-        for successor_node in self.get_successors(node):
-            if successor_node not in done:
-                successors.add(successor_node)
-                done.add(successor_node)
-                successors.update(self._get_transitive_successors(successor_node, done))
-        return successors
-
-    def get_least_common_ancestor(self, first: N, second: N) -> N:
+        compact = self._get_compact()
+        visited: Set[int] = set()
+        stack = [self._positions[node.index]]
+        while stack:
+            for successor in compact.successors_of(stack.pop()):
+                if successor not in visited:
+                    visited.add(successor)
+                    stack.append(successor)
+        nodes = self._node_list
+        return {nodes[position] for position in visited}
+
+    def _get_ancestors(self, position: int) -> Dict[int, None]:
+        compact = self._get_compact()
+        ancestors = {position: None}
+        stack = [position]
+        while stack:
+            for predecessor in compact.predecessors_of(stack.pop()):
+                if predecessor not in ancestors:
+                    ancestors[predecessor] = None
+                    stack.append(predecessor)
+        return ancestors
+
+    def get_least_common_ancestor(self, first: N, second: N) -> Optional[N]:
         """Calculates the least or lowest common ancestor node of two nodes of the
         graph.
 
-        Both nodes have to be part of the graph!
+        Both nodes have to be part of the graph!  A common ancestor is a lowest one,
+        if none of its successors is a common ancestor.
 
         Args:
             first: The first node
             second: The second node
 
         Returns:
-            The least common ancestor node of the two nodes
+            The least common ancestor node of the two nodes, if any
         """
-        return lowest_common_ancestor(self._graph, first, second)
+        compact = self._get_compact()
+        first_ancestors = self._get_ancestors(self._positions[first.index])
+        common_ancestors = {
+            ancestor
+            for ancestor in self._get_ancestors(self._positions[second.index])
+            if ancestor in first_ancestors
+        }
+        for ancestor in common_ancestors:
+            if common_ancestors.isdisjoint(compact.successors_of(ancestor)):
+                return self._node_list[ancestor]
+        return None
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Exports the graph to a `NetworkX` graph.
+
+        Returns:
+            The exported graph
+        """
+        graph = nx.DiGraph()
+        for index, node in self._nodes.items():
+            graph.add_node(node, **self._node_attributes.get(index, {}))
+        for start, end in self.edges:
+            graph.add_edge(
+                start, end, **self._edge_attributes.get((start.index, end.index), {})
+            )
+        return graph
 
     @property
     def dot(self) -> str:
@@ -238,13 +515,10 @@ class ProgramGraph(Generic[N]):
         Returns:
             The DOT representation of this graph
         """
-        dot = to_pydot(self._graph)
+        dot = to_pydot(self.to_networkx())
         return dot.to_string()
 
 
-G = TypeVar("G", bound=ProgramGraph)  # pylint: disable=invalid-name
-
-
 def filter_dead_code_nodes(graph: G, entry_node_index: int = 0) -> G:
     """Prunes dead nodes from the given graph.
 
@@ -258,16 +532,25 @@ def filter_dead_code_nodes(graph: G, entry_node_index: int = 0) -> G:
     Returns:
         The graph without the pruned dead nodes
     """
-    has_changed = True
-    while has_changed:
-        # Do this until we have reached a fixed point, i.e., removed all dead
-        # nodes from the graph.
-        has_changed = False
-        for node in graph.nodes:
-            if graph.get_predecessors(node) == set() and node.index != entry_node_index:
-                # The only node in the graph that is allowed to have no predecessor
-                # is the entry node, i.e., the node with index 0.  All other nodes
-                # without predecessors are considered dead code and thus removed.
-                graph.graph.remove_node(node)
-                has_changed = True
+    # The only node in the graph that is allowed to have no predecessor is the entry
+    # node, i.e., the node with index 0.  All other nodes without predecessors are
+    # considered dead code and thus removed, until we have reached a fixed point.
+    in_degrees: Dict[ProgramGraphNode, int] = dict.fromkeys(graph.nodes, 0)
+    for _, end in graph.edges:
+        in_degrees[end] += 1
+    dead = [
+        node
+        for node, in_degree in in_degrees.items()
+        if in_degree == 0 and node.index != entry_node_index
+    ]
+    removed: List[ProgramGraphNode] = []
+    while dead:
+        node = dead.pop()
+        removed.append(node)
+        for successor in graph.get_successors(node):
+            in_degrees[successor] -= 1
+            if in_degrees[successor] == 0 and successor.index != entry_node_index:
+                dead.append(successor)
+    if removed:
+        graph.remove_nodes(removed)
     return graph
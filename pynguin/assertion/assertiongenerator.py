@@ -16,6 +16,7 @@ import pynguin.ga.testcasechromosome as tcc
 import pynguin.ga.testsuitechromosome as tsc
 import pynguin.testcase.execution.testcaseexecutor as ex
 import pynguin.testcase.testcase as tc
+from pynguin.testcase.execution.executionresult import ExecutionResult
 from pynguin.utils import randomness
 
 
@@ -54,16 +55,18 @@ class AssertionGenerator(cv.ChromosomeVisitor):
         Args:
             test_cases: the test cases for which assertions should be generated.
         """
-        for test_case in test_cases:
-            self._add_assertions(test_case)
+        for test_case, result in zip(
+            test_cases, self._executor.execute_many(test_cases)
+        ):
+            self._add_assertions(test_case, result)
 
-    def _add_assertions(self, test_case: tc.TestCase) -> None:
+    def _add_assertions(self, test_case: tc.TestCase, result: ExecutionResult) -> None:
         """Adds assertions to the given test case.
 
         Args:
             test_case: the test case for which assertions should be generated.
+            result: the result of executing the test case.
         """
-        result = self._executor.execute(test_case)
         for statement in test_case.statements:
             for _, trace in result.output_traces.items():
                 for assertion in trace.get_assertions(statement):
@@ -90,11 +93,13 @@ class AssertionGenerator(cv.ChromosomeVisitor):
         for _ in range(2):
             # TODO(fk) Maybe reload module?
             randomness.RNG.shuffle(tests)
-            for test in tests:
-                self._filter_failing_assertions(test)
+            for test, result in zip(tests, self._executor.execute_many(tests)):
+                self._filter_failing_assertions(test, result)
 
-    def _filter_failing_assertions(self, test_case: tc.TestCase) -> None:
-        result = self._executor.execute(test_case)
+    @staticmethod
+    def _filter_failing_assertions(
+        test_case: tc.TestCase, result: ExecutionResult
+    ) -> None:
         for statement in test_case.statements:
             assertions = set()
             for _, trace in result.output_traces.items():
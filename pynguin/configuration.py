@@ -337,6 +337,69 @@ class TestCreationConfiguration:
     """Maximum number of test cases in a test suite"""
 
 
+@dataclasses.dataclass
+class ExecutionConfiguration:
+    """Configuration related to the execution of test cases."""
+
+    fast_tracer: bool = True
+    """Use an execution tracer with a low overhead per traced predicate, which does
+    not check its invariants with assertions.  Disable this to trace with the
+    checked execution tracer, e.g., when debugging the instrumentation."""
+
+    adaptive_instrumentation: bool = True
+    """Skip reporting a predicate to the tracer, once both of its branches were
+    taken during the execution of a test case.  Further executions cannot change
+    its branch distances, e.g., in later iterations of a loop.  The number of
+    executions of a saturated predicate is no longer counted exactly, but it is at
+    least two, which is all that the fitness functions need."""
+
+    instrumentation_cache_dir: Optional[str] = None
+    """Directory that caches the instrumented code of the module under test together
+    with the results of its control-flow analysis.  Subsequent runs on the same
+    source code with the same Python version and instrumentation settings load the
+    cached code instead of analysing and instrumenting the module again.  The
+    directory can be shared by concurrent runs.  No caching happens if unset.
+    Cached entries are unpickled, which can execute arbitrary code, thus, use a
+    directory that only trusted users can write to.  A missing directory is
+    created with permissions for its owner only."""
+
+    number_of_workers: int = 1
+    """Number of worker processes that execute test cases.  A value larger than one
+    distributes batches of test cases, e.g., the offspring of a generation, over a
+    pool of worker processes that are forked after the SUT was imported and
+    instrumented.  Requires a platform that supports forking processes."""
+
+    code_cache_size: int = 4096
+    """Maximum number of compiled statements that are kept in memory.  Statements
+    that are equal to a previously executed statement, e.g., in the offspring of a
+    test case, reuse its compiled code instead of being transformed and compiled
+    again.  Use 0 to disable the cache."""
+
+    whole_test_case_compilation: bool = True
+    """Compile all statements of a test case into a single code object, instead of
+    compiling and executing each statement on its own.  A raised exception is still
+    attributed to the statement that caused it.  Executions that are observed, e.g.,
+    for assertion generation, always execute each statement on its own."""
+
+    deterministic_sut: bool = False
+    """Whether the SUT is deterministic and its side effects are contained in the
+    objects created by a test case, i.e., executing equal statements always results
+    in equal states.  This allows to resume the execution of a test case from a
+    snapshot of the state after an equal prefix of statements, e.g., the prefix
+    that a mutated offspring shares with its parent.  Do not enable this for SUTs
+    that depend on global state, randomness, or the environment."""
+
+    snapshot_cache_size: int = 256
+    """Maximum number of test cases whose execution snapshots are kept in memory if
+    the SUT is deterministic.  Use 0 to disable snapshots."""
+
+    snapshot_interval: int = 5
+    """Number of statements that are executed between two snapshots of the state of
+    a test case.  A snapshot is also taken after the last statement of a test case.
+    Smaller intervals allow resuming closer to the end of a shared prefix, but copy
+    the state more often.  Must be at least one."""
+
+
 @dataclasses.dataclass
 class SearchAlgorithmConfiguration:
     """General configuration for search algorithms."""
@@ -394,6 +457,12 @@ class SearchAlgorithmConfiguration:
     selection: Selection = Selection.TOURNAMENT_SELECTION
     """The selection operator for genetic algorithms."""
 
+    fitness_cache_size: int = 1024
+    """Maximum number of fitness vectors that are kept in memory.  Test cases whose
+    execution traces equal a previous trace, e.g., offspring whose mutations did not
+    change the executed paths, reuse its fitness values for all goals instead of
+    computing them again.  Use 0 to disable the cache."""
+
 
 @dataclasses.dataclass
 class StoppingConfiguration:
@@ -458,6 +527,11 @@ class Configuration:
     )
     """Test creation configuration."""
 
+    execution: ExecutionConfiguration = dataclasses.field(
+        default_factory=ExecutionConfiguration
+    )
+    """Test execution configuration."""
+
     search_algorithm: SearchAlgorithmConfiguration = dataclasses.field(
         default_factory=SearchAlgorithmConfiguration
     )
@@ -5,8 +5,9 @@
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
 """Provides a factory for branch-coverage fitness functions."""
-from typing import List
+from typing import List, Sequence, cast
 
+import pynguin.coverage.branch.branchcoveragefitnessengine as bcfe
 import pynguin.coverage.branch.branchcoveragegoal as bcg
 import pynguin.coverage.branch.branchcoveragetestfitness as bctf
 import pynguin.ga.fitnessfunction as ff
@@ -28,6 +29,22 @@ class BranchCoverageFactory:
         """
         return self._compute_coverage_goals()
 
+    def get_fitness_engine(
+        self, goals: Sequence[ff.FitnessFunction]
+    ) -> bcfe.BranchCoverageFitnessEngine:
+        """Creates an engine that computes the fitness values of all given goals at
+        once.
+
+        Args:
+            goals: The branch-coverage fitness functions created by this factory
+
+        Returns:
+            A fitness engine for the goals
+        """
+        return bcfe.BranchCoverageFitnessEngine(
+            self._executor, cast(Sequence[bctf.BranchCoverageTestFitness], goals)
+        )
+
     def _compute_coverage_goals(self) -> List[ff.FitnessFunction]:
         goals: List[ff.FitnessFunction] = []
         tracer = self._executor.tracer
@@ -0,0 +1,186 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides an engine that computes the fitness values of all branch-coverage goals
+at once."""
+from math import inf
+from typing import List, Sequence, Tuple
+
+import pynguin.configuration as config
+import pynguin.coverage.branch.branchcoveragegoal as bcg
+import pynguin.coverage.branch.branchcoveragetestfitness as bctf
+import pynguin.ga.goalfitnessengine as gfe
+import pynguin.ga.testcasechromosome as tcc
+from pynguin.ga.fitnessfunctions.fitness_utilities import normalise
+from pynguin.ga.fitnessvectorcache import FitnessVectorCache
+from pynguin.testcase.execution.executionresult import ExecutionResult
+from pynguin.testcase.execution.executiontrace import ExecutionTrace
+from pynguin.testcase.execution.testcaseexecutor import TestCaseExecutor
+
+
+class BranchCoverageFitnessEngine(gfe.GoalFitnessEngine):
+    """Computes the fitness values of a test case for all branch-coverage goals.
+
+    The fitness value of a goal equals the resulting branch fitness of its
+    control-flow distance.  Instead of computing the distance of every goal
+    separately, the engine visits every predicate once and computes the fitness
+    values of both of its branches, which share the check of the code object and
+    the search for the closest executed predicate.
+
+    The fitness vector only depends on the execution trace, thus, the vectors are
+    cached by the fingerprints of their traces.  Test cases with an equal trace
+    share the vector instead of computing it again.
+    """
+
+    def __init__(
+        self,
+        executor: TestCaseExecutor,
+        goals: Sequence[bctf.BranchCoverageTestFitness],
+    ) -> None:
+        """Creates a new engine for the given goals.
+
+        Args:
+            executor: The executor that executes the test cases
+            goals: The branch-coverage fitness functions of the goals
+        """
+        super().__init__(goals)
+        self._executor = executor
+        self._fitness_functions = tuple(goals)
+        self._cache = FitnessVectorCache(
+            config.configuration.search_algorithm.fitness_cache_size
+        )
+        known_data = executor.tracer.get_known_data()
+
+        # Index of the goal and id of its code object
+        self._root_goals: List[Tuple[int, int]] = []
+        branch_goals: List[Tuple[int, int, bool]] = []
+        for index, goal in enumerate(self._fitness_functions):
+            if isinstance(goal.goal, bcg.RootBranchCoverageGoal):
+                self._root_goals.append((index, goal.goal.code_object_id))
+            else:
+                assert isinstance(goal.goal, bcg.NonRootBranchCoverageGoal)
+                branch_goals.append((index, goal.goal.predicate_id, goal.goal.value))
+
+        # For every predicate: its id, the id of its code object, the diameter of
+        # the code object, the approach levels from the other predicates, and the
+        # indices of the goals of its true and false branch, or -1, if the branch
+        # is no goal.
+        predicates = {
+            predicate_id: [predicate_id, -1, -1] for _, predicate_id, _ in branch_goals
+        }
+        for index, predicate_id, value in branch_goals:
+            predicates[predicate_id][1 if value else 2] = index
+        self._predicates: List[
+            Tuple[int, int, int, List[Tuple[int, int]], int, int]
+        ] = []
+        for predicate_id, true_index, false_index in predicates.values():
+            code_object_id = known_data.existing_predicates[predicate_id].code_object_id
+            code_object = known_data.existing_code_objects[code_object_id]
+            self._predicates.append(
+                (
+                    predicate_id,
+                    code_object_id,
+                    code_object.cfg.diameter,
+                    code_object.get_approach_levels().get_approach_levels(predicate_id),
+                    true_index,
+                    false_index,
+                )
+            )
+
+    def compute_fitness_vector(self, individual: tcc.TestCaseChromosome) -> List[float]:
+        if individual.is_execution_result_outdated():
+            individual.set_last_execution_result(
+                self._executor.execute(individual.test_case)
+            )
+        result = individual.get_last_execution_result()
+        assert result is not None
+        return self.compute_fitness_vector_for_result(result)
+
+    @property
+    def fitness_cache(self) -> FitnessVectorCache:
+        """Provides the cache of the fitness vectors.
+
+        Returns:
+            The cache of the fitness vectors
+        """
+        return self._cache
+
+    def compute_fitness_vector_for_result(self, result: ExecutionResult) -> List[float]:
+        """Computes the fitness values of all goals for an execution result.
+
+        Covered goals are marked when the vector of a trace is computed, thus, a
+        cached vector does not have to mark them again.
+
+        Args:
+            result: The execution result of a test case
+
+        Returns:
+            The fitness values, indexed like the goals
+        """
+        trace = result.execution_trace
+        fingerprint = trace.get_fingerprint()
+        vector = self._cache.get(fingerprint)
+        if vector is None:
+            vector = self._compute_fitness_vector_for_trace(trace)
+            self._cache.put(fingerprint, vector)
+        return vector
+
+    # pylint: disable=too-many-locals, too-many-branches
+    def _compute_fitness_vector_for_trace(self, trace: ExecutionTrace) -> List[float]:
+        executed_code_objects = trace.executed_code_objects
+        executed_predicates = trace.executed_predicates
+        true_distances = trace.true_distances
+        false_distances = trace.false_distances
+        vector = [0.0] * len(self._fitness_functions)
+        covered: List[int] = []
+
+        for index, code_object_id in self._root_goals:
+            if code_object_id in executed_code_objects:
+                covered.append(index)
+            else:
+                vector[index] = 1.0
+
+        for (
+            predicate_id,
+            code_object_id,
+            diameter,
+            approach_levels,
+            true_index,
+            false_index,
+        ) in self._predicates:
+            if code_object_id not in executed_code_objects:
+                # Code object was not executed, use diameter as upper bound.
+                true_fitness = false_fitness = float(diameter)
+            elif predicate_id in executed_predicates:
+                # Predicate was executed, use the distance of the respective branch.
+                true_fitness = normalise(true_distances.get(predicate_id, inf))
+                false_fitness = normalise(false_distances.get(predicate_id, inf))
+            else:
+                # Use the closest executed predicate, from which the predicate can be
+                # reached.  Both branches have the same distance.
+                best_level, best_distance = diameter, 0.0
+                for level, source in approach_levels:
+                    if level > best_level:
+                        break
+                    if source in executed_predicates:
+                        distance = true_distances.get(
+                            source, inf
+                        ) + false_distances.get(source, inf)
+                        if (level, distance) < (best_level, best_distance):
+                            best_level, best_distance = level, distance
+                true_fitness = false_fitness = best_level + normalise(best_distance)
+            if true_index >= 0:
+                vector[true_index] = true_fitness
+                if true_fitness == 0.0:
+                    covered.append(true_index)
+            if false_index >= 0:
+                vector[false_index] = false_fitness
+                if false_fitness == 0.0:
+                    covered.append(false_index)
+
+        for index in covered:
+            self._fitness_functions[index].mark_covered()
+        return vector
@@ -36,10 +36,14 @@ class BranchCoverageTestFitness(atcff.AbstractTestCaseFitnessFunction):
         fitness = distance.get_resulting_branch_fitness()
 
         if fitness == 0.0:
-            self._is_covered = True
+            self.mark_covered()
 
         return fitness
 
+    def mark_covered(self) -> None:
+        """Marks the goal of this fitness function as covered."""
+        self._is_covered = True
+
     def __str__(self) -> str:
         return (
             f"BranchCoverageTestFitness for {self._goal} (covered: {self._is_covered})"
@@ -9,12 +9,8 @@ from __future__ import annotations
 
 from functools import total_ordering
 from math import inf
-from typing import Any, Dict
+from typing import Any, Mapping
 
-import networkx as nx
-
-from pynguin.analyses.controlflow.controldependencegraph import ControlDependenceGraph
-from pynguin.analyses.controlflow.programgraph import ProgramGraphNode
 from pynguin.ga.fitnessfunctions.fitness_utilities import normalise
 from pynguin.testcase.execution.executionresult import ExecutionResult
 from pynguin.testcase.execution.executiontracer import ExecutionTracer
@@ -167,51 +163,34 @@ def get_non_root_control_flow_distance(
         distance.branch_distance = branch_distance
         return distance
 
-    cdg = tracer.get_known_data().existing_code_objects[code_object_id].cdg
-    target_node = _get_node_with_predicate_id(cdg, predicate_id)
+    code_object = tracer.get_known_data().existing_code_objects[code_object_id]
 
     # Choose diameter as upper bound
-    distance.approach_level = (
-        tracer.get_known_data().existing_code_objects[code_object_id].cfg.diameter
-    )
-
-    # We check for the closest predicate that was executed and compute the approach
-    # level as the length of the path from such a predicate node to the desired
-    # predicate node.
-    for node in [
-        node
-        for node in cdg.nodes
-        if node.predicate_id is not None
-        and node.predicate_id in trace.executed_predicates
-    ]:
-        try:
-            candidate = ControlFlowDistance()
-            candidate.approach_level = nx.shortest_path_length(
-                cdg.graph, node, target_node
+    distance.approach_level = code_object.cfg.diameter
+
+    # We check for the closest predicate that was executed and use the length of
+    # the path from such a predicate node to the desired predicate node as approach
+    # level.  The candidates are sorted by their approach level, thus, we can stop
+    # as soon as a candidate cannot be closer than the current distance.
+    for approach_level, source in code_object.get_approach_levels().get_approach_levels(
+        predicate_id
+    ):
+        if approach_level > distance.approach_level:
+            break
+        if source in trace.executed_predicates:
+            # Predicate was executed but did not lead to execution of desired
+            # predicate.  So the remaining branch distance to the true or false
+            # branch is the desired distance, right?  One of them has to be zero, so
+            # we can simply add them.
+            candidate = ControlFlowDistance(
+                approach_level,
+                _predicate_fitness(source, trace.true_distances)
+                + _predicate_fitness(source, trace.false_distances),
             )
-            # Predicate was executed but did not lead to execution of desired predicate
-            # So the remaining branch distance to the true or false branch is
-            # the desired distance, right?
-            # One of them has to be zero, so we can simply add them.
-            assert node.predicate_id is not None
-            candidate.branch_distance = _predicate_fitness(
-                node.predicate_id, trace.true_distances
-            ) + _predicate_fitness(node.predicate_id, trace.false_distances)
             distance = min(distance, candidate)
-        except nx.NetworkXNoPath:
-            # No path from node to target.
-            pass
 
     return distance
 
 
-def _get_node_with_predicate_id(
-    cdg: ControlDependenceGraph, predicate_id: int
-) -> ProgramGraphNode:
-    cdg_nodes = [node for node in cdg.nodes if node.predicate_id == predicate_id]
-    assert len(cdg_nodes) == 1
-    return cdg_nodes.pop()
-
-
-def _predicate_fitness(predicate: int, branch_distances: Dict[int, float]) -> float:
+def _predicate_fitness(predicate: int, branch_distances: Mapping[int, float]) -> float:
     return branch_distances.get(predicate, inf)
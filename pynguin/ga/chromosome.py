@@ -10,12 +10,16 @@ from __future__ import annotations
 import abc
 from abc import abstractmethod
 from statistics import mean
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
 
 import pynguin.ga.chromosomevisitor as cv
 import pynguin.ga.fitnessfunction as ff
 
+if TYPE_CHECKING:
+    import pynguin.ga.goalfitnessengine as gfe  # pylint: disable=cyclic-import
 
+
+# pylint: disable=too-many-instance-attributes, too-many-public-methods
 class Chromosome(metaclass=abc.ABCMeta):
     """An abstract base class for chromosomes"""
 
@@ -27,6 +31,8 @@ class Chromosome(metaclass=abc.ABCMeta):
         if orig is None:
             self._fitness_functions: List[ff.FitnessFunction] = []
             self._fitness_values: Dict[ff.FitnessFunction, ff.FitnessValues] = {}
+            self._fitness_engine: Optional[gfe.GoalFitnessEngine] = None
+            self._fitness_vector: Optional[List[float]] = None
             self._number_of_evaluations: int = 0
             self._changed: bool = True
             self._distance: float = -1
@@ -34,6 +40,9 @@ class Chromosome(metaclass=abc.ABCMeta):
         else:
             self._fitness_functions = list(orig._fitness_functions)
             self._fitness_values = dict(orig._fitness_values)
+            self._fitness_engine = orig._fitness_engine
+            # The vector is replaced instead of modified, thus, it can be shared.
+            self._fitness_vector = orig._fitness_vector
             self._number_of_evaluations = orig._number_of_evaluations
             self._changed = orig._changed
             self._distance = orig._distance
@@ -81,6 +90,73 @@ class Chromosome(metaclass=abc.ABCMeta):
         """
         return self._fitness_functions
 
+    @property
+    def fitness_engine(self) -> Optional[gfe.GoalFitnessEngine]:
+        """Provides the engine that computes the fitness vector of this chromosome.
+
+        Returns:
+            The fitness engine, if any
+        """
+        return self._fitness_engine
+
+    def set_fitness_engine(self, engine: gfe.GoalFitnessEngine) -> None:
+        """Sets the engine that computes the fitness values of the goals it manages.
+
+        The fitness values of these goals are not computed by their fitness
+        functions, but read from the fitness vector that the engine computes for
+        this chromosome in a single pass.
+
+        Args:
+            engine: The fitness engine
+        """
+        self._fitness_engine = engine
+        self._fitness_vector = None
+        for goal in engine.goals:
+            self._fitness_values.pop(goal, None)
+
+    def get_fitness_vector(self) -> Sequence[float]:
+        """Provides the fitness values of all goals of the fitness engine.
+
+        Returns:
+            The fitness vector, indexed like the goals of the engine
+        """
+        self._check_for_new_evaluation()
+        if self._fitness_vector is None:
+            assert self._fitness_engine is not None, "No fitness engine is set"
+            self._fitness_vector = self._fitness_engine.compute_fitness_vector(self)
+        return self._fitness_vector
+
+    def _get_fitness_vector_indices(self) -> List[int]:
+        """Provides the indices of the fitness functions in the fitness vector.
+
+        Returns:
+            The indices of the fitness functions that are managed by the fitness
+            engine
+        """
+        engine = self._fitness_engine
+        if engine is None:
+            return []
+        indices = [
+            engine.index_of(fitness_function)
+            for fitness_function in self._fitness_functions
+        ]
+        return [index for index in indices if index is not None]
+
+    def _get_individual_fitness_functions(self) -> List[ff.FitnessFunction]:
+        """Provides the fitness functions that are not managed by the fitness engine.
+
+        Returns:
+            The fitness functions that have to be evaluated individually
+        """
+        engine = self._fitness_engine
+        if engine is None:
+            return self._fitness_functions
+        return [
+            fitness_function
+            for fitness_function in self._fitness_functions
+            if engine.index_of(fitness_function) is None
+        ]
+
     def _check_for_new_evaluation(self) -> None:
         """Check if the fitness values need to be evaluated."""
         assert (
@@ -88,12 +164,45 @@ class Chromosome(metaclass=abc.ABCMeta):
         ), "Cannot evaluate fitness, if no fitness functions are defined."
 
         if self._changed:
-            for fitness_func in self._fitness_functions:
+            for fitness_func in self._get_individual_fitness_functions():
                 new_values = fitness_func.compute_fitness_values(self)
                 self._update_fitness_values(fitness_func, new_values)
+            if self._fitness_engine is not None:
+                self._fitness_vector = self._fitness_engine.compute_fitness_vector(self)
             self._changed = False
             self._number_of_evaluations += 1
 
+    @staticmethod
+    def evaluate_all(chromosomes: Sequence[Chromosome]) -> None:
+        """Evaluates all changed chromosomes.
+
+        Every fitness function computes the fitness values of all changed
+        chromosomes that use it at once, which allows it to share work between them.
+
+        Args:
+            chromosomes: The chromosomes to evaluate
+        """
+        changed = [chromosome for chromosome in chromosomes if chromosome._changed]
+        individuals: Dict[ff.FitnessFunction, List[Chromosome]] = {}
+        for chromosome in changed:
+            assert (
+                len(chromosome._fitness_functions) > 0
+            ), "Cannot evaluate fitness, if no fitness functions are defined."
+            for fitness_function in chromosome._get_individual_fitness_functions():
+                individuals.setdefault(fitness_function, []).append(chromosome)
+        for fitness_function, evaluated in individuals.items():
+            for chromosome, new_values in zip(
+                evaluated, fitness_function.compute_fitness_values_batch(evaluated)
+            ):
+                chromosome._update_fitness_values(fitness_function, new_values)
+        for chromosome in changed:
+            if chromosome._fitness_engine is not None:
+                chromosome._fitness_vector = (
+                    chromosome._fitness_engine.compute_fitness_vector(chromosome)
+                )
+            chromosome._changed = False
+            chromosome._number_of_evaluations += 1
+
     def _update_fitness_values(
         self, fitness_function: ff.FitnessFunction, new_value: ff.FitnessValues
     ) -> None:
@@ -119,6 +228,9 @@ class Chromosome(metaclass=abc.ABCMeta):
     def fitness_values(self) -> Dict[ff.FitnessFunction, ff.FitnessValues]:
         """Provides the registered fitness values.
 
+        The values of goals that are managed by the fitness engine are not
+        contained, they are part of the fitness vector instead.
+
         Returns:
             A dictionary from fitness function to fitness value
         """
@@ -145,7 +257,13 @@ class Chromosome(metaclass=abc.ABCMeta):
             The sum of the current fitness values
         """
         self._check_for_new_evaluation()
-        return sum([value.fitness for value in self._fitness_values.values()])
+        return sum(
+            [value.fitness for value in self._fitness_values.values()]
+            + [
+                self.get_fitness_vector()[index]
+                for index in self._get_fitness_vector_indices()
+            ]
+        )
 
     def get_fitness_for(self, fitness_function: ff.FitnessFunction) -> float:
         """Returns the fitness values of a specific fitness function.
@@ -157,6 +275,13 @@ class Chromosome(metaclass=abc.ABCMeta):
             Its fitness value
         """
         self._check_for_new_evaluation()
+        return self._get_fitness_for(fitness_function)
+
+    def _get_fitness_for(self, fitness_function: ff.FitnessFunction) -> float:
+        if self._fitness_engine is not None:
+            index = self._fitness_engine.index_of(fitness_function)
+            if index is not None:
+                return self.get_fitness_vector()[index]
         return self._fitness_values[fitness_function].fitness
 
     def get_coverage(self) -> float:
@@ -166,7 +291,13 @@ class Chromosome(metaclass=abc.ABCMeta):
             The mean coverage value
         """
         self._check_for_new_evaluation()
-        return mean([value.coverage for value in self._fitness_values.values()])
+        return mean(
+            [value.coverage for value in self._fitness_values.values()]
+            + [
+                1.0 if self.get_fitness_vector()[index] == 0.0 else 0.0
+                for index in self._get_fitness_vector_indices()
+            ]
+        )
 
     def get_coverage_for(self, fitness_function: ff.FitnessFunction) -> float:
         """Provides the coverage value for a certain fitness function
@@ -179,6 +310,13 @@ class Chromosome(metaclass=abc.ABCMeta):
             The coverage value for the fitness function
         """
         self._check_for_new_evaluation()
+        return self._get_coverage_for(fitness_function)
+
+    def _get_coverage_for(self, fitness_function: ff.FitnessFunction) -> float:
+        if self._fitness_engine is not None:
+            index = self._fitness_engine.index_of(fitness_function)
+            if index is not None:
+                return 1.0 if self.get_fitness_vector()[index] == 0.0 else 0.0
         return self._fitness_values[fitness_function].coverage
 
     def get_number_of_evaluations(self):
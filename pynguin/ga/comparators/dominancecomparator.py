@@ -5,11 +5,11 @@
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
 """Provides a comparator for dominance comparisons."""
-from typing import Generic, Optional, Set, TypeVar
+from typing import Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
 
 import pynguin.ga.chromosome as chrom
 import pynguin.ga.fitnessfunction as ff
-from pynguin.ga.fitnessfunctions.fitness_utilities import compare
+import pynguin.ga.goalfitnessengine as gfe
 
 C = TypeVar("C", bound=chrom.Chromosome)  # pylint: disable=invalid-name
 
@@ -30,6 +30,8 @@ class DominanceComparator(Generic[C]):
             self._objectives = {goal}
         else:
             self._objectives = None
+        self._objective_list: Optional[List[ff.FitnessFunction]] = None
+        self._selectors: Dict[gfe.GoalFitnessEngine, Optional[gfe.Selector]] = {}
 
     # pylint: disable=too-many-return-statements
     def compare(self, chromosome_1: Optional[C], chromosome_2: Optional[C]) -> int:
@@ -54,16 +56,13 @@ class DominanceComparator(Generic[C]):
         if self._objectives is None:
             self._objectives = set(chromosome_1.get_fitness_functions())
 
-        for objective in self._objectives:
-            flag = compare(
-                chromosome_1.get_fitness_for(objective),
-                chromosome_2.get_fitness_for(objective),
-            )
-            if flag < 0:
+        values_1, values_2 = self._get_fitness_values(chromosome_1, chromosome_2)
+        for value_1, value_2 in zip(values_1, values_2):
+            if value_1 < value_2:
                 dominate_1 = True
                 if dominate_2:
                     return 0
-            elif flag > 0:
+            elif value_1 > value_2:
                 dominate_2 = True
                 if dominate_1:
                     return 0
@@ -73,3 +72,39 @@ class DominanceComparator(Generic[C]):
         if dominate_1:
             return -1  # chromosome_1 dominates
         return 1  # chromosome_2 dominates
+
+    def _get_fitness_values(
+        self, chromosome_1: C, chromosome_2: C
+    ) -> Tuple[Sequence[float], Sequence[float]]:
+        """Provides the fitness values of both chromosomes for the objectives.
+
+        The values are read from the fitness vectors of the chromosomes, if they
+        share a fitness engine that manages all objectives.
+
+        Args:
+            chromosome_1: The first chromosome
+            chromosome_2: The second chromosome
+
+        Returns:
+            The fitness values of both chromosomes in the order of the objectives
+        """
+        if self._objective_list is None:
+            assert self._objectives is not None
+            self._objective_list = list(self._objectives)
+        engine = chromosome_1.fitness_engine
+        if (
+            isinstance(engine, gfe.GoalFitnessEngine)
+            and engine is chromosome_2.fitness_engine
+        ):
+            if engine not in self._selectors:
+                self._selectors[engine] = engine.create_selector(self._objective_list)
+            selector = self._selectors[engine]
+            if selector is not None:
+                return (
+                    selector(chromosome_1.get_fitness_vector()),
+                    selector(chromosome_2.get_fitness_vector()),
+                )
+        return (
+            [chromosome_1.get_fitness_for(goal) for goal in self._objective_list],
+            [chromosome_2.get_fitness_for(goal) for goal in self._objective_list],
+        )
@@ -11,7 +11,10 @@ import dataclasses
 import logging
 import math
 from abc import ABCMeta, abstractmethod
-from typing import List
+from typing import TYPE_CHECKING, List, Sequence
+
+if TYPE_CHECKING:
+    import pynguin.ga.chromosome as chrom  # pylint: disable=cyclic-import
 
 
 @dataclasses.dataclass
@@ -66,6 +69,22 @@ class FitnessFunction(metaclass=ABCMeta):
             the new fitness values  # noqa: DAR202
         """
 
+    def compute_fitness_values_batch(
+        self, individuals: Sequence[chrom.Chromosome]
+    ) -> List[FitnessValues]:
+        """Calculate the new fitness values of multiple individuals.
+
+        Fitness functions that can share work between individuals, e.g., the
+        execution of their test cases, should override this method.
+
+        Args:
+            individuals: The individual chromosomes
+
+        Returns:
+            the new fitness values of each individual
+        """
+        return [self.compute_fitness_values(individual) for individual in individuals]
+
     @abstractmethod
     def is_maximisation_function(self) -> bool:
         """Do we need to maximise or minimise this function?
@@ -25,7 +25,7 @@ class AbstractTestCaseFitnessFunction(ff.FitnessFunction, metaclass=ABCMeta):
         Returns:
             A list of execution results
         """
-        if individual.has_changed() or individual.get_last_execution_result() is None:
+        if individual.is_execution_result_outdated():
             individual.set_last_execution_result(
                 self._executor.execute(individual.test_case)
             )
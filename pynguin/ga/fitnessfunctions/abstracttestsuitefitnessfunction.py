@@ -6,9 +6,10 @@
 #
 """Provides an abstract fitness function for test suites."""
 from abc import ABCMeta
-from typing import List
+from typing import List, Sequence
 
 import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.testsuitechromosome as tsc
 from pynguin.testcase.execution.executionresult import ExecutionResult
 
 
@@ -26,17 +27,43 @@ class AbstractTestSuiteFitnessFunction(ff.FitnessFunction, metaclass=ABCMeta):
         Returns:
             A list of execution results
         """
-        results: List[ExecutionResult] = []
-        for test_case_chromosome in individual.test_case_chromosomes:
-            if (
-                test_case_chromosome.has_changed()
-                or test_case_chromosome.get_last_execution_result() is None
-            ):
-                test_case_chromosome.set_last_execution_result(
-                    self._executor.execute(test_case_chromosome.test_case)
-                )
+        return self._run_test_suite_chromosomes([individual])[0]
+
+    def _run_test_suite_chromosomes(
+        self, individuals: Sequence[tsc.TestSuiteChromosome]
+    ) -> List[List[ExecutionResult]]:
+        """Runs multiple test suites and updates the execution results for all test
+        cases that were changed.
+
+        The changed test cases of all suites are executed as one batch.
+
+        Args:
+            individuals: The individuals to run
+
+        Returns:
+            A list of execution results for each individual
+        """
+        outdated = [
+            test_case_chromosome
+            for individual in individuals
+            for test_case_chromosome in individual.test_case_chromosomes
+            if test_case_chromosome.is_execution_result_outdated()
+        ]
+        for test_case_chromosome, result in zip(
+            outdated,
+            self._executor.execute_many(
+                [test_case_chromosome.test_case for test_case_chromosome in outdated]
+            ),
+        ):
+            test_case_chromosome.set_last_execution_result(result)
+
+        all_results: List[List[ExecutionResult]] = []
+        for individual in individuals:
+            results: List[ExecutionResult] = []
+            for test_case_chromosome in individual.test_case_chromosomes:
                 test_case_chromosome.set_changed(False)
-            result = test_case_chromosome.get_last_execution_result()
-            assert result is not None
-            results.append(result)
-        return results
+                result = test_case_chromosome.get_last_execution_result()
+                assert result is not None
+                results.append(result)
+            all_results.append(results)
+        return all_results
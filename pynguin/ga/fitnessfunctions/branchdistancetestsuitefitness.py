@@ -5,13 +5,16 @@
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
 """Provide a fitness function based on branch distances."""
+from typing import List, Sequence, cast
+
+import pynguin.ga.chromosome as chrom
 import pynguin.ga.fitnessfunction as ff
 import pynguin.ga.fitnessfunctions.abstracttestsuitefitnessfunction as atsff
 import pynguin.ga.testsuitechromosome as tsc
 from pynguin.ga.fitnessfunctions.fitness_utilities import (
     analyze_results,
-    compute_branch_coverage,
-    compute_branch_distance_fitness,
+    compute_branch_coverage_batch,
+    compute_branch_distance_fitness_batch,
 )
 from pynguin.testcase.execution.executiontracer import ExecutionTracer
 
@@ -23,14 +26,27 @@ class BranchDistanceTestSuiteFitnessFunction(atsff.AbstractTestSuiteFitnessFunct
         self,
         individual: tsc.TestSuiteChromosome,
     ) -> ff.FitnessValues:
-        results = self._run_test_suite_chromosome(individual)
-        merged_trace = analyze_results(results)
-        tracer: ExecutionTracer = self._executor.tracer
+        return self.compute_fitness_values_batch([individual])[0]
 
-        return ff.FitnessValues(
-            compute_branch_distance_fitness(merged_trace, tracer.get_known_data()),
-            compute_branch_coverage(merged_trace, tracer.get_known_data()),
-        )
+    def compute_fitness_values_batch(
+        self, individuals: Sequence[chrom.Chromosome]
+    ) -> List[ff.FitnessValues]:
+        merged_traces = [
+            analyze_results(results)
+            for results in self._run_test_suite_chromosomes(
+                cast(Sequence[tsc.TestSuiteChromosome], individuals)
+            )
+        ]
+        tracer: ExecutionTracer = self._executor.tracer
+        return [
+            ff.FitnessValues(fitness, coverage)
+            for fitness, coverage in zip(
+                compute_branch_distance_fitness_batch(
+                    merged_traces, tracer.get_known_data()
+                ),
+                compute_branch_coverage_batch(merged_traces, tracer.get_known_data()),
+            )
+        ]
 
     def is_maximisation_function(self) -> bool:
         return False
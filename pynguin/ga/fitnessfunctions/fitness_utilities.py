@@ -7,7 +7,7 @@
 """Provides utility functions for fitness calculations."""
 
 import math
-from typing import Dict, List
+from typing import List, Sequence
 
 from pynguin.testcase.execution.executionresult import ExecutionResult
 from pynguin.testcase.execution.executiontrace import ExecutionTrace
@@ -62,35 +62,54 @@ def compute_branch_distance_fitness(
     Returns:
         The computed fitness value
     """
-    # Check if all code objects were executed.
-    code_objects_missing: float = len(
-        known_data.branch_less_code_objects.difference(trace.executed_code_objects)
-    )
-    assert (
-        code_objects_missing >= 0.0
-    ), "Amount of non covered code objects cannot be negative"
-
-    # Check if all predicates are covered
-    predicate_fitness: float = 0.0
-    for predicate in known_data.existing_predicates:
-        predicate_fitness += _predicate_fitness(predicate, trace.true_distances, trace)
-        predicate_fitness += _predicate_fitness(predicate, trace.false_distances, trace)
-    assert predicate_fitness >= 0.0, "Predicate fitness cannot be negative."
-    total_fitness = code_objects_missing + predicate_fitness
-    return total_fitness
-
-
-def _predicate_fitness(
-    predicate: int, branch_distances: Dict[int, float], trace: ExecutionTrace
-) -> float:
-    if predicate in branch_distances and branch_distances[predicate] == 0.0:
-        return 0.0
-    if (
-        predicate in trace.executed_predicates
-        and trace.executed_predicates[predicate] >= 2
-    ):
-        return normalise(branch_distances[predicate])
-    return 1.0
+    return compute_branch_distance_fitness_batch([trace], known_data)[0]
+
+
+def compute_branch_distance_fitness_batch(
+    traces: Sequence[ExecutionTrace], known_data: KnownData
+) -> List[float]:
+    """Computes fitness based on covered branches and branch distances for
+    multiple traces, e.g., the merged traces of a population of test suites.
+
+    A branch has a fitness of 1.0, unless it was covered or its predicate was
+    executed at least twice.  Thus, only the predicates that have a distance in
+    a trace are visited, instead of all existing predicates.
+
+    Args:
+        traces: The execution traces
+        known_data: All known data
+
+    Returns:
+        The computed fitness value for each trace
+    """
+    existing_predicates = known_data.existing_predicates
+    number_of_branches = 2 * len(existing_predicates)
+    fitness_values: List[float] = []
+    for trace in traces:
+        # Check if all code objects were executed.
+        code_objects_missing: float = len(
+            known_data.branch_less_code_objects.difference(trace.executed_code_objects)
+        )
+
+        # Check if all predicates are covered
+        uncovered_branches = number_of_branches
+        predicate_fitness: float = 0.0
+        executed_predicates = trace.executed_predicates
+        for branch_distances in (trace.true_distances, trace.false_distances):
+            distances = branch_distances.values_array
+            for predicate in branch_distances:
+                if predicate not in existing_predicates:
+                    continue
+                distance = distances[predicate]
+                if distance == 0.0:
+                    uncovered_branches -= 1
+                elif executed_predicates.get(predicate, 0) >= 2:
+                    uncovered_branches -= 1
+                    predicate_fitness += normalise(distance)
+        predicate_fitness += uncovered_branches
+        assert predicate_fitness >= 0.0, "Predicate fitness cannot be negative."
+        fitness_values.append(code_objects_missing + predicate_fitness)
+    return fitness_values
 
 
 def compute_branch_coverage(trace: ExecutionTrace, known_data: KnownData) -> float:
@@ -104,27 +123,46 @@ def compute_branch_coverage(trace: ExecutionTrace, known_data: KnownData) -> flo
     Returns:
         The computed coverage value
     """
+    return compute_branch_coverage_batch([trace], known_data)[0]
 
-    covered = len(
-        trace.executed_code_objects.intersection(known_data.branch_less_code_objects)
-    )
-    existing = len(known_data.branch_less_code_objects)
 
+def compute_branch_coverage_batch(
+    traces: Sequence[ExecutionTrace], known_data: KnownData
+) -> List[float]:
+    """Computes branch coverage on bytecode instructions for multiple traces,
+    e.g., the merged traces of a population of test suites.
+
+    Args:
+        traces: The execution traces
+        known_data: All known data
+
+    Returns:
+        The computed coverage value for each trace
+    """
+    existing = len(known_data.branch_less_code_objects)
     # Every predicate creates two branches
     existing += len(known_data.existing_predicates) * 2
 
-    # A branch is covered if it has a distance of 0.0
-    # Must consider both branches created by a predicate, i.e. true and false.
-    covered += len([v for v in trace.true_distances.values() if v == 0.0])
-    covered += len([v for v in trace.false_distances.values() if v == 0.0])
-
-    if existing == 0:
-        # Nothing to cover => everything is covered.
-        coverage = 1.0
-    else:
-        coverage = covered / existing
-    assert 0.0 <= coverage <= 1.0, "Coverage must be in [0,1]"
-    return coverage
+    coverage_values: List[float] = []
+    for trace in traces:
+        covered = len(
+            trace.executed_code_objects.intersection(
+                known_data.branch_less_code_objects
+            )
+        )
+        # A branch is covered if it has a distance of 0.0
+        # Must consider both branches created by a predicate, i.e. true and false.
+        covered += trace.true_distances.values_array.count(0.0)
+        covered += trace.false_distances.values_array.count(0.0)
+
+        if existing == 0:
+            # Nothing to cover => everything is covered.
+            coverage = 1.0
+        else:
+            coverage = covered / existing
+        assert 0.0 <= coverage <= 1.0, "Coverage must be in [0,1]"
+        coverage_values.append(coverage)
+    return coverage_values
 
 
 def compare(fitness_1: float, fitness_2: float) -> int:
@@ -0,0 +1,18 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides a cache for the fitness vectors of execution traces."""
+from typing import Hashable, List
+
+from pynguin.utils.lrucache import LRUCache
+
+# A bounded cache that maps trace fingerprints to fitness vectors.
+#
+# Test cases that take the same paths through the module under test, e.g., the
+# offspring of a test case whose mutation did not change its behaviour, have the
+# same fitness values for all goals.  Thus, their fitness vector is computed once
+# and shared afterwards.  Cached vectors must not be modified.
+FitnessVectorCache = LRUCache[Hashable, List[float]]
@@ -0,0 +1,178 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides an abstract base class for engines that compute the fitness values of
+many goals at once."""
+from __future__ import annotations
+
+from abc import ABCMeta, abstractmethod
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import pynguin.ga.fitnessfunction as ff
+
+if TYPE_CHECKING:
+    import pynguin.ga.chromosome as chrom  # pylint: disable=cyclic-import
+
+# Selects the fitness values of some goals from a fitness vector.
+Selector = Callable[[Sequence[float]], Tuple[float, ...]]
+
+
+class GoalFitnessEngine(metaclass=ABCMeta):
+    """Computes the fitness values of a chromosome for many goals in a single pass.
+
+    Many-objective algorithms, e.g., MOSA, use one fitness function per coverage
+    goal.  Instead of evaluating each of them separately, a chromosome that uses an
+    engine evaluates all goals of the engine at once and stores the results as a
+    dense fitness vector, in which the fitness value of a goal is located at the
+    index of the goal.  A goal is considered covered iff its fitness value is zero.
+    """
+
+    def __init__(self, goals: Sequence[ff.FitnessFunction]) -> None:
+        """Creates a new engine for the given goals.
+
+        Args:
+            goals: The fitness functions of the goals, in the order of the vector
+        """
+        self._goals = tuple(goals)
+        self._indices: Dict[ff.FitnessFunction, int] = {
+            goal: index for index, goal in enumerate(self._goals)
+        }
+
+    @property
+    def goals(self) -> Tuple[ff.FitnessFunction, ...]:
+        """Provides the goals of this engine in the order of the fitness vector.
+
+        Returns:
+            The goals of this engine
+        """
+        return self._goals
+
+    def index_of(self, goal: ff.FitnessFunction) -> Optional[int]:
+        """Provides the index of a goal in the fitness vector.
+
+        Args:
+            goal: The fitness function of the goal
+
+        Returns:
+            The index of the goal, if the goal is managed by this engine
+        """
+        return self._indices.get(goal)
+
+    def create_selector(
+        self, goals: Iterable[ff.FitnessFunction]
+    ) -> Optional[Selector]:
+        """Creates a function that selects the fitness values of the given goals
+        from a fitness vector.
+
+        Args:
+            goals: The fitness functions of the goals
+
+        Returns:
+            A function that provides the fitness values of the goals in the given
+            order, if all goals are managed by this engine
+        """
+        indices: List[int] = []
+        for goal in goals:
+            index = self._indices.get(goal)
+            if index is None:
+                return None
+            indices.append(index)
+        if len(indices) == 0:
+            return lambda vector: ()
+        if len(indices) == 1:
+            only = indices[0]
+            return lambda vector: (vector[only],)
+        return itemgetter(*indices)
+
+    @abstractmethod
+    def compute_fitness_vector(self, individual) -> List[float]:
+        """Computes the fitness values of an individual for all goals.
+
+        Args:
+            individual: An individual chromosome
+
+        Returns:
+            The fitness values, indexed like the goals  # noqa: DAR202
+        """
+
+
+def get_shared_engine(
+    solutions: Iterable[chrom.Chromosome],
+) -> Optional[GoalFitnessEngine]:
+    """Provides the engine that is shared by all solutions.
+
+    Args:
+        solutions: The solutions
+
+    Returns:
+        The engine of the solutions, if all solutions use the same engine
+    """
+    engine: Optional[GoalFitnessEngine] = None
+    for solution in solutions:
+        solution_engine = solution.fitness_engine
+        if not isinstance(solution_engine, GoalFitnessEngine) or (
+            engine is not None and solution_engine is not engine
+        ):
+            return None
+        engine = solution_engine
+    return engine
+
+
+def get_covered_indices(vector: Sequence[float]) -> Iterator[int]:
+    """Provides the indices of the covered goals in a fitness vector.
+
+    The vector is scanned by list.index(), which is considerably faster than
+    comparing its values one by one, as most goals are usually not covered.
+
+    Args:
+        vector: A fitness vector
+
+    Yields:
+        The indices of the goals whose fitness value is zero, in ascending order
+    """
+    index = -1
+    while True:
+        try:
+            index = vector.index(0.0, index + 1)
+        except ValueError:
+            return
+        yield index
+
+
+def get_fitness_rows(
+    solutions: Sequence[chrom.Chromosome], goals: Sequence[ff.FitnessFunction]
+) -> List[Sequence[float]]:
+    """Provides the fitness values of the solutions for the given goals.
+
+    If all solutions share an engine that manages all goals, the values are read
+    from their fitness vectors.  Otherwise, they are requested for every goal.
+
+    Args:
+        solutions: The solutions
+        goals: The fitness functions of the goals
+
+    Returns:
+        A row for every solution that contains its fitness values in the order of
+        the goals
+    """
+    engine = get_shared_engine(solutions)
+    selector = None if engine is None else engine.create_selector(goals)
+    if selector is None:
+        return [
+            [solution.get_fitness_for(goal) for goal in goals] for solution in solutions
+        ]
+    return [selector(solution.get_fitness_vector()) for solution in solutions]
@@ -5,11 +5,11 @@
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
 """Provides various crowding-distance assignment implementations."""
-import sys
 from typing import List, Set, TypeVar
 
 import pynguin.ga.chromosome as chrom
 import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.goalfitnessengine as gfe
 
 C = TypeVar("C", bound=chrom.Chromosome)  # pylint: disable=invalid-name
 
@@ -28,29 +28,25 @@ def fast_epsilon_dominance_assignment(
         front: Front of non-dominated solutions/tests
         goals: Set of goals/targets (e.g., branches) to consider
     """
-    for test in front:
-        test.distance = 0
-
-    for goal in goals:
-        minimum = sys.float_info.max
-        min_set: List[C] = []
-        maximum = 0.0
-        for test in front:
-            value = test.get_fitness_for(goal)
-            if value < minimum:
-                minimum = value
-                min_set.clear()
-                min_set.append(test)
-            elif value == minimum:
-                min_set.append(test)
-
-            if value > maximum:
-                maximum = value
-
-        if maximum == minimum:
+    size = len(front)
+    distances: List[float] = [0] * size
+    # Columns of the front x goals fitness matrix, i.e., the fitness values of all
+    # tests for one goal.  Goals with equal columns, e.g., both branches of a
+    # predicate that was not reached, contribute the same distances.
+    columns = set(zip(*gfe.get_fitness_rows(front, list(goals))))
+    for values in columns:
+        minimum = min(values)
+        count = values.count(minimum)
+        if count == size:
+            # All values are equal.
             continue
 
-        for test in min_set:
-            numerator = len(front) - len(min_set)
-            denominator = len(front)
-            test.distance = max(test.distance, numerator / denominator)
+        distance = (size - count) / size
+        index = -1
+        for _ in range(count):
+            index = values.index(minimum, index + 1)
+            if distance > distances[index]:
+                distances[index] = distance
+
+    for test, distance in zip(front, distances):
+        test.distance = distance
@@ -0,0 +1,103 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides a fast non-dominated sorting of solutions."""
+from typing import Iterable, Iterator, List, Sequence, TypeVar
+
+import pynguin.ga.chromosome as chrom
+import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.goalfitnessengine as gfe
+
+C = TypeVar("C", bound=chrom.Chromosome)  # pylint: disable=invalid-name
+
+
+def _get_dominated_sets(rows: Sequence[Sequence[float]]) -> List[int]:
+    """Computes which solutions are dominated by each solution.
+
+    Sets of solutions are represented as bit sets, i.e., integers whose i-th bit
+    is set iff the set contains the i-th solution.  For every goal, the solutions
+    are sorted by their fitness value, such that the set of solutions that are at
+    least as bad as a solution regarding the goal is a prefix of the sorted
+    solutions.  A solution dominates the solutions that are at least as bad
+    regarding all goals, except for the solutions that are equally good regarding
+    all goals.
+
+    Args:
+        rows: The fitness values of every solution for every goal
+
+    Returns:
+        The set of solutions dominated by each solution
+    """
+    number = len(rows)
+    everything = (1 << number) - 1
+    at_least_as_bad = [everything] * number
+    equally_good = [everything] * number
+    for values in zip(*rows):
+        order = sorted(range(number), key=values.__getitem__, reverse=True)
+        worse_or_equal = 0
+        start = 0
+        while start < number:
+            value = values[order[start]]
+            end = start
+            equal = 0
+            while end < number and values[order[end]] == value:
+                equal |= 1 << order[end]
+                end += 1
+            worse_or_equal |= equal
+            for index in order[start:end]:
+                at_least_as_bad[index] &= worse_or_equal
+                equally_good[index] &= equal
+            start = end
+    return [bad & ~equal for bad, equal in zip(at_least_as_bad, equally_good)]
+
+
+def _get_members(bit_set: int) -> Iterator[int]:
+    """Iterates the members of a bit set in ascending order.
+
+    Args:
+        bit_set: The bit set
+
+    Yields:
+        The indices of the set bits
+    """
+    while bit_set:
+        lowest = bit_set & -bit_set
+        yield lowest.bit_length() - 1
+        bit_set ^= lowest
+
+
+def fast_non_dominated_sort(
+    solutions: Sequence[C], goals: Iterable[ff.FitnessFunction]
+) -> Iterator[List[C]]:
+    """Sorts the solutions into fronts of non-dominated solutions.
+
+    The first front contains the solutions that are not dominated by any other
+    solution regarding the given goals, the next front contains the solutions that
+    are only dominated by solutions of the first front, and so on.
+
+    Instead of comparing pairs of solutions goal by goal, the dominance relation is
+    computed from the solutions sorted by their fitness values for every goal.
+    The relation is stored as bit sets, thus, the fronts are peeled off by a few
+    operations on integers per solution.  The fronts are computed lazily, such
+    that callers that only need the first fronts do not compute the remaining ones.
+
+    Args:
+        solutions: The solutions to sort
+        goals: The goals that are considered for the dominance
+
+    Yields:
+        The fronts in ascending order of their rank, where each front contains its
+        solutions in the order of the given solutions
+    """
+    dominated = _get_dominated_sets(gfe.get_fitness_rows(solutions, list(goals)))
+    remaining = (1 << len(solutions)) - 1
+    while remaining:
+        dominated_by_remaining = 0
+        for index in _get_members(remaining):
+            dominated_by_remaining |= dominated[index]
+        front = remaining & ~dominated_by_remaining
+        remaining &= ~front
+        yield [solutions[index] for index in _get_members(front)]
@@ -13,10 +13,8 @@ from typing import Generic, List, Optional, Set, TypeVar
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
 import pynguin.ga.fitnessfunction as ff
-from pynguin.ga.comparators.dominancecomparator import DominanceComparator
-from pynguin.ga.comparators.preferencesortingcomparator import (
-    PreferenceSortingComparator,
-)
+import pynguin.ga.goalfitnessengine as gfe
+from pynguin.ga.operators.ranking.nondominatedsorting import fast_non_dominated_sort
 from pynguin.utils import randomness
 
 C = TypeVar("C", bound=chrom.Chromosome)  # pylint: disable=invalid-name
@@ -101,38 +99,25 @@ class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
         fronts.append(zero_front)
         front_index = 1
 
+        # Solutions are compared by identity, because equal test cases might be
+        # encoded by different chromosomes.
+        zero_front_ids = {id(element) for element in zero_front}
+        remaining: List[C] = [
+            element for element in solutions if id(element) not in zero_front_ids
+        ]
+
         if len(zero_front) < config.configuration.search_algorithm.population:
             ranked_solutions = len(zero_front)
-            comparator: DominanceComparator[C] = DominanceComparator(
-                goals=uncovered_goals
-            )
-
-            remaining: List[C] = []
-            remaining.extend(solutions)
-            for element in zero_front:
-                if element in remaining:
-                    remaining.remove(element)
-
-            while (
-                ranked_solutions < config.configuration.search_algorithm.population
-                and len(remaining) > 0
-            ):
-                new_front: List[C] = self._get_non_dominated_solutions(
-                    remaining, comparator, front_index
-                )
-                fronts.append(new_front)
+            for new_front in fast_non_dominated_sort(remaining, uncovered_goals):
+                if ranked_solutions >= config.configuration.search_algorithm.population:
+                    break
                 for element in new_front:
-                    if element in remaining:
-                        remaining.remove(element)
+                    element.rank = front_index
+                fronts.append(new_front)
                 ranked_solutions += len(new_front)
                 front_index += 1
 
         else:
-            remaining = []
-            remaining.extend(solutions)
-            for element in zero_front:
-                if element in remaining:
-                    remaining.remove(element)
             for element in remaining:
                 element.rank = front_index
             fronts.append(remaining)
@@ -143,43 +128,22 @@ class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
     def _get_zero_front(
         solutions: List[C], uncovered_goals: Set[ff.FitnessFunction]
     ) -> List[C]:
+        goals = list(uncovered_goals)
+        rows = gfe.get_fitness_rows(solutions, goals)
+        lengths = [solution.length() for solution in solutions]
         zero_front: Set[C] = set()
-        for goal in uncovered_goals:
-            comparator: PreferenceSortingComparator[C] = PreferenceSortingComparator(
-                goal
-            )
-            best: Optional[C] = None
-            for solution in solutions:
-                flag = comparator.compare(solution, best)
-                if flag < 0 or (flag == 0 and randomness.next_bool()):
-                    best = solution
-            assert best is not None
-
-            best.rank = 0
-            zero_front.add(best)
+        # Like the PreferenceSortingComparator, prefer the solution with the lower
+        # fitness value, and the shorter one in case of equal fitness values.
+        for values in zip(*rows):
+            best = 0
+            for index in range(1, len(solutions)):
+                candidate = (values[index], lengths[index])
+                current = (values[best], lengths[best])
+                if candidate < current or (
+                    candidate == current and randomness.next_bool()
+                ):
+                    best = index
+
+            solutions[best].rank = 0
+            zero_front.add(solutions[best])
         return list(zero_front)
-
-    @staticmethod
-    def _get_non_dominated_solutions(
-        solutions: List[C], comparator: DominanceComparator[C], front_index: int
-    ) -> List[C]:
-        front: List[C] = []
-        for solution in solutions:
-            is_dominated = False
-            dominated_solutions: List[C] = []
-            for best in front:
-                flag = comparator.compare(solution, best)
-                if flag < 0:
-                    dominated_solutions.append(best)
-                if flag > 0:
-                    is_dominated = True
-                    break
-            if is_dominated:
-                continue
-
-            solution.rank = front_index
-            front.append(solution)
-            for dominated_solution in dominated_solutions:
-                if dominated_solution in front:
-                    front.remove(dominated_solution)
-        return front
@@ -12,14 +12,31 @@ from typing import Optional
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
 import pynguin.ga.chromosomevisitor as cv
+import pynguin.testcase.defaulttestcase as dtc
 import pynguin.testcase.testcase as tc
 import pynguin.testcase.testfactory as tf
 from pynguin.testcase.execution.executionresult import ExecutionResult
 from pynguin.utils import randomness
 
 
+class _Sharing:  # pylint: disable=too-few-public-methods
+    """Counts the chromosomes that share a test case."""
+
+    __slots__ = ["count"]
+
+    def __init__(self) -> None:
+        self.count = 1
+
+
 class TestCaseChromosome(chrom.Chromosome):
-    """A chromosome that encodes a single test case."""
+    """A chromosome that encodes a single test case.
+
+    Cloning a chromosome does not clone its test case.  Instead, the clone shares
+    the test case with the original, until one of them is about to change it, which
+    then takes a copy of the test case first.  Many clones, e.g., the elites of a
+    population or the backups of mutations, are never changed, thus, their test
+    cases are never copied.
+    """
 
     def __init__(
         self,
@@ -41,26 +58,63 @@ class TestCaseChromosome(chrom.Chromosome):
                 test_case is not None
             ), "Cannot create test case chromosome without test case"
             self._test_case: tc.TestCase = test_case
+            self._sharing: Optional[_Sharing] = None
             self._test_factory: Optional[tf.TestFactory] = test_factory
             self._changed = True
             self._last_execution_result: Optional[ExecutionResult] = None
+            self._execution_result_outdated = True
             self._num_mutations = 0
         else:
-            self._test_case = orig._test_case.clone()
+            if orig._sharing is None:
+                orig._sharing = _Sharing()
+            orig._sharing.count += 1
+            self._sharing = orig._sharing
+            self._test_case = orig._test_case
             self._test_factory = orig._test_factory
             self._changed = orig._changed
             self._last_execution_result = orig._last_execution_result
+            self._execution_result_outdated = orig._execution_result_outdated
             self._num_mutations = orig._num_mutations
 
     @property
     def test_case(self) -> tc.TestCase:
         """The test case that is wrapped by this chromosome.
 
+        The caller might change the test case, thus, a test case that is shared with
+        clones is copied first.
+
         Returns:
             the wrapped test case.
         """
+        self._unshare_test_case()
         return self._test_case
 
+    def _is_test_case_shared(self) -> bool:
+        return self._sharing is not None and self._sharing.count > 1
+
+    def _leave_sharing(self) -> bool:
+        """Stops sharing the test case with other chromosomes.
+
+        Returns:
+            Whether or not other chromosomes still share the test case
+        """
+        sharing = self._sharing
+        if sharing is None:
+            return False
+        self._sharing = None
+        sharing.count -= 1
+        return sharing.count > 0
+
+    def _unshare_test_case(self) -> None:
+        """Takes a copy of the test case, if it is shared with other chromosomes."""
+        if self._leave_sharing():
+            self._test_case = self._test_case.clone()
+
+    def set_changed(self, changed: bool) -> None:
+        super().set_changed(changed)
+        if changed:
+            self._execution_result_outdated = True
+
     def num_mutations(self) -> int:
         """The number of mutations.
 
@@ -81,26 +135,21 @@ class TestCaseChromosome(chrom.Chromosome):
         assert isinstance(
             other, TestCaseChromosome
         ), "Cannot perform crossover with " + str(type(other))
-        offspring = self.clone()
-        offspring.test_case.statements.clear()
+        offspring = dtc.DefaultTestCase()
 
         assert self._test_factory is not None, "Crossover requires a test factory."
 
         for i in range(position1):
-            offspring.test_case.add_statement(
-                self.test_case.get_statement(i).clone(offspring.test_case)
-            )
+            offspring.add_statement(self._test_case.get_statement(i).clone(offspring))
 
-        for j in range(position2, other.test_case.size()):
+        for j in range(position2, other._test_case.size()):
             self._test_factory.append_statement(
-                offspring.test_case, other.test_case.get_statement(j)
+                offspring, other._test_case.get_statement(j)
             )
 
-        if (
-            offspring.test_case.size()
-            < config.configuration.search_algorithm.chromosome_length
-        ):
-            self._test_case = offspring.test_case
+        if offspring.size() < config.configuration.search_algorithm.chromosome_length:
+            self._leave_sharing()
+            self._test_case = offspring
             self.set_changed(True)
 
     def mutate(self) -> None:
@@ -112,11 +161,15 @@ class TestCaseChromosome(chrom.Chromosome):
         ):
             last_mutatable_position = self.get_last_mutatable_statement()
             if last_mutatable_position is not None:
+                self._unshare_test_case()
                 self._test_case.chop(last_mutatable_position)
                 changed = True
 
-        # In case mutation removes all calls on the SUT.
-        backup = self.test_case.clone()
+        # In case mutation removes all calls on the SUT.  A shared test case is not
+        # changed by the mutation, thus, it serves as backup without a copy.
+        backup_is_shared = self._is_test_case_shared()
+        backup = self._test_case if backup_is_shared else self._test_case.clone()
+        self._unshare_test_case()
 
         if (
             randomness.next_float()
@@ -141,7 +194,7 @@ class TestCaseChromosome(chrom.Chromosome):
 
         assert self._test_factory, "Required for mutation"
         if not self._test_factory.has_call_on_sut(self._test_case):
-            self._test_case = backup
+            self._test_case = backup.clone() if backup_is_shared else backup
             self._mutation_insert()
 
         if changed:
@@ -262,6 +315,20 @@ class TestCaseChromosome(chrom.Chromosome):
             result: The last execution result
         """
         self._last_execution_result = result
+        self._execution_result_outdated = False
+
+    def is_execution_result_outdated(self) -> bool:
+        """Whether or not the test case has to be executed (again).
+
+        This is the case if the test case was not yet executed or was changed since
+        its last execution.  In contrast to `has_changed()`, the result is not
+        outdated anymore if the test case was executed but its fitness values were
+        not computed yet, e.g., because it was executed as part of a batch.
+
+        Returns:
+            Whether or not the last execution result is outdated
+        """
+        return self._execution_result_outdated or self._last_execution_result is None
 
     def is_failing(self) -> bool:
         """Returns whether or not the encapsulated test case is a failing test.
@@ -13,7 +13,7 @@ import pynguin.configuration as config
 import pynguin.ga.fitnessfunction as ff
 import pynguin.ga.testcasechromosome as tcc
 import pynguin.utils.statistics.statistics as stat
-from pynguin.ga.comparators.dominancecomparator import DominanceComparator
+from pynguin.ga.operators.ranking.nondominatedsorting import fast_non_dominated_sort
 from pynguin.generation.algorithms.archive import Archive
 from pynguin.generation.algorithms.testgenerationstrategy import TestGenerationStrategy
 from pynguin.generation.algorithms.wraptestsuitemixin import WrapTestSuiteMixin
@@ -75,6 +75,8 @@ class AbstractMOSATestStrategy(
                 tch: tcc.TestCaseChromosome = self._chromosome_factory.get_chromosome()
                 for fitness_function in self._fitness_functions:
                     tch.add_fitness_function(fitness_function)
+                if self._fitness_engine is not None:
+                    tch.set_fitness_engine(self._fitness_engine)
             else:
                 tch = randomness.choice(list(self._archive.solutions)).clone()
                 tch.mutate()
@@ -83,6 +85,7 @@ class AbstractMOSATestStrategy(
                 offspring_population.append(tch)
 
         self._logger.debug("Number of offsprings = %d", len(offspring_population))
+        self._execute_outdated_test_cases(offspring_population)
         return offspring_population
 
     @staticmethod
@@ -95,26 +98,7 @@ class AbstractMOSATestStrategy(
     def _get_non_dominated_solutions(
         self, solutions: List[tcc.TestCaseChromosome]
     ) -> List[tcc.TestCaseChromosome]:
-        comparator: DominanceComparator[tcc.TestCaseChromosome] = DominanceComparator(
-            goals=self._archive.covered_goals
-        )
-        next_front: List[tcc.TestCaseChromosome] = []
-        for solution in solutions:
-            is_dominated = False
-            dominated_solutions: List[tcc.TestCaseChromosome] = []
-            for best in next_front:
-                flag = comparator.compare(solution, best)
-                if flag < 0:
-                    dominated_solutions.append(best)
-                if flag > 0:
-                    is_dominated = True
-            if is_dominated:
-                continue
-            next_front.append(solution)
-            for dominated_solution in dominated_solutions:
-                if dominated_solution in next_front:
-                    next_front.remove(dominated_solution)
-        return next_front
+        return next(fast_non_dominated_sort(solutions, self._archive.covered_goals), [])
 
     def _get_random_population(self) -> List[tcc.TestCaseChromosome]:
         population: List[tcc.TestCaseChromosome] = []
@@ -122,7 +106,10 @@ class AbstractMOSATestStrategy(
             chromosome = self._chromosome_factory.get_chromosome()
             for fitness_function in self._fitness_functions:
                 chromosome.add_fitness_function(fitness_function)
+            if self._fitness_engine is not None:
+                chromosome.set_fitness_engine(self._fitness_engine)
             population.append(chromosome)
+        self._execute_outdated_test_cases(population)
         return population
 
     def _get_best_individuals(self) -> List[tcc.TestCaseChromosome]:
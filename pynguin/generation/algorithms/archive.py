@@ -6,11 +6,11 @@
 #
 """Provides the archive for MOSA."""
 import logging
-import sys
-from typing import Dict, Generic, Iterable, Set, TypeVar
+from typing import Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
 
 import pynguin.ga.chromosome as chrom
 import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.goalfitnessengine as gfe
 
 F = TypeVar("F", bound=ff.FitnessFunction)  # pylint: disable=invalid-name
 C = TypeVar("C", bound=chrom.Chromosome)  # pylint: disable=invalid-name
@@ -37,9 +37,16 @@ class Archive(Generic[F, C]):
     _logger = logging.getLogger(__name__)
 
     def __init__(self, objectives: Set[F]) -> None:
-        self._covered: Dict[F, C] = {}
+        self._covered: Dict[F, Tuple[C, int]] = {}
         self._uncovered = set(objectives)
         self._objectives = objectives
+        # The number of covered objectives for which a solution is the best one.
+        self._solutions: Dict[C, int] = {}
+        # The objectives at the indices of the fitness vectors of an engine, and the
+        # objectives that are not managed by the engine.
+        self._indexed_engine: Optional[gfe.GoalFitnessEngine] = None
+        self._objectives_by_index: Dict[int, F] = {}
+        self._unindexed_objectives: List[F] = list(objectives)
 
     def update(self, solutions: Iterable[C]) -> None:
         """Updates this archive with the given set of solutions.
@@ -50,24 +57,76 @@ class Archive(Generic[F, C]):
         same target, the shorted of the two solutions is retained.  Otherwise,
         the solution is discarded.
 
+        If the solutions share a fitness engine, only the objectives that are
+        covered by a solution are examined, which are found by scanning its fitness
+        vector for zeros.  The fitness values of the objectives that are not
+        managed by the engine are requested one by one.
+
         Args:
             solutions: The solutions to update the archive with
         """
-        for objective in self._objectives:
-            best_solution = self._covered.get(objective, None)
-            best_size = sys.maxsize if best_solution is None else best_solution.size()
-
+        solutions = list(solutions)
+        engine = gfe.get_shared_engine(solutions)
+        if engine is not self._indexed_engine:
+            self._index_objectives(engine)
+        if engine is not None:
+            objectives_by_index = self._objectives_by_index
             for solution in solutions:
-                fitness = solution.get_fitness_for(objective)
-                size = solution.size()
-
-                if fitness == 0.0 and size < best_size:
-                    self._covered[objective] = solution
-                    best_size = size
-                    if objective in self._uncovered:
-                        self._uncovered.remove(objective)
+                size = -1
+                for index in gfe.get_covered_indices(solution.get_fitness_vector()):
+                    objective = objectives_by_index.get(index)
+                    if objective is not None:
+                        if size < 0:
+                            size = solution.size()
+                        self._offer(objective, solution, size)
+        if self._unindexed_objectives:
+            sizes = [solution.size() for solution in solutions]
+            for objective in self._unindexed_objectives:
+                for solution, size in zip(solutions, sizes):
+                    if solution.get_fitness_for(objective) == 0.0:
+                        self._offer(objective, solution, size)
         self._logger.debug("ArchiveCoverageGoals: %d", len(self._covered))
 
+    def _index_objectives(self, engine: Optional[gfe.GoalFitnessEngine]) -> None:
+        """Computes the indices of the objectives in the vectors of an engine.
+
+        Args:
+            engine: The engine of the solutions, if any
+        """
+        self._indexed_engine = engine
+        self._objectives_by_index = {}
+        self._unindexed_objectives = []
+        for objective in self._objectives:
+            index = None if engine is None else engine.index_of(objective)
+            if index is None:
+                self._unindexed_objectives.append(objective)
+            else:
+                self._objectives_by_index[index] = objective
+
+    def _offer(self, objective: F, solution: C, size: int) -> None:
+        """Stores a solution that covers an objective, if it is shorter than the
+        best solution of the objective.
+
+        Args:
+            objective: The covered objective
+            solution: The covering solution
+            size: The size of the solution
+        """
+        best = self._covered.get(objective)
+        if best is not None:
+            best_solution, best_size = best
+            if size >= best_size:
+                return
+            count = self._solutions[best_solution] - 1
+            if count == 0:
+                del self._solutions[best_solution]
+            else:
+                self._solutions[best_solution] = count
+        else:
+            self._uncovered.discard(objective)
+        self._covered[objective] = solution, size
+        self._solutions[solution] = self._solutions.get(solution, 0) + 1
+
     @property
     def uncovered_goals(self) -> Set[F]:
         """Provides the set of goals that are yet to cover.
@@ -84,7 +143,7 @@ class Archive(Generic[F, C]):
         Returns:
             The covered goals
         """
-        return set(self._covered.keys())
+        return set(self._covered)
 
     @property
     def objectives(self) -> Set[F]:
@@ -105,16 +164,10 @@ class Archive(Generic[F, C]):
         Returns:
             The best solutions in the archive
         """
-        assert self._all_covered(), "Some covered targets have a fitness != 0.0"
-        return set(self._covered.values())
+        return set(self._solutions)
 
     def reset(self) -> None:
         """Resets the archive."""
         self._uncovered.update(self._objectives)
         self._covered.clear()
-
-    def _all_covered(self) -> bool:
-        return all(
-            chromosome.get_fitness_for(fitness_function) == 0.0
-            for fitness_function, chromosome in self._covered.items()
-        )
+        self._solutions.clear()
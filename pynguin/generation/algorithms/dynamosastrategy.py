@@ -222,7 +222,7 @@ class _BranchFitnessGraph:
             seen_goals: Set[bctf.BranchCoverageTestFitness] = set()
 
             # Collect those targets that are control dependent
-            for edge in code_object.cdg.graph.edges:
+            for edge in code_object.cdg.edges:
                 goal = edge_predicate_map.get(edge, None)
                 if goal is not None:
                     seen_goals.add(goal)
@@ -255,15 +255,18 @@ class _BranchFitnessGraph:
             Tuple[pg.ProgramGraphNode, pg.ProgramGraphNode],
             bctf.BranchCoverageTestFitness,
         ] = {}
-        for edge in graph.graph.edges:
-            start_node = edge[0]
+        # The targets of the edges of every predicate, in the order of the edges
+        targets: Dict[pg.ProgramGraphNode, List[pg.ProgramGraphNode]] = {}
+        for start_node, target in graph.edges:
             if start_node.predicate_id is not None:
-                targets = list(graph.graph.neighbors(start_node))
-                current_goals = self._find_goals_for_predicate(
-                    goals, start_node.predicate_id
-                )
-                for merged in zip(targets, current_goals):
-                    edge_predicate_map[(start_node, merged[0])] = merged[1]
+                targets.setdefault(start_node, []).append(target)
+        for start_node, node_targets in targets.items():
+            assert start_node.predicate_id is not None
+            current_goals = self._find_goals_for_predicate(
+                goals, start_node.predicate_id
+            )
+            for merged in zip(node_targets, current_goals):
+                edge_predicate_map[(start_node, merged[0])] = merged[1]
         return edge_predicate_map
 
     @staticmethod
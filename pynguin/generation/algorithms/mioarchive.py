@@ -5,16 +5,17 @@
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
 """Provides the archive for MIO."""
-
-
+import heapq
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Generic, Hashable, List, Optional, TypeVar
 
 import pynguin.ga.fitnessfunctions.abstracttestcasefitnessfunction as atcff
 import pynguin.ga.testcasechromosome as tcc
 from pynguin.ga.fitnessfunctions.fitness_utilities import normalise
 from pynguin.utils import randomness
 
+T = TypeVar("T", bound=Hashable)  # pylint: disable=invalid-name
+
 
 @dataclass(frozen=True)
 class PopulationPair:
@@ -27,14 +28,21 @@ class PopulationPair:
     # The test case chromosome.
     test_case_chromosome: tcc.TestCaseChromosome
 
+    def __lt__(self, other: "PopulationPair") -> bool:
+        return self.h < other.h
+
 
 class Population:
-    """The population that is stored per target."""
+    """The population that is stored per target.
+
+    The solutions are stored as a min-heap by their h-value, such that the worst
+    solution, which is replaced by a better candidate, is always at the front.
+    """
 
     def __init__(self, population_size: int) -> None:
         self._counter = 0
         self._capacity = population_size
-        # Assumption: These are always sorted.
+        # Assumption: This is always a heap.
         self._solutions: List[PopulationPair] = []
 
     @property
@@ -95,15 +103,14 @@ class Population:
             if len(self._solutions) < self._capacity:
                 # Yes, there is
                 added = True
-                self._solutions.append(candidate_solution)
+                heapq.heappush(self._solutions, candidate_solution)
             else:
-                worst_solution = self._solutions[-1]
+                worst_solution = self._solutions[0]
                 if self._is_pair_better_than_current(
                     worst_solution, candidate_solution
                 ):
                     added = True
-                    self._solutions[-1] = candidate_solution
-            self._sort_solutions()
+                    heapq.heapreplace(self._solutions, candidate_solution)
 
         assert len(self._solutions) <= self._capacity
         if added:
@@ -134,11 +141,9 @@ class Population:
         if self.is_covered:
             return
         self._capacity = new_population_size
-        self._solutions = self._solutions[0:new_population_size]
-
-    def _sort_solutions(self):
-        # Desc sort, from highest to lowest h.
-        self._solutions.sort(key=lambda c: c.h, reverse=True)
+        if len(self._solutions) > new_population_size:
+            self._solutions = heapq.nlargest(new_population_size, self._solutions)
+            heapq.heapify(self._solutions)
 
     @staticmethod
     def _is_pair_better_than_current(
@@ -175,8 +180,91 @@ class Population:
         # TODO(fk) support other secondary objectives?
 
 
+class _CounterIndex(Generic[T]):
+    """Indexes targets by the counters of their populations.
+
+    The targets are kept in buckets per counter value, and the counter values of
+    the non-empty buckets are kept in a min-heap.  Thus, choosing one of the
+    targets with the lowest counter and updating a counter take logarithmic time.
+    Buckets that became empty are removed from the heap lazily.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[int, List[T]] = {}
+        self._counters: Dict[T, int] = {}
+        # The position of every target in its bucket.
+        self._positions: Dict[T, int] = {}
+        self._heap: List[int] = []
+
+    def add(self, target: T, counter: int) -> None:
+        """Adds a target with the given counter.
+
+        Args:
+            target: The target, which must not be contained
+            counter: The counter of the population of the target
+        """
+        bucket = self._buckets.get(counter)
+        if bucket is None:
+            bucket = self._buckets[counter] = []
+            heapq.heappush(self._heap, counter)
+        self._counters[target] = counter
+        self._positions[target] = len(bucket)
+        bucket.append(target)
+
+    def remove(self, target: T) -> None:
+        """Removes a target.
+
+        Args:
+            target: The target, which must be contained
+        """
+        counter = self._counters.pop(target)
+        position = self._positions.pop(target)
+        bucket = self._buckets[counter]
+        last = bucket.pop()
+        if last is not target:
+            bucket[position] = last
+            self._positions[last] = position
+        if not bucket:
+            del self._buckets[counter]
+
+    def update(self, target: T, counter: int) -> None:
+        """Updates the counter of a target.
+
+        Args:
+            target: The target, which must be contained
+            counter: The new counter of the population of the target
+        """
+        if self._counters[target] != counter:
+            self.remove(target)
+            self.add(target, counter)
+
+    def choose(self) -> Optional[T]:
+        """Chooses one of the targets with the lowest counter at random.
+
+        Returns:
+            A target with the lowest counter, if there is any target
+        """
+        heap = self._heap
+        while heap and heap[0] not in self._buckets:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return randomness.choice(self._buckets[heap[0]])
+
+    def __contains__(self, target: object) -> bool:
+        return target in self._counters
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
 class MIOArchive:
-    """The archive that is used in MIO."""
+    """The archive that is used in MIO.
+
+    The targets whose populations contain solutions are indexed by the counters of
+    their populations, separately for uncovered and covered targets, such that
+    sampling a solution does not have to inspect all targets.
+    """
 
     def __init__(
         self, targets: List[atcff.AbstractTestCaseFitnessFunction], initial_size: int
@@ -184,12 +272,18 @@ class MIOArchive:
         self._archive: Dict[atcff.AbstractTestCaseFitnessFunction, Population] = {
             target: Population(initial_size) for target in targets
         }
+        self._uncovered: _CounterIndex[
+            atcff.AbstractTestCaseFitnessFunction
+        ] = _CounterIndex()
+        self._covered: _CounterIndex[
+            atcff.AbstractTestCaseFitnessFunction
+        ] = _CounterIndex()
 
     def update_archive(self, solution: tcc.TestCaseChromosome) -> bool:
         """Update the archive with the given solution."""
         updated = False
         solution = solution.clone()
-        for target in self._archive:
+        for target, population in self._archive.items():
             fitness_value = solution.get_fitness_for(target)
             result = solution.get_last_execution_result()
             assert result is not None
@@ -198,11 +292,32 @@ class MIOArchive:
                 assert chop_position is not None
                 solution.test_case.chop(chop_position)
 
-            updated |= self._archive[target].add_solution(
-                1.0 - normalise(fitness_value), solution
-            )
+            if population.add_solution(1.0 - normalise(fitness_value), solution):
+                updated = True
+                self._update_index(target, population)
         return updated
 
+    def _update_index(
+        self, target: atcff.AbstractTestCaseFitnessFunction, population: Population
+    ) -> None:
+        """Updates the index after the population of a target changed.
+
+        Args:
+            target: The target
+            population: The population of the target
+        """
+        if population.is_covered:
+            if target in self._uncovered:
+                self._uncovered.remove(target)
+            if target in self._covered:
+                self._covered.update(target, population.counter)
+            else:
+                self._covered.add(target, population.counter)
+        elif target in self._uncovered:
+            self._uncovered.update(target, population.counter)
+        elif population.num_solutions > 0:
+            self._uncovered.add(target, population.counter)
+
     def get_solution(self) -> Optional[tcc.TestCaseChromosome]:
         """Get a random solution."""
 
@@ -212,33 +327,20 @@ class MIOArchive:
         # targets there is not any solution yet, then choose one of the covered targets
         # at random. Thereafter, choose one solution randomly from the list of solutions
         # of the chosen target.
-        targets_with_solutions = [
-            func
-            for func, population in self._archive.items()
-            if population.num_solutions > 0
-        ]
-        if len(targets_with_solutions) == 0:
+        #
+        # Instead of choosing a target at random, we choose the one with the lowest
+        # counter value, ties are broken at random. (See Section 3.3 of the paper that
+        # describes this archive for more details)
+        target = self._uncovered.choose()
+        if target is None:
+            target = self._covered.choose()
+        if target is None:
             # There is not at least one target with at least one solution
             return None
 
-        potential_targets = [
-            func
-            for func in targets_with_solutions
-            if not self._archive[func].is_covered
-        ]
-        if len(potential_targets) == 0:
-            potential_targets = targets_with_solutions
-
-        assert len(potential_targets) > 0
-
-        # We shuffle before, so we don't always pick the same, in case of ties.
-        randomness.RNG.shuffle(potential_targets)
-
-        # Instead of choosing a target at random, we choose the one with the lowest
-        # counter value. (See Section 3.3 of the paper that describes this archive
-        # for more details)
-        potential_targets.sort(key=lambda t: self._archive[t].counter)
-        sampled = self._archive[potential_targets[0]].sample_solution()
+        population = self._archive[target]
+        sampled = population.sample_solution()
+        self._update_index(target, population)
         if sampled is not None:
             sampled = sampled.clone()
         return sampled
@@ -261,6 +363,4 @@ class MIOArchive:
     @property
     def num_covered_targets(self) -> int:
         """The amount of targets that are covered."""
-        return len(
-            [1 for population in self._archive.values() if population.is_covered]
-        )
+        return len(self._covered)
@@ -172,3 +172,5 @@ class MIOTestStrategy(TestGenerationStrategy, WrapTestSuiteMixin):
     def _add_fitness_functions(self, chromosome: tcc.TestCaseChromosome) -> None:
         for fitness_function in self._fitness_functions:
             chromosome.add_fitness_function(fitness_function)
+        if self._fitness_engine is not None:
+            chromosome.set_fitness_engine(self._fitness_engine)
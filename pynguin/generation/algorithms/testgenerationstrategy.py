@@ -6,11 +6,13 @@
 #
 """Provides an abstract base class for a test generation algorithm."""
 from abc import ABCMeta, abstractmethod
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 import pynguin.ga.chromosome as chrom
 import pynguin.ga.chromosomefactory as cf
 import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.goalfitnessengine as gfe
+import pynguin.ga.testcasechromosome as tcc
 import pynguin.testcase.testfactory as tf
 from pynguin.ga.operators.crossover.crossover import CrossOverFunction
 from pynguin.ga.operators.ranking.rankingfunction import RankingFunction
@@ -34,6 +36,7 @@ class TestGenerationStrategy(metaclass=ABCMeta):
         self._crossover_function: CrossOverFunction
         self._ranking_function: RankingFunction
         self._fitness_functions: List[ff.FitnessFunction] = []
+        self._fitness_engine: Optional[gfe.GoalFitnessEngine] = None
 
     @property
     def chromosome_factory(self) -> cf.ChromosomeFactory:
@@ -156,6 +159,19 @@ class TestGenerationStrategy(metaclass=ABCMeta):
     def fitness_functions(self, fitness_functions: List[ff.FitnessFunction]) -> None:
         self._fitness_functions = fitness_functions
 
+    @property
+    def fitness_engine(self) -> Optional[gfe.GoalFitnessEngine]:
+        """Provides the engine that computes the fitness values of the goals.
+
+        Returns:
+            The fitness engine, if any
+        """
+        return self._fitness_engine
+
+    @fitness_engine.setter
+    def fitness_engine(self, fitness_engine: Optional[gfe.GoalFitnessEngine]) -> None:
+        self._fitness_engine = fitness_engine
+
     def add_fitness_function(self, fitness_function: ff.FitnessFunction) -> None:
         """Adds a fitness function.
 
@@ -189,6 +205,31 @@ class TestGenerationStrategy(metaclass=ABCMeta):
         self._fitness_functions.remove(fitness_function)
         return True
 
+    def _execute_outdated_test_cases(
+        self, test_case_chromosomes: Iterable[tcc.TestCaseChromosome]
+    ) -> None:
+        """Executes the test cases with an outdated execution result as one batch.
+
+        The results are stored in the chromosomes, thus the subsequent fitness
+        computation does not need to execute them again.  This allows the executor to
+        distribute the batch over several worker processes.
+
+        Args:
+            test_case_chromosomes: The test case chromosomes to execute, if necessary
+        """
+        outdated = [
+            chromosome
+            for chromosome in test_case_chromosomes
+            if chromosome.is_execution_result_outdated()
+        ]
+        if len(outdated) == 0:
+            return
+        results = self._executor.execute_many(
+            [chromosome.test_case for chromosome in outdated]
+        )
+        for chromosome, result in zip(outdated, results):
+            chromosome.set_last_execution_result(result)
+
     @abstractmethod
     def generate_tests(self) -> chrom.Chromosome:
         """Generates tests for a given module until the time limit is reached.
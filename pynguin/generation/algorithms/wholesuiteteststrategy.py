@@ -6,9 +6,11 @@
 #
 """Provides a whole-suite test generation algorithm similar to EvoSuite."""
 import logging
-from typing import List
+from math import ceil
+from typing import List, Tuple
 
 import pynguin.configuration as config
+import pynguin.ga.chromosome as chrom
 import pynguin.ga.testsuitechromosome as tsc
 import pynguin.utils.statistics.statistics as stat
 from pynguin.generation.algorithms.testgenerationstrategy import TestGenerationStrategy
@@ -58,6 +60,71 @@ class WholeSuiteTestStrategy(TestGenerationStrategy):
         new_generation = []
         new_generation.extend(self.elitism())
         while not self.is_next_population_full(new_generation):
+            # Breed all offspring that are still missing at once, such that the
+            # executor can execute their test cases as one batch.
+            families = self._breed_offspring(
+                ceil(
+                    (
+                        config.configuration.search_algorithm.population
+                        - len(new_generation)
+                    )
+                    / 2
+                )
+            )
+            chrom.Chromosome.evaluate_all(
+                [
+                    offspring
+                    for _, _, offspring1, offspring2 in families
+                    for offspring in (offspring1, offspring2)
+                ]
+            )
+            best_individual = self._get_best_individual()
+            for parent1, parent2, offspring1, offspring2 in families:
+                fitness_parents = min(parent1.get_fitness(), parent2.get_fitness())
+                fitness_offspring = min(
+                    offspring1.get_fitness(), offspring2.get_fitness()
+                )
+                length_parents = parent1.length() + parent2.length()
+                length_offspring = offspring1.length() + offspring2.length()
+
+                if (fitness_offspring < fitness_parents) or (
+                    fitness_offspring == fitness_parents
+                    and length_offspring <= length_parents
+                ):
+                    for offspring in [offspring1, offspring2]:
+                        if offspring.length() <= 2 * best_individual.length():
+                            new_generation.append(offspring)
+                        else:
+                            new_generation.append(randomness.choice([parent1, parent2]))
+                else:
+                    new_generation.append(parent1)
+                    new_generation.append(parent2)
+
+        self._population = new_generation
+        self._sort_population()
+        stat.current_individual(self._get_best_individual())
+
+    def _breed_offspring(
+        self, number_of_families: int
+    ) -> List[
+        Tuple[
+            tsc.TestSuiteChromosome,
+            tsc.TestSuiteChromosome,
+            tsc.TestSuiteChromosome,
+            tsc.TestSuiteChromosome,
+        ]
+    ]:
+        """Selects pairs of parents and creates their offspring.
+
+        Args:
+            number_of_families: The number of parent pairs to select
+
+        Returns:
+            A list of tuples of two parents and their two offspring, which might be
+            shorter than requested, if crossover or mutation failed.
+        """
+        families = []
+        for _ in range(number_of_families):
             parent1 = self._selection_function.select(self._population, 1)[0]
             parent2 = self._selection_function.select(self._population, 1)[0]
 
@@ -76,29 +143,8 @@ class WholeSuiteTestStrategy(TestGenerationStrategy):
             except ConstructionFailedException as ex:
                 self._logger.info("Crossover/Mutation failed: %s", ex)
                 continue
-
-            fitness_parents = min(parent1.get_fitness(), parent2.get_fitness())
-            fitness_offspring = min(offspring1.get_fitness(), offspring2.get_fitness())
-            length_parents = parent1.length() + parent2.length()
-            length_offspring = offspring1.length() + offspring2.length()
-            best_individual = self._get_best_individual()
-
-            if (fitness_offspring < fitness_parents) or (
-                fitness_offspring == fitness_parents
-                and length_offspring <= length_parents
-            ):
-                for offspring in [offspring1, offspring2]:
-                    if offspring.length() <= 2 * best_individual.length():
-                        new_generation.append(offspring)
-                    else:
-                        new_generation.append(randomness.choice([parent1, parent2]))
-            else:
-                new_generation.append(parent1)
-                new_generation.append(parent2)
-
-        self._population = new_generation
-        self._sort_population()
-        stat.current_individual(self._get_best_individual())
+            families.append((parent1, parent2, offspring1, offspring2))
+        return families
 
     def _get_random_population(self) -> List[tsc.TestSuiteChromosome]:
         population = []
@@ -107,6 +153,7 @@ class WholeSuiteTestStrategy(TestGenerationStrategy):
             for fitness_function in self._fitness_functions:
                 chromosome.add_fitness_function(fitness_function)
             population.append(chromosome)
+        chrom.Chromosome.evaluate_all(population)
         return population
 
     def _sort_population(self) -> None:
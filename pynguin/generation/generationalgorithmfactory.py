@@ -7,7 +7,7 @@
 """Provides factories for the generation algorithm."""
 import logging
 from abc import ABCMeta, abstractmethod
-from typing import Callable, Dict, Generic, List, TypeVar
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
 
 import pynguin.configuration as config
 import pynguin.coverage.branch.branchcoveragefactory as bcf
@@ -20,6 +20,7 @@ import pynguin.ga.testcasefactory as tcf
 import pynguin.ga.testsuitechromosome as tsc
 import pynguin.ga.testsuitechromosomefactory as tscf
 import pynguin.testcase.testfactory as tf
+from pynguin.ga.goalfitnessengine import GoalFitnessEngine
 from pynguin.ga.operators.crossover.crossover import CrossOverFunction
 from pynguin.ga.operators.crossover.singlepointrelativecrossover import (
     SinglePointRelativeCrossOver,
@@ -154,6 +155,7 @@ class TestSuiteGenerationAlgorithmFactory(
 
         fitness_functions = self._get_fitness_functions()
         strategy.fitness_functions = fitness_functions
+        strategy.fitness_engine = self._get_fitness_engine(fitness_functions)
 
         if isinstance(strategy, WrapTestSuiteMixin):
             test_suite_fitness_function = self._get_test_suite_fitness_function()
@@ -247,5 +249,25 @@ class TestSuiteGenerationAlgorithmFactory(
             return fitness_functions
         return [self._get_test_suite_fitness_function()]
 
+    def _get_fitness_engine(
+        self, fitness_functions: List[ff.FitnessFunction]
+    ) -> Optional[GoalFitnessEngine]:
+        """Provides an engine that computes the fitness values of all goals at once.
+
+        Args:
+            fitness_functions: The fitness functions of the goals
+
+        Returns:
+            A fitness engine, if the algorithm is many-objective
+        """
+        if config.configuration.algorithm in (
+            config.Algorithm.DYNAMOSA,
+            config.Algorithm.MIO,
+            config.Algorithm.MOSA,
+        ):
+            factory = bcf.BranchCoverageFactory(self._executor)
+            return factory.get_fitness_engine(fitness_functions)
+        return None
+
     def _get_test_suite_fitness_function(self) -> ff.FitnessFunction:
         return bdtsf.BranchDistanceTestSuiteFitnessFunction(self._executor)
@@ -35,13 +35,20 @@ import pynguin.generation.generationalgorithmfactory as gaf
 import pynguin.testcase.testcase as tc
 import pynguin.utils.statistics.statistics as stat
 from pynguin.analyses.seeding.constantseeding import static_constant_seeding
+from pynguin.coverage.branch.branchcoveragefitnessengine import (
+    BranchCoverageFitnessEngine,
+)
 from pynguin.ga.fitnessfunctions.fitness_utilities import compute_branch_coverage
 from pynguin.generation.algorithms.testgenerationstrategy import TestGenerationStrategy
 from pynguin.generation.export.exportprovider import ExportProvider
 from pynguin.instrumentation.machinery import install_import_hook
 from pynguin.setup.testcluster import TestCluster
 from pynguin.setup.testclustergenerator import TestClusterGenerator
-from pynguin.testcase.execution.executiontracer import ExecutionTracer
+from pynguin.testcase.execution.executiontracer import (
+    ExecutionTracer,
+    FastExecutionTracer,
+)
+from pynguin.testcase.execution.paralleltestcaseexecutor import ParallelTestCaseExecutor
 from pynguin.testcase.execution.testcaseexecutor import TestCaseExecutor
 from pynguin.utils import randomness
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
@@ -122,7 +129,11 @@ def _setup_path() -> bool:
 
 def _setup_import_hook() -> ExecutionTracer:
     _LOGGER.debug("Setting up instrumentation for %s", config.configuration.module_name)
-    tracer = ExecutionTracer()
+    tracer = (
+        FastExecutionTracer()
+        if config.configuration.execution.fast_tracer
+        else ExecutionTracer()
+    )
     install_import_hook(config.configuration.module_name, tracer)
     return tracer
 
@@ -182,7 +193,7 @@ def _setup_and_check() -> Optional[Tuple[TestCaseExecutor, TestCluster]]:
         return None
     if (test_cluster := _setup_test_cluster()) is None:
         return None
-    executor = TestCaseExecutor(tracer)
+    executor = _setup_executor(tracer)
     _track_sut_data(tracer, test_cluster)
     _setup_random_number_generator()
     _setup_constant_seeding_collection()
@@ -190,6 +201,28 @@ def _setup_and_check() -> Optional[Tuple[TestCaseExecutor, TestCluster]]:
     return executor, test_cluster
 
 
+def _setup_executor(tracer: ExecutionTracer) -> TestCaseExecutor:
+    """Creates the test-case executor.
+
+    Args:
+        tracer: the execution tracer
+
+    Returns:
+        A parallel executor, if more than one worker is requested and supported,
+        a sequential one otherwise
+    """
+    number_of_workers = config.configuration.execution.number_of_workers
+    if number_of_workers > 1:
+        if ParallelTestCaseExecutor.is_supported():
+            _LOGGER.info("Using %d worker processes for execution", number_of_workers)
+            return ParallelTestCaseExecutor(tracer, number_of_workers)
+        _LOGGER.warning(
+            "Parallel execution requires forking processes, which is not supported "
+            "on this platform. Falling back to sequential execution."
+        )
+    return TestCaseExecutor(tracer)
+
+
 def _track_sut_data(tracer: ExecutionTracer, test_cluster: TestCluster) -> None:
     """Track data from the SUT.
 
@@ -238,6 +271,31 @@ def _run() -> ReturnCode:
             "Stop generating sequences using %s", config.configuration.algorithm
         )
         algorithm.send_statistics()
+        stat.track_output_variable(
+            RuntimeVariable.CompiledCodeCacheHits, executor.code_cache.hits
+        )
+        stat.track_output_variable(
+            RuntimeVariable.CompiledCodeCacheMisses, executor.code_cache.misses
+        )
+        if isinstance(algorithm.fitness_engine, BranchCoverageFitnessEngine):
+            fitness_cache = algorithm.fitness_engine.fitness_cache
+            stat.track_output_variable(
+                RuntimeVariable.FitnessCacheHits, fitness_cache.hits
+            )
+            stat.track_output_variable(
+                RuntimeVariable.FitnessCacheMisses, fitness_cache.misses
+            )
+        stat.track_output_variable(
+            RuntimeVariable.SkippedConstructions,
+            algorithm.test_factory.skipped_constructions,
+        )
+        stat.track_output_variable(
+            RuntimeVariable.ReusedStatementExecutions,
+            executor.snapshot_cache.reused_statements,
+        )
+        if isinstance(executor, ParallelTestCaseExecutor):
+            # The remaining executions need observers or are single test cases.
+            executor.shutdown()
 
         with Timer(name="Re-execution time", logger=None):
             stat.track_output_variable(
@@ -13,7 +13,10 @@ from typing import List, Optional, Set, Tuple
 from bytecode import BasicBlock, Bytecode, Compare, ControlFlowGraph, Instr
 
 from pynguin.analyses.controlflow.cfg import CFG
-from pynguin.analyses.controlflow.controldependencegraph import ControlDependenceGraph
+from pynguin.analyses.controlflow.controldependencegraph import (
+    ApproachLevelIndex,
+    ControlDependenceGraph,
+)
 from pynguin.analyses.controlflow.dominatortree import DominatorTree
 from pynguin.analyses.controlflow.programgraph import ProgramGraphNode
 from pynguin.analyses.seeding.constantseeding import dynamic_constant_seeding
@@ -22,6 +25,7 @@ from pynguin.testcase.execution.executiontracer import (
     ExecutionTracer,
     PredicateMetaData,
 )
+from pynguin.utils.statistics.timer import Timer
 
 
 # pylint:disable=too-few-public-methods
@@ -104,8 +108,31 @@ class BranchCoverageInstrumentation(Instrumentation):
 
     _logger = logging.getLogger(__name__)
 
-    def __init__(self, tracer: ExecutionTracer) -> None:
+    def __init__(self, tracer: ExecutionTracer, adaptive: bool = False) -> None:
+        """Create a new branch coverage instrumentation.
+
+        Args:
+            tracer: The tracer to which the instrumented code reports
+            adaptive: Whether a predicate stops reporting to the tracer, once both
+                of its branches were taken in the current trace
+        """
         self._tracer = tracer
+        self._adaptive = adaptive
+        # The tracer calls that are not yet guarded, given by the basic block that
+        # contains them, their position within the block, their number of
+        # instructions and the id of their predicate.
+        self._unguarded_calls: List[Tuple[BasicBlock, int, int, int]] = []
+        self._analysis_time = 0.0
+
+    @property
+    def analysis_time(self) -> float:
+        """Provides the time spent on the control-flow analysis of the instrumented
+        code objects, i.e., on computing their graphs and dominators.
+
+        Returns:
+            The analysis time in seconds
+        """
+        return self._analysis_time
 
     def _instrument_inner_code_objects(
         self, code: CodeType, parent_code_object_id: int
@@ -147,21 +174,24 @@ class BranchCoverageInstrumentation(Instrumentation):
             The instrumented code object
         """
         self._logger.debug("Instrumenting Code Object for %s", code.co_name)
-        cfg = CFG.from_bytecode(Bytecode.from_code(code))
-        cdg = ControlDependenceGraph.compute(cfg)
-        code_object_id = self._tracer.register_code_object(
-            CodeObjectMetaData(
-                code_object=code,
-                parent_code_object_id=parent_code_object_id,
-                cfg=cfg,
-                cdg=cdg,
-            )
+        with Timer(logger=None) as timer:
+            cfg = CFG.from_bytecode(Bytecode.from_code(code))
+            cdg = ControlDependenceGraph.compute(cfg)
+        self._analysis_time += timer.last
+        meta = CodeObjectMetaData(
+            code_object=code,
+            parent_code_object_id=parent_code_object_id,
+            cfg=cfg,
+            cdg=cdg,
         )
+        code_object_id = self._tracer.register_code_object(meta)
         assert cfg.entry_node is not None, "Entry node cannot be None."
         real_entry_node = cfg.get_successors(cfg.entry_node).pop()  # Only one exists!
         assert real_entry_node.basic_block is not None, "Basic block cannot be None."
         self._add_code_object_executed(real_entry_node.basic_block, code_object_id)
         self._instrument_cfg(cfg, code_object_id)
+        # The nodes of the CDG know their predicates after the instrumentation.
+        meta.approach_levels = ApproachLevelIndex.compute(cdg)
         return self._instrument_inner_code_objects(
             cfg.bytecode_cfg().to_code(), code_object_id
         )
@@ -174,13 +204,68 @@ class BranchCoverageInstrumentation(Instrumentation):
             code_object_id: The id of the code object which contains this CFG.
         """
         # Required to transform for loops.
-        dominator_tree = DominatorTree.compute(cfg)
+        with Timer(logger=None) as timer:
+            dominator_tree = DominatorTree.compute(cfg)
+        self._analysis_time += timer.last
         for node in cfg.nodes:
             predicate_id = self._instrument_node(
                 cfg, code_object_id, dominator_tree, node
             )
             if predicate_id is not None:
                 node.predicate_id = predicate_id
+        # Guarding a call splits its basic block, which must not happen before all
+        # nodes are instrumented, because the instrumentation of a for loop needs
+        # the jumps at the end of the basic blocks of the nodes.
+        self._guard_tracer_calls(cfg.bytecode_cfg())
+
+    def _insert_tracer_call(
+        self,
+        block: BasicBlock,
+        position: int,
+        call: List[Instr],
+        predicate_id: int,
+    ) -> None:
+        """Insert instructions that report the execution of a predicate.
+
+        Args:
+            block: The basic block into which the instructions are inserted
+            position: The position before which the instructions are inserted,
+                negative positions count from the end of the block
+            call: The instructions that call the tracer
+            predicate_id: The id of the reported predicate
+        """
+        if position < 0:
+            position += len(block)
+        block[position:position] = call
+        if self._adaptive:
+            self._unguarded_calls.append((block, position, len(call), predicate_id))
+
+    def _guard_tracer_calls(self, bytecode_cfg: ControlFlowGraph) -> None:
+        """Guard the inserted tracer calls, such that they are skipped once their
+        predicate is saturated, i.e., both of its branches were taken.
+
+        Each guard looks up the flag of its predicate and jumps over the call, if
+        the flag is set.  Thus, a saturated predicate in a loop only costs a
+        subscript and a jump per iteration instead of a call of the tracer.
+
+        Args:
+            bytecode_cfg: The control-flow graph that contains the calls
+        """
+        saturated_predicates = self._tracer.saturated_predicates
+        for block, position, length, predicate_id in self._unguarded_calls:
+            lineno = block[position].lineno
+            next_block = block.next_block
+            block[position:position] = [
+                Instr("LOAD_CONST", saturated_predicates, lineno=lineno),
+                Instr("LOAD_CONST", predicate_id, lineno=lineno),
+                Instr("BINARY_SUBSCR", lineno=lineno),
+            ]
+            call_block = bytecode_cfg.split_block(block, position + 3)
+            after_call = bytecode_cfg.split_block(call_block, length)
+            # Splitting does not preserve the successor of the original block.
+            after_call.next_block = next_block
+            block.append(Instr("POP_JUMP_IF_TRUE", after_call, lineno=lineno))
+        self._unguarded_calls.clear()
 
     def _instrument_node(
         self,
@@ -293,7 +378,7 @@ class BranchCoverageInstrumentation(Instrumentation):
         # Insert instructions right before the conditional jump.
         # We duplicate the value on top of the stack and report
         # it to the tracer.
-        block[self._JUMP_OP_POS : self._JUMP_OP_POS] = [
+        call = [
             Instr("DUP_TOP", lineno=lineno),
             Instr("LOAD_CONST", self._tracer, lineno=lineno),
             Instr(
@@ -307,6 +392,7 @@ class BranchCoverageInstrumentation(Instrumentation):
             Instr("CALL_METHOD", 2, lineno=lineno),
             Instr("POP_TOP", lineno=lineno),
         ]
+        self._insert_tracer_call(block, self._JUMP_OP_POS, call, predicate_id)
         return predicate_id
 
     def _instrument_compare_based_conditional_jump(
@@ -346,7 +432,7 @@ class BranchCoverageInstrumentation(Instrumentation):
         # Insert instructions right before the comparison.
         # We duplicate the values on top of the stack and report
         # them to the tracer.
-        block[self._COMPARE_OP_POS : self._COMPARE_OP_POS] = [
+        call = [
             Instr("DUP_TOP_TWO", lineno=lineno),
             Instr("LOAD_CONST", self._tracer, lineno=lineno),
             Instr(
@@ -361,6 +447,7 @@ class BranchCoverageInstrumentation(Instrumentation):
             Instr("CALL_METHOD", 4, lineno=lineno),
             Instr("POP_TOP", lineno=lineno),
         ]
+        self._insert_tracer_call(block, self._COMPARE_OP_POS, call, predicate_id)
         return predicate_id
 
     def _instrument_exception_based_conditional_jump(
@@ -385,7 +472,7 @@ class BranchCoverageInstrumentation(Instrumentation):
         # Insert instructions right before the conditional jump.
         # We duplicate the values on top of the stack and report
         # them to the tracer.
-        block[self._JUMP_OP_POS : self._JUMP_OP_POS] = [
+        call = [
             Instr("DUP_TOP_TWO", lineno=lineno),
             Instr("LOAD_CONST", self._tracer, lineno=lineno),
             Instr(
@@ -399,6 +486,7 @@ class BranchCoverageInstrumentation(Instrumentation):
             Instr("CALL_METHOD", 3, lineno=lineno),
             Instr("POP_TOP", lineno=lineno),
         ]
+        self._insert_tracer_call(block, self._JUMP_OP_POS, call, predicate_id)
         return predicate_id
 
     def _add_code_object_executed(self, block: BasicBlock, code_object_id: int) -> None:
@@ -493,23 +581,34 @@ class BranchCoverageInstrumentation(Instrumentation):
         )
         for_instr.arg = not_entered
 
-        entered.extend(
-            [
-                Instr("LOAD_CONST", self._tracer, lineno=lineno),
-                Instr(
-                    "LOAD_METHOD",
-                    ExecutionTracer.executed_bool_predicate.__name__,
-                    lineno=lineno,
-                ),
-                Instr("LOAD_CONST", True, lineno=lineno),
-                Instr("LOAD_CONST", predicate_id, lineno=lineno),
-                Instr("CALL_METHOD", 2, lineno=lineno),
-                Instr("POP_TOP", lineno=lineno),
-                Instr("JUMP_ABSOLUTE", for_loop_body, lineno=lineno),
-            ]
-        )
+        self._report_loop_entry(entered, True, for_loop_body, lineno, predicate_id)
+        self._report_loop_entry(not_entered, False, for_loop_exit, lineno, predicate_id)
+        new_header.append(for_instr_copy)
+        self._redirect_internal_jumps(dominator_tree, node, new_header)
+        return predicate_id
+
+    def _report_loop_entry(  # pylint: disable=too-many-arguments
+        self,
+        block: BasicBlock,
+        entered: bool,
+        target: BasicBlock,
+        lineno: Optional[int],
+        predicate_id: int,
+    ) -> None:
+        """Fill the given block, which reports whether the loop was entered to the
+        tracer and jumps to the given target afterwards.
 
-        not_entered.extend(
+        Args:
+            block: The empty block that is filled
+            entered: Whether the loop was entered, if the block is executed
+            target: The block that is executed after the report
+            lineno: The line number of the loop header
+            predicate_id: The id of the predicate of the loop header
+        """
+        block.append(Instr("JUMP_ABSOLUTE", target, lineno=lineno))
+        self._insert_tracer_call(
+            block,
+            0,
             [
                 Instr("LOAD_CONST", self._tracer, lineno=lineno),
                 Instr(
@@ -517,24 +616,33 @@ class BranchCoverageInstrumentation(Instrumentation):
                     ExecutionTracer.executed_bool_predicate.__name__,
                     lineno=lineno,
                 ),
-                Instr("LOAD_CONST", False, lineno=lineno),
+                Instr("LOAD_CONST", entered, lineno=lineno),
                 Instr("LOAD_CONST", predicate_id, lineno=lineno),
                 Instr("CALL_METHOD", 2, lineno=lineno),
                 Instr("POP_TOP", lineno=lineno),
-                Instr("JUMP_ABSOLUTE", for_loop_exit, lineno=lineno),
-            ]
+            ],
+            predicate_id,
         )
 
-        new_header.append(for_instr_copy)
+    def _redirect_internal_jumps(
+        self,
+        dominator_tree: DominatorTree,
+        node: ProgramGraphNode,
+        new_header: BasicBlock,
+    ) -> None:
+        """Redirect the jumps from within the loop to the new loop header.
 
-        # Redirect internal jumps to the new loop header
+        Args:
+            dominator_tree: The dominator tree of the CFG that contains the loop
+            node: The node which contains the original header of the loop
+            new_header: The new internal header of the loop
+        """
         for successor in dominator_tree.get_transitive_successors(node):
             if (
                 successor.basic_block is not None
                 and successor.basic_block[self._JUMP_OP_POS].arg is node.basic_block
             ):
                 successor.basic_block[self._JUMP_OP_POS].arg = new_header
-        return predicate_id
 
 
 # pylint:disable=too-few-public-methods
@@ -0,0 +1,280 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides a persistent cache for instrumented code objects."""
+import contextlib
+import functools
+import hashlib
+import io
+import logging
+import marshal
+import os
+import pickle  # nosec # Entries are only loaded from a trusted cache directory.
+import sys
+import tempfile
+from types import CodeType
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+import bytecode
+from bytecode import UNSET, BasicBlock, ControlFlowGraph
+
+import pynguin.analyses.controlflow.cfg as cfg
+import pynguin.analyses.controlflow.controldependencegraph as cdg
+import pynguin.analyses.controlflow.dominatortree as pdt
+import pynguin.analyses.controlflow.programgraph as pg
+import pynguin.instrumentation.instrumentation as instr
+import pynguin.testcase.execution.executiontracer as ex
+from pynguin.analyses.seeding.constantseeding import dynamic_constant_seeding
+from pynguin.testcase.execution.executiontracer import ExecutionTracer, KnownData
+
+
+@functools.lru_cache(maxsize=None)
+def _implementation_digest() -> str:
+    """Computes a digest of the implementation that produces the entries.
+
+    The digest changes whenever the instrumentation, the tracer, the control-flow
+    analyses, whose results are part of the known data, or the format of the entries
+    changes, such that entries of a different implementation are not loaded.
+
+    Returns:
+        The digest of the source files of the implementation
+    """
+    digest = hashlib.sha256()
+    for module in (instr, ex, cfg, cdg, pdt, pg, sys.modules[__name__]):
+        assert module.__file__ is not None
+        with open(module.__file__, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def _restore_code(code: bytes, consts: Tuple[Any, ...]) -> CodeType:
+    """Restores a code object that was reduced by the _CachePickler.
+
+    Args:
+        code: The marshalled code object without its constants
+        consts: The constants of the code object
+
+    Returns:
+        The restored code object
+    """
+    return marshal.loads(code).replace(co_consts=consts)
+
+
+def _restore_bytecode_cfg(state: Dict[str, Any]) -> ControlFlowGraph:
+    """Restores a bytecode CFG that was reduced by the _CachePickler.
+
+    Args:
+        state: The attributes of the CFG without the index of its blocks
+
+    Returns:
+        The restored bytecode CFG
+    """
+    bytecode_cfg = ControlFlowGraph.__new__(ControlFlowGraph)
+    bytecode_cfg.__dict__.update(state)
+    # The index is keyed by the ids of the blocks, which change when unpickling.
+    bytecode_cfg.__dict__["_block_index"] = {
+        id(block): index for index, block in enumerate(state["_blocks"])
+    }
+    return bytecode_cfg
+
+
+class _CachePickler(pickle.Pickler):
+    """Pickles instrumented code objects and the known data about them.
+
+    Instrumented code refers to objects of the running Pynguin, e.g., the
+    execution tracer, which are stored by name and replaced by the respective
+    objects of the loading Pynguin.  The same holds for sentinel objects that are
+    compared by identity.  Code objects cannot be pickled, thus, they are
+    marshalled without their constants, which are pickled instead.
+
+    Basic blocks refer to their successors, thus, pickling them recursively
+    exceeds the recursion limit for large code objects.  Instead, every basic block
+    is pickled as an empty block, and its contents are pickled afterwards by
+    dump_blocks().
+    """
+
+    def __init__(self, file: BinaryIO, shared_objects: Dict[str, Any]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._names = {id(obj): name for name, obj in shared_objects.items()}
+        self._pending_blocks: List[BasicBlock] = []
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        return self._names.get(id(obj))
+
+    def reducer_override(self, obj: Any) -> Any:
+        """Reduces the objects that cannot be pickled as usual.
+
+        Args:
+            obj: The object that is pickled
+
+        Returns:
+            The reduction of the object, or NotImplemented to pickle it as usual
+        """
+        if isinstance(obj, CodeType):
+            placeholders = (None,) * len(obj.co_consts)
+            return (
+                _restore_code,
+                (marshal.dumps(obj.replace(co_consts=placeholders)), obj.co_consts),
+            )
+        if isinstance(obj, BasicBlock):
+            self._pending_blocks.append(obj)
+            return BasicBlock, ()
+        if isinstance(obj, ControlFlowGraph):
+            state = dict(vars(obj))
+            del state["_block_index"]
+            return _restore_bytecode_cfg, (state,)
+        return NotImplemented
+
+    def dump_blocks(self) -> None:
+        """Pickles the contents of the basic blocks that were pickled as empty
+        blocks, until no more blocks are encountered."""
+        while self._pending_blocks:
+            blocks, self._pending_blocks = self._pending_blocks, []
+            self.dump([(block, list(block), block.next_block) for block in blocks])
+        self.dump(None)
+
+
+class _CacheUnpickler(pickle.Unpickler):
+    """Loads the objects that were stored by the _CachePickler."""
+
+    def __init__(self, file: BinaryIO, shared_objects: Dict[str, Any]) -> None:
+        super().__init__(file)
+        self._shared_objects = shared_objects
+
+    def persistent_load(self, pid: Any) -> Any:
+        return self._shared_objects[pid]
+
+    def load_blocks(self) -> None:
+        """Restores the contents of the basic blocks."""
+        contents = self.load()
+        while contents is not None:
+            for block, instructions, next_block in contents:
+                block.extend(instructions)
+                block.next_block = next_block
+            contents = self.load()
+
+
+class InstrumentationCache:
+    """A cache directory that stores instrumented code objects of modules.
+
+    Every entry contains the instrumented code object of a module together with the
+    known data that the instrumentation registered at the tracer, i.e., the meta
+    data of its code objects and predicates.  Thus, loading an entry skips the
+    analysis and instrumentation of the module.
+
+    An entry is keyed by the source of the module, the Python version, the version
+    of the bytecode library, the implementation and the format of the entries, and
+    the settings of the instrumentation.
+    Entries are written atomically, such that concurrent runs can share a cache
+    directory.
+
+    Loading an entry unpickles it, which can execute arbitrary code.  Thus, the
+    cache directory must only be writable by trusted users.  A cache directory that
+    does not exist is created with permissions for its owner only.
+    """
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(self, cache_dir: str) -> None:
+        """Creates a new cache that stores its entries in the given directory.
+
+        Args:
+            cache_dir: The cache directory, which is created if it does not exist
+        """
+        self._cache_dir = cache_dir
+
+    @staticmethod
+    def key(source: bytes, settings: Tuple[Any, ...]) -> str:
+        """Computes the key of the entry for the given module.
+
+        Args:
+            source: The source code of the module
+            settings: The settings that affect the instrumentation
+
+        Returns:
+            The key of the entry
+        """
+        digest = hashlib.sha256(source)
+        environment = (
+            sys.version,
+            bytecode.__version__,
+            _implementation_digest(),
+            settings,
+        )
+        digest.update(repr(environment).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, module_name: str, key: str) -> str:
+        return os.path.join(self._cache_dir, f"{module_name}-{key}.pickle")
+
+    @staticmethod
+    def _shared_objects(tracer: ExecutionTracer) -> Dict[str, Any]:
+        return {
+            "tracer": tracer,
+            "saturated_predicates": tracer.saturated_predicates,
+            "dynamic_constant_seeding": dynamic_constant_seeding,
+            # Marks instructions without an argument and is compared by identity.
+            "unset": UNSET,
+        }
+
+    def load(
+        self, module_name: str, key: str, tracer: ExecutionTracer
+    ) -> Optional[CodeType]:
+        """Loads the instrumented code of a module and restores its known data.
+
+        Args:
+            module_name: The name of the module
+            key: The key of the entry
+            tracer: The tracer to which the instrumented code reports
+
+        Returns:
+            The instrumented code object of the module, if the cache contains it
+        """
+        path = self._path(module_name, key)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path, "rb") as file:
+                unpickler = _CacheUnpickler(file, self._shared_objects(tracer))
+                # The entry is trusted, because it is in the trusted cache directory.
+                code, known_data = unpickler.load()  # nosec
+                unpickler.load_blocks()
+            if not isinstance(code, CodeType) or not isinstance(known_data, KnownData):
+                raise ValueError("Unexpected content of cache entry")
+        except Exception as error:  # pylint: disable=broad-except
+            self._logger.warning("Failed to load cached instrumentation: %s", error)
+            return None
+        tracer.restore_known_data(known_data)
+        self._logger.info("Loaded instrumented code of %s from cache", module_name)
+        return code
+
+    def store(
+        self, module_name: str, key: str, code: CodeType, tracer: ExecutionTracer
+    ) -> None:
+        """Stores the instrumented code of a module and the known data about it.
+
+        Args:
+            module_name: The name of the module
+            key: The key of the entry
+            code: The instrumented code object of the module
+            tracer: The tracer at which the instrumentation registered the module
+        """
+        data = io.BytesIO()
+        temporary_path: Optional[str] = None
+        try:
+            pickler = _CachePickler(data, self._shared_objects(tracer))
+            pickler.dump((code, tracer.get_known_data()))
+            pickler.dump_blocks()
+            os.makedirs(self._cache_dir, mode=0o700, exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self._cache_dir)
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(data.getvalue())
+            os.replace(temporary_path, self._path(module_name, key))
+        except Exception as error:  # pylint: disable=broad-except
+            self._logger.warning("Failed to cache instrumentation: %s", error)
+            if temporary_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(temporary_path)
@@ -14,20 +14,25 @@ from importlib.abc import FileLoader, MetaPathFinder
 from importlib.machinery import ModuleSpec, SourceFileLoader
 from inspect import isclass
 from types import CodeType
-from typing import List, cast
+from typing import List, Optional, cast
 
 import pynguin.configuration as config
+import pynguin.utils.statistics.statistics as stat
 from pynguin.instrumentation.instrumentation import (
     BranchCoverageInstrumentation,
     DynamicSeedingInstrumentation,
     Instrumentation,
 )
+from pynguin.instrumentation.instrumentationcache import InstrumentationCache
 from pynguin.testcase.execution.executiontracer import ExecutionTracer
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 
 class InstrumentationLoader(SourceFileLoader):
     """A loader that instruments the module after execution."""
 
+    _logger = logging.getLogger(__name__)
+
     def __init__(self, fullname, path, tracer: ExecutionTracer):
         super().__init__(fullname, path)
         self._tracer = tracer
@@ -47,16 +52,45 @@ class InstrumentationLoader(SourceFileLoader):
         Returns:
             The modules code blocks
         """
+        cache: Optional[InstrumentationCache] = None
+        if config.configuration.execution.instrumentation_cache_dir is not None:
+            cache = InstrumentationCache(
+                config.configuration.execution.instrumentation_cache_dir
+            )
+            key = InstrumentationCache.key(
+                self.get_data(self.get_filename(fullname)),
+                (
+                    config.configuration.execution.adaptive_instrumentation,
+                    config.configuration.seeding.dynamic_constant_seeding,
+                ),
+            )
+            cached = cache.load(fullname, key, self._tracer)
+            if cached is not None:
+                # No control flow is analysed for cached code.
+                stat.track_output_variable(RuntimeVariable.AnalysisTime, 0.0)
+                return cached
+
         to_instrument = cast(CodeType, super().get_code(fullname))
         assert to_instrument, "Failed to get code object of module."
-        instrumentations: List[Instrumentation] = [
-            BranchCoverageInstrumentation(self._tracer)
-        ]
+        branch_coverage_instrumentation = BranchCoverageInstrumentation(
+            self._tracer, config.configuration.execution.adaptive_instrumentation
+        )
+        instrumentations: List[Instrumentation] = [branch_coverage_instrumentation]
         if config.configuration.seeding.dynamic_constant_seeding:
             instrumentations.append(DynamicSeedingInstrumentation())
 
         for instrumentation in instrumentations:
             to_instrument = instrumentation.instrument_module(to_instrument)
+        self._logger.info(
+            "Analysed control flow of %s in %.3f s",
+            fullname,
+            branch_coverage_instrumentation.analysis_time,
+        )
+        stat.track_output_variable(
+            RuntimeVariable.AnalysisTime, branch_coverage_instrumentation.analysis_time
+        )
+        if cache is not None:
+            cache.store(fullname, key, to_instrument, self._tracer)
         return to_instrument
 
 
@@ -7,19 +7,152 @@
 """Provides a test cluster."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set, Type
+from bisect import bisect_right
+from math import inf
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
 from typing_inspect import get_args, is_union_type
 
+import pynguin.configuration as config
 from pynguin.utils import randomness, type_utils
 from pynguin.utils.exceptions import ConstructionFailedException
-from pynguin.utils.generic.genericaccessibleobject import GenericAccessibleObject
+from pynguin.utils.generic.genericaccessibleobject import (
+    GenericAccessibleObject,
+    GenericCallableAccessibleObject,
+)
 from pynguin.utils.type_utils import COLLECTIONS, PRIMITIVES
 
 
+def _is_created_directly(type_: Optional[Type]) -> bool:
+    """Checks whether values of a type are created without a generator.
+
+    Primitives and collections are created directly.  A concrete type is selected
+    randomly for unknown types, Any, and unions.  The elements of a collection
+    might be omitted, thus, they are not considered.
+
+    Args:
+        type_: The type of a value
+
+    Returns:
+        Whether or not values of the type are created without a generator
+    """
+    return (
+        type_utils.is_type_unknown(type_)
+        or type_ == Any
+        or is_union_type(type_)
+        or type_utils.is_primitive_type(type_)
+        or type_utils.is_collection_type(type_)
+    )
+
+
+def _get_required_levels(type_: Optional[Type], levels: Dict[Type, float]) -> float:
+    """Provides the number of recursion levels that are required to create a value
+    of the given type.
+
+    Args:
+        type_: The type of the value
+        levels: The required levels of the types that are created by generators
+
+    Returns:
+        The number of required levels, -inf if the value is created directly, or
+        inf if it cannot be created
+    """
+    if _is_created_directly(type_):
+        return -inf
+    assert type_ is not None
+    return levels.get(type_, inf)
+
+
+def _get_generator_levels(
+    generator: GenericAccessibleObject, levels: Dict[Type, float]
+) -> float:
+    """Provides the number of recursion levels that are required to create a value
+    by the given generator.
+
+    Creating a value at recursion depth d adds the generator at depth d + 1, which
+    fails if the maximum recursion depth is exceeded.  The callee of a method or
+    a field is created at depth d + 1, the parameters of a callable at depth d + 2.
+
+    Args:
+        generator: The generator
+        levels: The required levels of the types that are created by generators
+
+    Returns:
+        The number of required levels, or inf if the generator cannot be used
+    """
+    required = 1.0
+    if generator.is_method() or generator.is_field():
+        required = max(required, 1 + _get_required_levels(generator.owner, levels))
+    if isinstance(generator, GenericCallableAccessibleObject):
+        for parameter_type in generator.inferred_signature.parameters.values():
+            required = max(required, 2 + _get_required_levels(parameter_type, levels))
+    return required
+
+
+class _TestClusterIndex:  # pylint: disable=too-few-public-methods
+    """An index of a test cluster, from which random accessibles are selected.
+
+    The accessibles are stored in tuples, such that they can be selected without
+    copying them.  The generators of every type are ordered by the number of
+    recursion levels they require to create a value, assuming that every
+    parameter value is created as well instead of being reused or set to None.
+    The required levels of all types are computed by a fixed-point iteration,
+    thus, types that can only be created by a cycle of generators require
+    infinitely many levels.
+    """
+
+    def __init__(self, cluster: TestCluster) -> None:
+        self.accessible_objects_under_test: Tuple[GenericAccessibleObject, ...] = tuple(
+            cluster.accessible_objects_under_test
+        )
+        self.modifiers: Dict[Type, Tuple[GenericAccessibleObject, ...]] = {
+            type_: tuple(modifiers) for type_, modifiers in cluster.modifiers.items()
+        }
+        self.generatable_types: Tuple[Type, ...] = (
+            tuple(cluster.generators.keys()) + tuple(PRIMITIVES) + tuple(COLLECTIONS)
+        )
+
+        required_levels: Dict[Type, float] = {}
+        changed = True
+        while changed:
+            changed = False
+            for type_, type_generators in cluster.generators.items():
+                required = min(
+                    _get_generator_levels(generator, required_levels)
+                    for generator in type_generators
+                )
+                if required < required_levels.get(type_, inf):
+                    required_levels[type_] = required
+                    changed = True
+
+        # For every type: its generators and their required levels in ascending
+        # order of the levels.
+        self.generators: Dict[
+            Type, Tuple[Tuple[GenericAccessibleObject, ...], Tuple[float, ...]]
+        ] = {}
+        for type_, type_generators in cluster.generators.items():
+            ordered = sorted(
+                (
+                    (generator, _get_generator_levels(generator, required_levels))
+                    for generator in type_generators
+                ),
+                key=itemgetter(1),
+            )
+            self.generators[type_] = (
+                tuple(generator for generator, _ in ordered),
+                tuple(levels for _, levels in ordered),
+            )
+
+
 class TestCluster:
     """A test cluster which contains all methods/constructors/functions
     and all required transitive dependencies.
+
+    Once the cluster is complete, it is frozen, i.e., it must not be modified
+    anymore.  Random accessibles are selected from an index of the cluster, which
+    is built when the cluster is frozen.  Clusters that are not frozen rebuild the
+    index after they were modified.
     """
 
     def __init__(self):
@@ -27,6 +160,34 @@ class TestCluster:
         self._generators: Dict[Type, Set[GenericAccessibleObject]] = {}
         self._modifiers: Dict[Type, Set[GenericAccessibleObject]] = {}
         self._accessible_objects_under_test: Set[GenericAccessibleObject] = set()
+        self._frozen = False
+        self._index: Optional[_TestClusterIndex] = None
+
+    def freeze(self) -> None:
+        """Freezes the cluster and builds its index.
+
+        The cluster must not be modified afterwards.
+        """
+        self._frozen = True
+        self._get_index()
+
+    @property
+    def frozen(self) -> bool:
+        """Whether or not the cluster is frozen.
+
+        Returns:
+            Whether or not the cluster is frozen
+        """
+        return self._frozen
+
+    def _get_index(self) -> _TestClusterIndex:
+        if self._index is None:
+            self._index = _TestClusterIndex(self)
+        return self._index
+
+    def _modify(self) -> None:
+        assert not self._frozen, "A frozen test cluster must not be modified"
+        self._index = None
 
     def add_generator(self, generator: GenericAccessibleObject) -> None:
         """Add the given accessible as a generator.
@@ -36,6 +197,7 @@ class TestCluster:
         Args:
             generator: The accessible object
         """
+        self._modify()
         type_ = generator.generated_type()
         if (
             type_ is None
@@ -54,6 +216,7 @@ class TestCluster:
         Args:
             obj: The accessible object
         """
+        self._modify()
         self._accessible_objects_under_test.add(obj)
 
     def add_modifier(self, type_: Type, obj: GenericAccessibleObject) -> None:
@@ -66,6 +229,7 @@ class TestCluster:
             type_: The type that can be modified
             obj: The accessible that can modify
         """
+        self._modify()
         if type_ in self._modifiers:
             self._modifiers[type_].add(obj)
         else:
@@ -103,6 +267,34 @@ class TestCluster:
             return self._generators[for_type]
         return set()
 
+    def get_feasible_generators_for(
+        self, for_type: Type, recursion_depth: int
+    ) -> Tuple[GenericAccessibleObject, ...]:
+        """Retrieve the generators for the given type that can create a value when
+        requested at the given recursion depth.
+
+        A generator is feasible if the maximum recursion depth suffices to create
+        all values it requires, assuming that no value is reused or set to None.
+
+        Args:
+            for_type: The type we want to have the generators for
+            recursion_depth: The recursion depth at which the value is requested
+
+        Returns:
+            The feasible generators for the type in ascending order of their
+            required recursion levels
+        """
+        entry = self._get_index().generators.get(for_type)
+        if entry is None:
+            return ()
+        generators, levels = entry
+        return generators[
+            : bisect_right(
+                levels,
+                config.configuration.test_creation.max_recursion - recursion_depth,
+            )
+        ]
+
     def get_modifiers_for(self, for_type: Type) -> Set[GenericAccessibleObject]:
         """Get all known modifiers of a type.
 
@@ -142,9 +334,10 @@ class TestCluster:
         Returns:
             A random accessible
         """
-        if self.num_accessible_objects_under_test() == 0:
+        accessible_objects = self._get_index().accessible_objects_under_test
+        if len(accessible_objects) == 0:
             return None
-        return randomness.choice(list(self._accessible_objects_under_test))
+        return randomness.choice(accessible_objects)
 
     def get_random_call_for(self, type_: Type) -> GenericAccessibleObject:
         """Get a random modifier for the given type.
@@ -158,10 +351,10 @@ class TestCluster:
         Raises:
             ConstructionFailedException: if no modifiers for the type exist
         """
-        accessible_objects = self.get_modifiers_for(type_)
+        accessible_objects = self._get_index().modifiers.get(type_, ())
         if len(accessible_objects) == 0:
             raise ConstructionFailedException("No modifiers for " + str(type_))
-        return randomness.choice(list(accessible_objects))
+        return randomness.choice(accessible_objects)
 
     def get_all_generatable_types(self) -> List[Type]:
         """Provides all types that can be generated, including primitives
@@ -170,10 +363,16 @@ class TestCluster:
         Returns:
             A list of all types that can be generated
         """
-        generatable = list(self._generators.keys())
-        generatable.extend(PRIMITIVES)
-        generatable.extend(COLLECTIONS)
-        return generatable
+        return list(self._get_index().generatable_types)
+
+    def get_random_generatable_type(self) -> Type:
+        """Provides a random type that can be generated, including primitives and
+        collections.
+
+        Returns:
+            A random type that can be generated
+        """
+        return randomness.choice(self._get_index().generatable_types)
 
     def select_concrete_type(self, select_from: Optional[Type]) -> Optional[Type]:
         """Select a concrete type from the given type.
@@ -188,7 +387,7 @@ class TestCluster:
             An optional type
         """
         if select_from == Any:
-            return randomness.choice(self.get_all_generatable_types())
+            return self.get_random_generatable_type()
         if is_union_type(select_from):
             possible_types = get_args(select_from)
             if possible_types is not None and len(possible_types) > 0:
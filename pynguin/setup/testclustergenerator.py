@@ -108,6 +108,7 @@ class TestClusterGenerator:  # pylint: disable=too-few-public-methods
             self._test_cluster.add_accessible_object_under_test(generic_function)
             self._add_callable_dependencies(generic_function, 1)
         self._resolve_dependencies_recursive()
+        self._test_cluster.freeze()
         return self._test_cluster
 
     def _add_callable_dependencies(
@@ -47,28 +47,39 @@ class DefaultTestCase(tc.TestCase):
     ) -> vr.VariableReference:
         if position == -1:
             self._statements.append(statement)
+            self._index_position(len(self._statements) - 1)
         else:
             self._statements.insert(position, statement)
+            self._statements_changed()
         return statement.ret_val
 
+    def _statements_changed(self) -> None:
+        """Discards the indices of the statements after statements were inserted,
+        removed, or replaced."""
+        self._positions.clear()
+        self.invalidate_object_index()
+
     def add_statements(self, statements: List[stmt.Statement]) -> None:
-        self._statements.extend(statements)
+        for statement in statements:
+            self.add_statement(statement)
 
     def append_test_case(self, test_case: tc.TestCase) -> None:
         size = self.size()
         for statement in test_case.statements:
-            self._statements.append(statement.clone(self, size))
+            self.add_statement(statement.clone(self, size))
 
     def remove(self, position: int) -> None:
         self._logger.debug("Removing statement at position %d", position)
         if position >= self.size():
             return
         del self._statements[position]
+        self._statements_changed()
 
     def chop(self, pos: int) -> None:
         assert pos >= 0
         while len(self._statements) > pos + 1:
             del self._statements[-1]
+        self._statements_changed()
 
     def contains(self, statement: stmt.Statement) -> bool:
         return statement in self._statements
@@ -82,6 +93,7 @@ class DefaultTestCase(tc.TestCase):
     ) -> vr.VariableReference:
         assert 0 <= position < len(self._statements)
         self._statements[position] = statement
+        self._statements_changed()
         return statement.ret_val
 
     def has_statement(self, position: int) -> bool:
@@ -91,7 +103,7 @@ class DefaultTestCase(tc.TestCase):
         test_case = DefaultTestCase()
         for statement in self._statements:
             copy = statement.clone(test_case)
-            test_case._statements.append(copy)
+            test_case.add_statement(copy)
             copy.assertions = statement.copy_assertions(test_case, 0)
         test_case._id = self._id_generator.inc()
         return test_case
@@ -100,15 +112,21 @@ class DefaultTestCase(tc.TestCase):
         dependencies = set()
 
         # TODO(fk) a variable will be a dependency of itself?!
-        dependent_stmts = {self.get_statement(var.get_statement_position())}
-        for idx in range(var.get_statement_position(), -1, -1):
-            new_stmts = set()
-            for statement in dependent_stmts:
-                if statement.references(self.get_statement(idx).ret_val):
-                    new_stmts.add(self.get_statement(idx))
-                    dependencies.add(self.get_statement(idx).ret_val)
-                    break
-            dependent_stmts.update(new_stmts)
+        # Walk the statements backwards and collect the positions of the variables
+        # that are used by the statements on which var depends.
+        position = var.get_statement_position()
+        used_positions = {
+            reference.get_statement_position()
+            for reference in self.get_statement(position).get_variable_references()
+        }
+        for idx in range(position, -1, -1):
+            if idx in used_positions:
+                statement = self.get_statement(idx)
+                dependencies.add(statement.ret_val)
+                used_positions.update(
+                    reference.get_statement_position()
+                    for reference in statement.get_variable_references()
+                )
 
         return dependencies
 
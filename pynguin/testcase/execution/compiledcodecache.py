@@ -0,0 +1,14 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides a cache for the compiled code of statements."""
+from types import CodeType
+from typing import Hashable
+
+from pynguin.utils.lrucache import LRUCache
+
+# A bounded cache that maps statement fingerprints to compiled code objects.
+CompiledCodeCache = LRUCache[Hashable, CodeType]
@@ -7,11 +7,14 @@
 """Provides an execution context that can be used when executing test cases."""
 import ast
 import sys
-from types import ModuleType
-from typing import Any, Dict, Optional
+from types import CodeType, ModuleType
+from typing import Any, Dict, List, Optional
 
+import pynguin.testcase.execution.compiledcodecache as ccc
 import pynguin.testcase.statement_to_ast as stmt_to_ast
+import pynguin.testcase.statement_to_fingerprint as stmt_to_fp
 import pynguin.testcase.statements.statement as stmt
+import pynguin.testcase.testcase as tc
 import pynguin.testcase.variable.variablereference as vr
 from pynguin.utils.namingscope import NamingScope
 
@@ -77,21 +80,138 @@ class ExecutionContext:
         Returns:
             An executable ast node.
         """
+        return ExecutionContext._wrap_node_in_module(self._create_ast_node(statement))
+
+    def executable_node_for_test_case(
+        self, test_case: tc.TestCase, start: int = 0, stop: Optional[int] = None
+    ) -> ast.Module:
+        """Transforms the statements of the given test case in an executable ast node.
+
+        The node of each statement starts in the line that corresponds to the
+        position of the statement in the test case, counting from one, such that
+        the line number of a traceback identifies the failing statement.
+
+        Args:
+            test_case: The test case whose statements should be converted.
+            start: The index of the first statement that should be converted.
+            stop: The index after the last statement that should be converted, or
+                None to convert all statements after start.
+
+        Returns:
+            An executable ast node.
+        """
+        nodes: List[ast.stmt] = []
+        for idx, statement in enumerate(test_case.statements[start:stop], start):
+            node = ast.fix_missing_locations(self._create_ast_node(statement))
+            nodes.append(ast.increment_lineno(node, idx))
+        return ast.Module(body=nodes, type_ignores=[])
+
+    def executable_code_for(
+        self,
+        statement: stmt.Statement,
+        code_cache: ccc.CompiledCodeCache,
+    ) -> CodeType:
+        """Provides the compiled code of the given statement.
+
+        The code is looked up in the given cache by the fingerprint of the statement,
+        which includes the names of the used variables and modules in this context.
+        Only if the cache does not contain the code, the statement is transformed
+        into an AST node and compiled.
+
+        Args:
+            statement: The statement that should be converted.
+            code_cache: The cache of compiled code objects
+
+        Returns:
+            The executable code of the statement.
+        """
+        fingerprint = self._fingerprint(statement)
+        if (code := code_cache.get(fingerprint)) is None:
+            code = compile(self.executable_node_for(statement), "<ast>", "exec")
+            code_cache.put(fingerprint, code)
+        return code
+
+    def executable_code_for_test_case(
+        self,
+        test_case: tc.TestCase,
+        code_cache: ccc.CompiledCodeCache,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> CodeType:
+        """Provides the compiled code of the statements of the given test case.
+
+        The code is looked up in the given cache by the fingerprints of the
+        statements.  See executable_node_for_test_case for the line numbers.
+
+        Args:
+            test_case: The test case whose statements should be converted.
+            code_cache: The cache of compiled code objects
+            start: The index of the first statement that should be converted.
+            stop: The index after the last statement that should be converted, or
+                None to convert all statements after start.
+
+        Returns:
+            The executable code of the statements.
+        """
+        fingerprint = (
+            start,
+            tuple(
+                self._fingerprint(statement)
+                for statement in test_case.statements[start:stop]
+            ),
+        )
+        if (code := code_cache.get(fingerprint)) is None:
+            code = compile(
+                self.executable_node_for_test_case(test_case, start, stop),
+                "<ast>",
+                "exec",
+            )
+            code_cache.put(fingerprint, code)
+        return code
+
+    def fingerprints_for(self, test_case: tc.TestCase) -> List[Any]:
+        """Provides the fingerprints of the statements of the given test case.
+
+        A fingerprint identifies the code of a statement, including the names of
+        the used variables and modules in this context.  Thus, two test cases share
+        a prefix of fingerprints iff they share the code of this prefix.
+
+        Args:
+            test_case: The test case whose statements should be fingerprinted.
+
+        Returns:
+            The fingerprints of the statements.
+        """
+        return [self._fingerprint(statement) for statement in test_case.statements]
+
+    def _create_ast_node(self, statement: stmt.Statement) -> ast.stmt:
         modules_before = len(self._modules_aliases.known_name_indices)
         visitor = stmt_to_ast.StatementToAstVisitor(
             self._modules_aliases, self._variable_names
         )
         statement.accept(visitor)
+        self._update_global_namespace(modules_before)
+        assert (
+            len(visitor.ast_nodes) == 1
+        ), "Expected statement to produce exactly one ast node"
+        return visitor.ast_nodes[0]
+
+    def _fingerprint(self, statement: stmt.Statement) -> Any:
+        modules_before = len(self._modules_aliases.known_name_indices)
+        visitor = stmt_to_fp.StatementToFingerprintVisitor(
+            self._modules_aliases, self._variable_names
+        )
+        statement.accept(visitor)
+        self._update_global_namespace(modules_before)
+        return visitor.fingerprint
+
+    def _update_global_namespace(self, modules_before: int) -> None:
         if modules_before != len(self._modules_aliases.known_name_indices):
             # new module added
             # TODO(fk) cleaner solution?
             self._global_namespace = ExecutionContext._create_global_namespace(
                 self._modules_aliases
             )
-        assert (
-            len(visitor.ast_nodes) == 1
-        ), "Expected statement to produce exactly one ast node"
-        return ExecutionContext._wrap_node_in_module(visitor.ast_nodes[0])
 
     @staticmethod
     def _wrap_node_in_module(node: ast.stmt) -> ast.Module:
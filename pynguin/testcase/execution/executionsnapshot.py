@@ -0,0 +1,165 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides snapshots of the state of partially executed test cases."""
+import dataclasses
+import typing
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from pynguin.testcase.execution.executiontrace import ExecutionTrace
+
+
+@dataclasses.dataclass(frozen=True)
+class ExecutionSnapshot:
+    """The state after executing a prefix of the statements of a test case."""
+
+    local_namespace: Dict[str, Any]
+    """A copy of the local namespace of the execution context."""
+
+    execution_trace: ExecutionTrace
+    """A copy of the execution trace of the executed statements."""
+
+
+class ExecutionSnapshotCache:
+    """A bounded cache of snapshots, which are keyed by the executed statement
+    prefix.
+
+    A prefix is looked up by a key that chains the fingerprints of its statements,
+    such that the keys of all prefixes of a test case are computed in a single pass.
+    As different prefixes might have the same key, the fingerprints of a found
+    prefix are compared as well.  The snapshots that were taken during the
+    execution of a test case are cached together.  If the cache is full, the
+    snapshots of the least recently used test case are evicted.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Create a new cache.
+
+        Args:
+            max_size: The maximum number of test cases whose snapshots are cached
+        """
+        assert max_size >= 0, "Cache size must not be negative"
+        self._max_size = max_size
+        # For every prefix key: the key of the test case that took the snapshot,
+        # the fingerprints of that test case, and the snapshot.
+        self._snapshots: Dict[
+            Hashable, Tuple[Hashable, Tuple[Hashable, ...], ExecutionSnapshot]
+        ] = {}
+        self._test_cases: typing.OrderedDict[Hashable, List[Hashable]] = OrderedDict()
+        self._reused_statements = 0
+
+    @staticmethod
+    def prefix_keys(fingerprints: Iterable[Hashable]) -> List[Hashable]:
+        """Computes the keys of all prefixes of the given statements.
+
+        Args:
+            fingerprints: The fingerprints of the statements of a test case
+
+        Returns:
+            The keys of the prefixes, where the key at index i identifies the
+            prefix of length i + 1.
+        """
+        keys: List[Hashable] = []
+        key: Hashable = ()
+        for length, fingerprint in enumerate(fingerprints, start=1):
+            key = length, hash((key, fingerprint))
+            keys.append(key)
+        return keys
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores snapshots at all.
+
+        Returns:
+            Whether the maximum size of the cache is positive
+        """
+        return self._max_size > 0
+
+    def get_longest_prefix(
+        self, fingerprints: Sequence[Hashable]
+    ) -> Tuple[int, Optional[ExecutionSnapshot]]:
+        """Provides the snapshot of the longest cached prefix of a test case.
+
+        Args:
+            fingerprints: The fingerprints of the statements of a test case
+
+        Returns:
+            The length of the longest cached prefix and its snapshot, or zero and
+            None, if no prefix is cached.
+        """
+        prefix_keys = self.prefix_keys(fingerprints)
+        for length in range(len(prefix_keys), 0, -1):
+            if (entry := self._snapshots.get(prefix_keys[length - 1])) is None:
+                continue
+            test_case_key, cached_fingerprints, snapshot = entry
+            if cached_fingerprints[:length] == tuple(fingerprints[:length]):
+                self._test_cases.move_to_end(test_case_key)
+                return length, snapshot
+        return 0, None
+
+    def put(
+        self,
+        fingerprints: Sequence[Hashable],
+        snapshots: Mapping[int, ExecutionSnapshot],
+    ) -> None:
+        """Caches the snapshots that were taken during the execution of a test case.
+
+        Args:
+            fingerprints: The fingerprints of the statements of the test case
+            snapshots: The state after executing a prefix, by the prefix length
+        """
+        if self._max_size == 0 or not snapshots:
+            return
+        prefix_keys = self.prefix_keys(fingerprints)
+        shared_fingerprints = tuple(fingerprints)
+        test_case_key = prefix_keys[-1]
+        keys = self._test_cases.setdefault(test_case_key, [])
+        self._test_cases.move_to_end(test_case_key)
+        for length, snapshot in snapshots.items():
+            key = prefix_keys[length - 1]
+            self._snapshots[key] = test_case_key, shared_fingerprints, snapshot
+            keys.append(key)
+        while len(self._test_cases) > self._max_size:
+            evicted, evicted_keys = self._test_cases.popitem(last=False)
+            for key in evicted_keys:
+                # A prefix shared with a more recent test case belongs to the latter.
+                if (entry := self._snapshots.get(key)) is not None and (
+                    entry[0] == evicted
+                ):
+                    del self._snapshots[key]
+
+    def record_reuse(self, statements: int) -> None:
+        """Records that the execution of some statements was skipped, because the
+        state after them was restored from a snapshot.
+
+        Args:
+            statements: The number of skipped statement executions
+        """
+        self._reused_statements += statements
+
+    @property
+    def reused_statements(self) -> int:
+        """Provides the number of statement executions that were skipped, because
+        the state after them was restored from a snapshot.
+
+        Returns:
+            The number of reused statement executions
+        """
+        return self._reused_statements
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
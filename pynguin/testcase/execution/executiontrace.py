@@ -7,9 +7,200 @@
 """Provides an execution trace"""
 from __future__ import annotations
 
+import operator
+from array import array
 from dataclasses import dataclass, field
 from math import inf
-from typing import Dict, Set
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    Iterator,
+    List,
+    MutableMapping,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T", int, float)  # pylint:disable=invalid-name
+
+
+# The ancestors are the abstract collection classes that MutableMapping builds on.
+class PredicateValues(MutableMapping[int, T]):  # pylint: disable=too-many-ancestors
+    """A mapping from predicate ids to values, which is backed by an array.
+
+    Predicate ids are dense integers, which are handed out by the execution tracer.
+    Thus, the value of a predicate is stored at the index of its id, and predicates
+    without a value hold a default value, which is not a valid value.  The ids of
+    the predicates with a value are kept in insertion order, such that sparse
+    mappings can be merged without scanning the whole array.
+    """
+
+    # A merge is computed element-wise over the whole array, if at least this share
+    # of the predicates of the other mapping has a value.
+    _DENSE_MERGE_THRESHOLD = 0.25
+
+    def __init__(self, typecode: str, default: T, size: int = 0) -> None:
+        """Creates a new mapping.
+
+        Args:
+            typecode: The type code of the array that stores the values
+            default: The value that marks predicates without a value
+            size: The number of predicates for which space is allocated
+        """
+        self._default: T = default
+        self._values: array = array(typecode, [default]) * size
+        self._keys: List[int] = []
+
+    @property
+    def values_array(self) -> array:
+        """Provides the array of values, which holds the default value for all
+        predicates without a value.  Must not be modified.
+
+        Returns:
+            The array of values
+        """
+        return self._values
+
+    def reserve(self, size: int) -> None:
+        """Allocates space for the given number of predicates.
+
+        Args:
+            size: The number of predicates for which space is allocated
+        """
+        if size > len(self._values):
+            self._values.extend(
+                array(self._values.typecode, [self._default])
+                * (size - len(self._values))
+            )
+
+    def _merge(self, other: PredicateValues[T], function: Callable[[T, T], T]) -> None:
+        """Merges the values of the other mapping into this mapping.
+
+        Args:
+            other: The mapping whose values are merged into this mapping
+            function: The element-wise merge function, which has to map the default
+                value and a value to the value
+        """
+        other_values = other._values
+        self.reserve(len(other_values))
+        values = self._values
+        default = self._default
+        if len(other._keys) >= self._DENSE_MERGE_THRESHOLD * len(other_values):
+            self._keys.extend(key for key in other._keys if values[key] == default)
+            values[: len(other_values)] = array(
+                values.typecode, map(function, values, other_values)
+            )
+            return
+        for key in other._keys:
+            current = values[key]
+            if current == default:
+                self._keys.append(key)
+                values[key] = other_values[key]
+            else:
+                values[key] = function(current, other_values[key])
+
+    def get_fingerprint(self) -> bytes:
+        """Provides a fingerprint of the values, which is equal for equal mappings.
+
+        The fingerprint is the raw content of the array up to the largest predicate
+        with a value, such that it does not depend on the allocated space.
+
+        Returns:
+            The fingerprint of the values
+        """
+        return self._values[: max(self._keys, default=-1) + 1].tobytes()
+
+    def __getitem__(self, key: int) -> T:
+        if 0 <= key < len(self._values):
+            value = self._values[key]
+            if value != self._default:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: int, default: Any = None) -> Any:
+        if 0 <= key < len(self._values):
+            value = self._values[key]
+            if value != self._default:
+                return value
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return (
+            isinstance(key, int)
+            and 0 <= key < len(self._values)
+            and self._values[key] != self._default
+        )
+
+    def __setitem__(self, key: int, value: T) -> None:
+        assert key >= 0, "Predicate ids cannot be negative"
+        if value == self._default:
+            self.pop(key, None)
+            return
+        self.reserve(key + 1)
+        if self._values[key] == self._default:
+            self._keys.append(key)
+        self._values[key] = value
+
+    def __delitem__(self, key: int) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._values[key] = self._default
+        self._keys.remove(key)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+
+class PredicateCounts(PredicateValues[int]):
+    """Counts how often each predicate was executed."""
+
+    def __init__(self, size: int = 0) -> None:
+        """Creates a new mapping without any executed predicates.
+
+        Args:
+            size: The number of predicates for which space is allocated
+        """
+        super().__init__("Q", 0, size)
+
+    def merge(self, other: PredicateCounts) -> None:
+        """Adds the counts of the other mapping to the counts of this mapping.
+
+        Args:
+            other: The mapping whose counts are added
+        """
+        self._merge(other, operator.add)
+
+
+class PredicateDistances(PredicateValues[float]):
+    """Stores the minimal branch distance of each predicate.
+
+    An infinite distance is stored like a missing distance, which does not
+    change the fitness, because a distance is normalised to 1.0 in both cases.
+    """
+
+    def __init__(self, size: int = 0) -> None:
+        """Creates a new mapping without any distances.
+
+        Args:
+            size: The number of predicates for which space is allocated
+        """
+        super().__init__("d", inf, size)
+
+    def merge(self, other: PredicateDistances) -> None:
+        """Merges the distances of the other mapping.  The minimum distance wins.
+
+        Args:
+            other: The mapping whose distances are merged
+        """
+        self._merge(other, min)
 
 
 @dataclass()
@@ -17,9 +208,25 @@ class ExecutionTrace:
     """Stores trace information about the execution."""
 
     executed_code_objects: Set[int] = field(default_factory=set)
-    executed_predicates: Dict[int, int] = field(default_factory=dict)
-    true_distances: Dict[int, float] = field(default_factory=dict)
-    false_distances: Dict[int, float] = field(default_factory=dict)
+    executed_predicates: PredicateCounts = field(default_factory=PredicateCounts)
+    true_distances: PredicateDistances = field(default_factory=PredicateDistances)
+    false_distances: PredicateDistances = field(default_factory=PredicateDistances)
+
+    @staticmethod
+    def for_predicates(number_of_predicates: int) -> ExecutionTrace:
+        """Creates an empty trace, which has space for the given number of predicates.
+
+        Args:
+            number_of_predicates: The number of existing predicates
+
+        Returns:
+            An empty execution trace
+        """
+        return ExecutionTrace(
+            executed_predicates=PredicateCounts(number_of_predicates),
+            true_distances=PredicateDistances(number_of_predicates),
+            false_distances=PredicateDistances(number_of_predicates),
+        )
 
     def merge(self, other: ExecutionTrace) -> None:
         """Merge the values from the other trace.
@@ -28,18 +235,76 @@ class ExecutionTrace:
             other: Merges the other traces into this trace
         """
         self.executed_code_objects.update(other.executed_code_objects)
-        for key, value in other.executed_predicates.items():
-            self.executed_predicates[key] = self.executed_predicates.get(key, 0) + value
-        self._merge_min(self.true_distances, other.true_distances)
-        self._merge_min(self.false_distances, other.false_distances)
+        self.executed_predicates.merge(other.executed_predicates)
+        self.true_distances.merge(other.true_distances)
+        self.false_distances.merge(other.false_distances)
 
-    @staticmethod
-    def _merge_min(target: Dict[int, float], source: Dict[int, float]) -> None:
-        """Merge source into target. Minimum value wins.
+    def get_fingerprint(self) -> Tuple[FrozenSet[int], FrozenSet[int], bytes, bytes]:
+        """Provides a fingerprint of the trace, which is equal for equal traces.
+
+        The fingerprint consists of the executed code objects, the executed
+        predicates, and the distances of their branches.  The execution counts of
+        the predicates are not part of the fingerprint.
+
+        Returns:
+            The fingerprint of the trace
+        """
+        return (
+            frozenset(self.executed_code_objects),
+            frozenset(self.executed_predicates),
+            self.true_distances.get_fingerprint(),
+            self.false_distances.get_fingerprint(),
+        )
+
+    def reserve_predicates(self, number_of_predicates: int) -> None:
+        """Allocates space for the given number of predicates.
+
+        Args:
+            number_of_predicates: The number of existing predicates
+        """
+        self.executed_predicates.reserve(number_of_predicates)
+        self.true_distances.reserve(number_of_predicates)
+        self.false_distances.reserve(number_of_predicates)
+
+    def update_predicate(
+        self, predicate: int, distance_true: float, distance_false: float
+    ) -> bool:
+        """Records an execution of a predicate with the given branch distances.
+
+        This is called for every predicate that is executed, thus, it writes
+        directly into the arrays of the trace instead of using the mapping
+        interface.
 
         Args:
-            target: the target to merge the values in
-            source: the source of the merge
+            predicate: The id of the executed predicate
+            distance_true: The distance to the true branch
+            distance_false: The distance to the false branch
+
+        Returns:
+            Whether both branches of the predicate were taken
         """
-        for key, value in source.items():
-            target[key] = min(target.get(key, inf), value)
+        # pylint: disable=protected-access
+        counts = self.executed_predicates._values
+        true_distances = self.true_distances._values
+        false_distances = self.false_distances._values
+        try:
+            count = counts[predicate]
+            current_true = true_distances[predicate]
+            current_false = false_distances[predicate]
+        except IndexError:
+            self.reserve_predicates(predicate + 1)
+            count = counts[predicate]
+            current_true = true_distances[predicate]
+            current_false = false_distances[predicate]
+        if count == 0:
+            self.executed_predicates._keys.append(predicate)
+        counts[predicate] = count + 1
+        if distance_true < current_true:
+            if current_true == inf:
+                self.true_distances._keys.append(predicate)
+            true_distances[predicate] = current_true = distance_true
+        if distance_false < current_false:
+            if current_false == inf:
+                self.false_distances._keys.append(predicate)
+            false_distances[predicate] = current_false = distance_false
+        return current_true == 0.0 and current_false == 0.0
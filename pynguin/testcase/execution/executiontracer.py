@@ -10,13 +10,16 @@ import logging
 import threading
 from math import inf
 from types import CodeType
-from typing import Any, Callable, Dict, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from bytecode import Compare
 from jellyfish import levenshtein_distance
 
 from pynguin.analyses.controlflow.cfg import CFG
-from pynguin.analyses.controlflow.controldependencegraph import ControlDependenceGraph
+from pynguin.analyses.controlflow.controldependencegraph import (
+    ApproachLevelIndex,
+    ControlDependenceGraph,
+)
 from pynguin.testcase.execution.executiontrace import ExecutionTrace
 from pynguin.utils.type_utils import (
     given_exception_matches,
@@ -42,6 +45,21 @@ class CodeObjectMetaData:
     # CDG of this Code Object
     cdg: ControlDependenceGraph
 
+    # Approach levels between the predicates of this Code Object, which are
+    # indexed once their ids are known
+    approach_levels: Optional[ApproachLevelIndex] = None
+
+    def get_approach_levels(self) -> ApproachLevelIndex:
+        """Provides the index of the approach levels, which is computed if it was
+        not computed during instrumentation.
+
+        Returns:
+            The index of the approach levels between the predicates
+        """
+        if self.approach_levels is None:
+            self.approach_levels = ApproachLevelIndex.compute(self.cdg)
+        return self.approach_levels
+
 
 @dataclasses.dataclass
 class PredicateMetaData:
@@ -131,6 +149,7 @@ class ExecutionTracer:
 
     def __init__(self) -> None:
         self._known_data = KnownData()
+        self._saturated_predicates = bytearray()
         # Contains the trace information that is generated when a module is imported
         self._import_trace = ExecutionTrace()
         self._init_trace()
@@ -152,6 +171,19 @@ class ExecutionTracer:
         """
         self._current_thread_ident = current
 
+    @property
+    def saturated_predicates(self) -> bytearray:
+        """Flags the predicates whose both branches were taken in the current trace.
+
+        Further executions of a saturated predicate cannot change the distances of
+        the trace, thus, instrumented code may skip reporting them.  The flags are
+        indexed by the predicate ids and cleared with the trace.
+
+        Returns:
+            The flags of the saturated predicates
+        """
+        return self._saturated_predicates
+
     @property
     def import_trace(self) -> ExecutionTrace:
         """The trace that was generated when the SUT was imported."""
@@ -174,9 +206,25 @@ class ExecutionTracer:
         reload of the SUT.
         """
         self._known_data = KnownData()
+        # Code that was instrumented before still refers to the old flags.
+        self._saturated_predicates = bytearray()
         self._import_trace = ExecutionTrace()
         self._init_trace()
 
+    def restore_known_data(self, known_data: KnownData) -> None:
+        """Restores the known data of previously instrumented code.
+
+        Replaces the known data of this tracer, such that code that was
+        instrumented for another tracer, e.g., in a previous run, can report to this
+        tracer.  Should only be called instead of instrumenting the code.
+
+        Args:
+            known_data: The known data about the instrumented code
+        """
+        self._known_data = known_data
+        self._saturated_predicates[:] = bytes(len(known_data.existing_predicates))
+        self._init_trace()
+
     def store_import_trace(self) -> None:
         """Stores the current trace as the import trace.
 
@@ -188,9 +236,12 @@ class ExecutionTracer:
 
     def _init_trace(self) -> None:
         """Create a new trace that only contains the trace data from the import."""
-        new_trace = ExecutionTrace()
+        new_trace = ExecutionTrace.for_predicates(
+            len(self._known_data.existing_predicates)
+        )
         new_trace.merge(self._import_trace)
         self._trace = new_trace
+        self._saturated_predicates[:] = bytes(len(self._saturated_predicates))
 
     def _is_disabled(self) -> bool:
         """Should we track anything?
@@ -268,6 +319,7 @@ class ExecutionTracer:
         predicate_id = len(self._known_data.existing_predicates)
         self._known_data.existing_predicates[predicate_id] = meta
         self._known_data.branch_less_code_objects.discard(meta.code_object_id)
+        self._saturated_predicates.append(0)
         return predicate_id
 
     def executed_compare_predicate(
@@ -379,11 +431,118 @@ class ExecutionTracer:
         self._trace.false_distances[predicate] = min(
             self._trace.false_distances.get(predicate, inf), distance_false
         )
+        if (
+            self._trace.true_distances.get(predicate) == 0.0
+            and self._trace.false_distances.get(predicate) == 0.0
+        ):
+            self._saturated_predicates[predicate] = 1
 
     def __repr__(self) -> str:
         return "ExecutionTracer"
 
 
+def _unsupported_compare(cmp_op: int) -> Callable[[Any, Any], Tuple[float, float]]:
+    def compute(value1, value2):
+        raise KeyError(cmp_op)
+
+    return compute
+
+
+def _distance_computations_by_op() -> List[Callable[[Any, Any], Tuple[float, float]]]:
+    """Provides the distance computations in a list that is indexed by the value of
+    their compare operation.
+
+    Values without a supported compare operation raise a KeyError, like the lookup
+    of the ExecutionTracer.
+
+    Returns:
+        The distance computations indexed by the values of the compare operations
+    """
+    computations = [
+        _unsupported_compare(value)
+        for value in range(max(cmp_op.value for cmp_op in Compare) + 1)
+    ]
+    # pylint: disable=protected-access
+    for cmp_op, computation in ExecutionTracer._DISTANCE_COMPUTATIONS.items():
+        computations[cmp_op.value] = computation
+    return computations
+
+
+class FastExecutionTracer(ExecutionTracer):
+    """An execution tracer with a low overhead per traced event.
+
+    Produces the same traces as the ExecutionTracer, but does not check its
+    invariants with assertions, looks up the current thread with the cheaper
+    threading.get_ident(), and only disables itself while it evaluates values of
+    the SUT that might run instrumented code.  Predicates are recorded by a
+    bound method of the current trace, which writes directly into the slots that
+    are reserved for every registered predicate.  It also flags the predicates
+    that become saturated.
+    """
+
+    # The distance computations indexed by the value of their compare operation,
+    # such that a lookup does not need to hash the enum member.
+    _DISTANCE_COMPUTATIONS_BY_OP = _distance_computations_by_op()
+
+    def _init_trace(self) -> None:
+        super()._init_trace()
+        self._update_predicate = self._trace.update_predicate
+
+    def register_predicate(self, meta: PredicateMetaData) -> int:
+        predicate_id = super().register_predicate(meta)
+        self._trace.reserve_predicates(predicate_id + 1)
+        return predicate_id
+
+    def executed_code_object(self, code_object_id: int) -> None:
+        if threading.get_ident() != self._current_thread_ident:
+            return
+        self._trace.executed_code_objects.add(code_object_id)
+
+    def executed_compare_predicate(
+        self, value1, value2, predicate: int, cmp_op: Compare
+    ) -> None:
+        if not self._enabled or threading.get_ident() != self._current_thread_ident:
+            return
+        # Comparing the values might call instrumented code of the SUT.
+        self._enabled = False
+        try:
+            computation = self._DISTANCE_COMPUTATIONS_BY_OP[cmp_op]
+            distance_true, distance_false = computation(value1, value2)
+        finally:
+            self._enabled = True
+        if self._update_predicate(predicate, distance_true, distance_false):
+            self._saturated_predicates[predicate] = 1
+
+    def executed_bool_predicate(self, value, predicate: int):
+        if not self._enabled or threading.get_ident() != self._current_thread_ident:
+            return
+        if value.__class__ is not bool:
+            # The truth value of an object might be computed by instrumented code.
+            self._enabled = False
+            try:
+                value = bool(value)
+            finally:
+                self._enabled = True
+        distance_true, distance_false = (0.0, 1.0) if value else (1.0, 0.0)
+        if self._update_predicate(predicate, distance_true, distance_false):
+            self._saturated_predicates[predicate] = 1
+
+    def executed_exception_match(self, err, exc, predicate: int):
+        if not self._enabled or threading.get_ident() != self._current_thread_ident:
+            return
+        self._enabled = False
+        try:
+            matches = given_exception_matches(err, exc)
+        finally:
+            self._enabled = True
+        distance_true, distance_false = (0.0, 1.0) if matches else (1.0, 0.0)
+        if self._update_predicate(predicate, distance_true, distance_false):
+            self._saturated_predicates[predicate] = 1
+
+    def __repr__(self) -> str:
+        return "FastExecutionTracer"
+
+
 def _eq(val1, val2) -> float:
     """Distance computation for '=='
 
@@ -0,0 +1,138 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides an executor that distributes test cases over worker processes."""
+import logging
+import multiprocessing
+import pickle  # nosec
+from multiprocessing.pool import Pool
+from typing import Iterable, Iterator, Optional
+
+import pynguin.testcase.execution.executionresult as res
+import pynguin.testcase.testcase as tc
+from pynguin.testcase.execution.executiontracer import ExecutionTracer
+from pynguin.testcase.execution.testcaseexecutor import TestCaseExecutor
+
+# The executor of a worker process.  It is created once, after the worker was forked,
+# and uses the worker's copy of the tracer and the instrumented SUT.
+_WORKER_EXECUTOR: Optional[TestCaseExecutor] = None
+
+
+def _initialise_worker(tracer: ExecutionTracer) -> None:
+    global _WORKER_EXECUTOR  # pylint: disable=global-statement
+    _WORKER_EXECUTOR = TestCaseExecutor(tracer)
+
+
+def _execute_in_worker(test_case: tc.TestCase) -> res.ExecutionResult:
+    assert _WORKER_EXECUTOR is not None, "Worker was not initialised"
+    result = _WORKER_EXECUTOR.execute(test_case)
+    _make_transferable(result)
+    return result
+
+
+def _make_transferable(result: res.ExecutionResult) -> None:
+    """Replaces exceptions that cannot be sent back to the main process.
+
+    Exceptions raised by the SUT are not necessarily picklable, e.g., if their
+    constructor requires additional arguments.  We only rely on the position of a
+    raised exception, thus we replace such exceptions by a placeholder.
+
+    Args:
+        result: the execution result whose exceptions are checked
+    """
+    for idx, exception in result.exceptions.items():
+        try:
+            pickle.loads(pickle.dumps(exception))  # nosec
+        except Exception:  # pylint: disable=broad-except
+            result.exceptions[idx] = RuntimeError(
+                f"{type(exception).__name__}: {exception}"
+            )
+
+
+class ParallelTestCaseExecutor(TestCaseExecutor):
+    """An executor that distributes batches of test cases over worker processes.
+
+    The workers are forked from the main process once the first batch is executed,
+    i.e., after the SUT was imported and instrumented.  Thus, every worker holds its
+    own instrumented copy of the SUT and of the execution tracer, and sends back
+    the execution results together with their execution traces.
+
+    Single test cases, as well as batches that need to be observed, are executed in
+    the main process, because observers have to inspect the objects created by the
+    test case.
+    """
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(self, tracer: ExecutionTracer, number_of_workers: int) -> None:
+        """Create new parallel test case executor.
+
+        Args:
+            tracer: the execution tracer
+            number_of_workers: the number of worker processes
+        """
+        super().__init__(tracer)
+        assert number_of_workers > 0, "Requires at least one worker"
+        self._number_of_workers = number_of_workers
+        self._pool: Optional[Pool] = None
+        self._shut_down = False
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Whether or not the platform allows to fork worker processes.
+
+        Returns:
+            Whether or not the platform allows to fork worker processes
+        """
+        return "fork" in multiprocessing.get_all_start_methods()
+
+    @property
+    def number_of_workers(self) -> int:
+        """Provides the number of worker processes.
+
+        Returns:
+            The number of worker processes
+        """
+        return self._number_of_workers
+
+    def execute_many(
+        self, test_cases: Iterable[tc.TestCase]
+    ) -> Iterator[res.ExecutionResult]:
+        test_cases = list(test_cases)
+        if self._shut_down or len(test_cases) < 2 or len(self._observers) > 0:
+            return super().execute_many(test_cases)
+        chunk_size = max(1, len(test_cases) // (4 * self._number_of_workers))
+        try:
+            return iter(
+                self._get_pool().map(
+                    _execute_in_worker, test_cases, chunksize=chunk_size
+                )
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            # Most likely, a test case could not be sent to the workers.
+            self._logger.debug("Failed to execute test cases in workers: %s", error)
+            return super().execute_many(test_cases)
+
+    def _get_pool(self) -> Pool:
+        if self._pool is None:
+            context = multiprocessing.get_context("fork")
+            self._pool = context.Pool(
+                processes=self._number_of_workers,
+                initializer=_initialise_worker,
+                initargs=(self._tracer,),
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Terminates the worker processes, if any were started.
+
+        All subsequent executions take place in the main process.
+        """
+        self._shut_down = True
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
@@ -6,19 +6,25 @@
 #
 """Provides an executor that executes generated sequences."""
 import contextlib
+import copy
 import logging
-import multiprocessing
 import os
+import queue
 import threading
-from typing import List, Optional
+from types import CodeType
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import astor
 
+import pynguin.configuration as config
+import pynguin.testcase.execution.compiledcodecache as ccc
 import pynguin.testcase.execution.executioncontext as ctx
 import pynguin.testcase.execution.executionobserver as eo
 import pynguin.testcase.execution.executionresult as res
+import pynguin.testcase.execution.executionsnapshot as es
 import pynguin.testcase.statements.statement as stmt
 import pynguin.testcase.testcase as tc
+from pynguin.testcase.execution.executiontrace import ExecutionTrace
 from pynguin.testcase.execution.executiontracer import ExecutionTracer
 
 
@@ -35,6 +41,14 @@ class TestCaseExecutor:
         """
         self._tracer = tracer
         self._observers: List[eo.ExecutionObserver] = []
+        self._code_cache = ccc.CompiledCodeCache(
+            config.configuration.execution.code_cache_size
+        )
+        self._snapshot_cache = es.ExecutionSnapshotCache(
+            config.configuration.execution.snapshot_cache_size
+        )
+        self._snapshot_interval = config.configuration.execution.snapshot_interval
+        assert self._snapshot_interval >= 1, "Snapshot interval must be positive"
 
     def add_observer(self, observer: eo.ExecutionObserver) -> None:
         """Add an execution observer.
@@ -53,6 +67,24 @@ class TestCaseExecutor:
         """
         return self._tracer
 
+    @property
+    def code_cache(self) -> ccc.CompiledCodeCache:
+        """Provide access to the cache of compiled statements.
+
+        Returns:
+            The cache of compiled statements
+        """
+        return self._code_cache
+
+    @property
+    def snapshot_cache(self) -> es.ExecutionSnapshotCache:
+        """Provide access to the cache of execution snapshots.
+
+        Returns:
+            The cache of execution snapshots
+        """
+        return self._snapshot_cache
+
     def execute(self, test_case: tc.TestCase) -> res.ExecutionResult:
         """Executes all statements of the given test case.
 
@@ -62,37 +94,92 @@ class TestCaseExecutor:
         Returns:
             Result of the execution
         """
-        with open(os.devnull, mode="w") as null_file:
-            with contextlib.redirect_stdout(null_file):
-                self._before_test_case_execution(test_case)
-                return_queue: multiprocessing.Queue = multiprocessing.Queue()
-                thread = threading.Thread(
-                    target=self._execute_test_case, args=(test_case, return_queue)
-                )
-                thread.start()
-                thread.join(timeout=len(test_case.statements))
-                if not thread.is_alive():
-                    result = return_queue.get()
-                else:
-                    result = res.ExecutionResult(timeout=True)
-                    self._logger.warning("Experienced timeout from test-case execution")
-                return_queue.close()
-                self._after_test_case_execution(test_case, result)
+        (result,) = self.execute_many([test_case])
         return result
 
+    def execute_many(
+        self, test_cases: Iterable[tc.TestCase]
+    ) -> Iterator[res.ExecutionResult]:
+        """Executes the given test cases one after another.
+
+        The setup is shared by all test cases of the batch, i.e., the standard
+        output is redirected to the same null device and a single worker thread
+        executes the test cases.  A new worker thread is only started if a test case
+        exceeded its timeout, because we cannot stop the thread that executes it.
+
+        Subclasses may use this entry point to execute the test cases of a batch
+        concurrently.
+
+        Args:
+            test_cases: the test cases that should be executed.
+
+        Yields:
+            The execution results, in the order of the given test cases
+        """
+        with open(os.devnull, mode="w") as null_file:
+            worker: Optional[Tuple[queue.Queue, queue.Queue]] = None
+            try:
+                for test_case in test_cases:
+                    if worker is None:
+                        worker = self._start_worker()
+                    tasks, results = worker
+                    with contextlib.redirect_stdout(null_file):
+                        self._before_test_case_execution(test_case)
+                        tasks.put(test_case)
+                        try:
+                            result = results.get(timeout=len(test_case.statements))
+                        except queue.Empty:
+                            # The stuck worker terminates once it is finished.
+                            tasks.put(None)
+                            worker = None
+                            result = res.ExecutionResult(timeout=True)
+                            self._logger.warning(
+                                "Experienced timeout from test-case execution"
+                            )
+                        self._after_test_case_execution(test_case, result)
+                    yield result
+            finally:
+                if worker is not None:
+                    worker[0].put(None)
+
+    def _start_worker(self) -> Tuple[queue.Queue, queue.Queue]:
+        """Starts a worker thread that executes test cases.
+
+        Returns:
+            The queue to pass test cases to the worker, and the queue that provides
+            the execution results.  Passing None to the worker terminates it.
+        """
+        tasks: queue.Queue = queue.Queue()
+        results: queue.Queue = queue.Queue()
+        thread = threading.Thread(
+            target=self._execute_test_cases, args=(tasks, results)
+        )
+        thread.start()
+        return tasks, results
+
+    def _execute_test_cases(self, tasks: queue.Queue, results: queue.Queue) -> None:
+        while (test_case := tasks.get()) is not None:
+            results.put(self._execute_test_case(test_case))
+
     def _before_test_case_execution(self, test_case: tc.TestCase) -> None:
         self._tracer.clear_trace()
         for observer in self._observers:
             observer.before_test_case_execution(test_case)
 
-    def _execute_test_case(
-        self,
-        test_case: tc.TestCase,
-        result_queue: multiprocessing.Queue,
-    ) -> None:
+    def _execute_test_case(self, test_case: tc.TestCase) -> res.ExecutionResult:
         result = res.ExecutionResult()
         exec_ctx = ctx.ExecutionContext()
         self.tracer.current_thread_ident = threading.currentThread().ident
+        if len(self._observers) == 0:
+            if (
+                config.configuration.execution.deterministic_sut
+                and self._snapshot_cache.enabled
+            ):
+                self._execute_statements_from_snapshot(test_case, exec_ctx, result)
+                return result
+            if config.configuration.execution.whole_test_case_compilation:
+                self._execute_statements_at_once(test_case, exec_ctx, result)
+                return result
         for idx, statement in enumerate(test_case.statements):
             self._before_statement_execution(statement, exec_ctx)
             exception = self._execute_statement(statement, exec_ctx)
@@ -100,7 +187,172 @@ class TestCaseExecutor:
             if exception is not None:
                 result.report_new_thrown_exception(idx, exception)
                 break
-        result_queue.put(result)
+        return result
+
+    def _execute_statements_at_once(
+        self,
+        test_case: tc.TestCase,
+        exec_ctx: ctx.ExecutionContext,
+        result: res.ExecutionResult,
+        indices: Optional[range] = None,
+    ) -> bool:
+        """Executes the statements of the test case as a single code object.
+
+        This avoids executing every statement on its own, which is only required
+        to notify observers about the execution of the individual statements.
+
+        Args:
+            test_case: the test case whose statements are executed
+            exec_ctx: the execution context
+            result: the execution result, which receives the raised exception
+            indices: the indices of the executed statements, or None to execute
+                all statements
+
+        Returns:
+            Whether the statements were executed without raising an exception
+        """
+        if indices is None:
+            indices = range(len(test_case.statements))
+        start, stop = indices.start, indices.stop
+        code = exec_ctx.executable_code_for_test_case(
+            test_case, self._code_cache, start, stop
+        )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Executing %s",
+                astor.to_source(
+                    exec_ctx.executable_node_for_test_case(test_case, start, stop)
+                ),
+            )
+        try:
+            # pylint: disable=exec-used
+            exec(code, exec_ctx.global_namespace, exec_ctx.local_namespace)  # nosec
+        except Exception as err:  # pylint: disable=broad-except
+            idx = TestCaseExecutor._get_failing_statement_index(code, err)
+            TestCaseExecutor._logger.debug(
+                "Failed to execute statement %i:%s", idx, err.args
+            )
+            result.report_new_thrown_exception(idx, err)
+            return False
+        return True
+
+    def _execute_statement_range(
+        self,
+        test_case: tc.TestCase,
+        exec_ctx: ctx.ExecutionContext,
+        result: res.ExecutionResult,
+        indices: range,
+    ) -> bool:
+        if config.configuration.execution.whole_test_case_compilation:
+            return self._execute_statements_at_once(
+                test_case, exec_ctx, result, indices
+            )
+        for idx in indices:
+            exception = self._execute_statement(test_case.statements[idx], exec_ctx)
+            if exception is not None:
+                result.report_new_thrown_exception(idx, exception)
+                return False
+        return True
+
+    def _execute_statements_from_snapshot(
+        self,
+        test_case: tc.TestCase,
+        exec_ctx: ctx.ExecutionContext,
+        result: res.ExecutionResult,
+    ) -> None:
+        """Executes the statements of the test case, starting after the longest
+        prefix for which a snapshot exists.
+
+        This requires a deterministic SUT, because the snapshot replaces the
+        execution of the prefix.  A snapshot of the state is taken after every
+        snapshot_interval statements and after the last statement, such that later
+        test cases can resume from it.  The statements between two snapshots are
+        executed at once, if whole test cases are compiled.
+
+        Args:
+            test_case: the test case whose statements are executed
+            exec_ctx: the execution context
+            result: the execution result, which receives the raised exception
+        """
+        fingerprints = exec_ctx.fingerprints_for(test_case)
+        start, snapshot = self._snapshot_cache.get_longest_prefix(fingerprints)
+        if snapshot is not None:
+            if self._restore_snapshot(snapshot, exec_ctx):
+                self._snapshot_cache.record_reuse(start)
+            else:
+                start = 0
+        interval = self._snapshot_interval
+        size = len(fingerprints)
+        snapshots: Dict[int, es.ExecutionSnapshot] = {}
+        while start < size:
+            stop = min(size, (start // interval + 1) * interval)
+            if not self._execute_statement_range(
+                test_case, exec_ctx, result, range(start, stop)
+            ):
+                break
+            if (snapshot := self._take_snapshot(exec_ctx)) is None:
+                # Later states contain the same objects, thus they can neither be
+                # copied.
+                if stop < size:
+                    self._execute_statement_range(
+                        test_case, exec_ctx, result, range(stop, size)
+                    )
+                break
+            snapshots[stop] = snapshot
+            start = stop
+        self._snapshot_cache.put(fingerprints, snapshots)
+
+    def _take_snapshot(
+        self, exec_ctx: ctx.ExecutionContext
+    ) -> Optional[es.ExecutionSnapshot]:
+        # Copying objects of the SUT might execute its code, which must not be traced.
+        self._tracer.disable()
+        try:
+            trace = ExecutionTrace()
+            trace.merge(self._tracer.get_trace())
+            return es.ExecutionSnapshot(copy.deepcopy(exec_ctx.local_namespace), trace)
+        except Exception as err:  # pylint: disable=broad-except
+            self._logger.debug("Failed to take snapshot: %s", err)
+            return None
+        finally:
+            self._tracer.enable()
+
+    def _restore_snapshot(
+        self, snapshot: es.ExecutionSnapshot, exec_ctx: ctx.ExecutionContext
+    ) -> bool:
+        # The snapshot is copied, because it might be restored again later.
+        self._tracer.disable()
+        try:
+            exec_ctx.local_namespace.update(copy.deepcopy(snapshot.local_namespace))
+        except Exception as err:  # pylint: disable=broad-except
+            self._logger.debug("Failed to restore snapshot: %s", err)
+            exec_ctx.local_namespace.clear()
+            return False
+        finally:
+            self._tracer.enable()
+        self._tracer.get_trace().merge(snapshot.execution_trace)
+        return True
+
+    @staticmethod
+    def _get_failing_statement_index(code: CodeType, exception: Exception) -> int:
+        """Determines the statement that raised the given exception.
+
+        The code of a test case contains every statement in the line that matches
+        its position, thus we search for the frame of the code in the traceback.
+
+        Args:
+            code: the code of the executed test case
+            exception: the raised exception
+
+        Returns:
+            The index of the statement that raised the exception
+        """
+        traceback = exception.__traceback__
+        while traceback is not None:
+            if traceback.tb_frame.f_code is code:
+                return traceback.tb_lineno - 1
+            traceback = traceback.tb_next
+        raise AssertionError("Exception was not raised by the test case")
 
     def _after_test_case_execution(
         self, test_case: tc.TestCase, result: res.ExecutionResult
@@ -126,18 +378,21 @@ class TestCaseExecutor:
     def _execute_statement(
         self, statement: stmt.Statement, exec_ctx: ctx.ExecutionContext
     ) -> Optional[Exception]:
-        ast_node = exec_ctx.executable_node_for(statement)
+        code = exec_ctx.executable_code_for(statement, self._code_cache)
         if self._logger.isEnabledFor(logging.DEBUG):
-            self._logger.debug("Executing %s", astor.to_source(ast_node))
-        code = compile(ast_node, "<ast>", "exec")
+            self._logger.debug(
+                "Executing %s",
+                astor.to_source(exec_ctx.executable_node_for(statement)),
+            )
         try:
             # pylint: disable=exec-used
             exec(code, exec_ctx.global_namespace, exec_ctx.local_namespace)  # nosec
         except Exception as err:  # pylint: disable=broad-except
-            failed_stmt = astor.to_source(ast_node)
-            TestCaseExecutor._logger.debug(
-                "Failed to execute statement:\n%s%s", failed_stmt, err.args
-            )
+            if self._logger.isEnabledFor(logging.DEBUG):
+                failed_stmt = astor.to_source(exec_ctx.executable_node_for(statement))
+                TestCaseExecutor._logger.debug(
+                    "Failed to execute statement:\n%s%s", failed_stmt, err.args
+                )
             return err
         return None
 
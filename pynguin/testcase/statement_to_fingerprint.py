@@ -0,0 +1,211 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides a visitor that computes a structural fingerprint of a statement."""
+from __future__ import annotations
+
+from typing import Any, Optional, Tuple, cast
+
+import pynguin.testcase.statements.assignmentstatement as assign_stmt
+import pynguin.testcase.statements.collectionsstatements as coll_stmt
+import pynguin.testcase.statements.fieldstatement as field_stmt
+import pynguin.testcase.statements.parametrizedstatements as param_stmt
+import pynguin.testcase.statements.primitivestatements as prim_stmt
+import pynguin.testcase.statements.statementvisitor as sv
+import pynguin.testcase.variable.variablereference as vr
+from pynguin.utils.generic.genericaccessibleobject import (
+    GenericCallableAccessibleObject,
+)
+from pynguin.utils.namingscope import NamingScope
+
+
+class StatementToFingerprintVisitor(sv.StatementVisitor):
+    """Visitor that computes a hashable fingerprint of a statement.
+
+    Two statements have the same fingerprint iff the StatementToAstVisitor creates
+    the same AST nodes for them, when using the same naming scopes.  Thus, the
+    fingerprint consists of the structure of the statement, where every variable
+    reference and every module is replaced by its name in the respective scope.
+
+    Like the StatementToAstVisitor, this visitor requests the names of the used
+    variables and modules from the naming scopes, i.e., it registers names for the
+    variables and modules that were not yet known.
+    """
+
+    def __init__(self, module_aliases: NamingScope, variable_names: NamingScope):
+        """Creates a new fingerprint visitor.
+
+        Args:
+            module_aliases: A naming scope for module alias names
+            variable_names: A naming scope for variable names
+        """
+        self._module_aliases = module_aliases
+        self._variable_names = variable_names
+        self._fingerprint: Optional[Tuple[Any, ...]] = None
+
+    @property
+    def fingerprint(self) -> Tuple[Any, ...]:
+        """Provides the fingerprint of the visited statement.
+
+        Returns:
+            The fingerprint of the visited statement
+        """
+        assert self._fingerprint is not None, "No statement was visited"
+        return self._fingerprint
+
+    def visit_int_primitive_statement(
+        self, stmt: prim_stmt.IntPrimitiveStatement
+    ) -> None:
+        self._fingerprint = self._create_constant(stmt)
+
+    def visit_float_primitive_statement(
+        self, stmt: prim_stmt.FloatPrimitiveStatement
+    ) -> None:
+        self._fingerprint = self._create_constant(stmt)
+
+    def visit_string_primitive_statement(
+        self, stmt: prim_stmt.StringPrimitiveStatement
+    ) -> None:
+        self._fingerprint = self._create_constant(stmt)
+
+    def visit_bytes_primitive_statement(
+        self, stmt: prim_stmt.BytesPrimitiveStatement
+    ) -> None:
+        self._fingerprint = self._create_constant(stmt)
+
+    def visit_boolean_primitive_statement(
+        self, stmt: prim_stmt.BooleanPrimitiveStatement
+    ) -> None:
+        self._fingerprint = self._create_constant(stmt)
+
+    def visit_none_statement(self, stmt: prim_stmt.NoneStatement) -> None:
+        self._fingerprint = self._create_constant(stmt)
+
+    def visit_constructor_statement(
+        self, stmt: param_stmt.ConstructorStatement
+    ) -> None:
+        owner = stmt.accessible_object().owner
+        assert owner
+        self._fingerprint = (
+            param_stmt.ConstructorStatement,
+            self._name(stmt.ret_val),
+            self._module_aliases.get_name(owner.__module__),
+            owner.__name__,
+            self._create_args(stmt),
+        )
+
+    def visit_method_statement(self, stmt: param_stmt.MethodStatement) -> None:
+        callee = self._name(stmt.callee)
+        args = self._create_args(stmt)
+        self._fingerprint = (
+            param_stmt.MethodStatement,
+            None if stmt.ret_val.is_none_type() else self._name(stmt.ret_val),
+            callee,
+            stmt.accessible_object().callable.__name__,
+            args,
+        )
+
+    def visit_function_statement(self, stmt: param_stmt.FunctionStatement) -> None:
+        function = stmt.accessible_object().callable
+        module = self._module_aliases.get_name(function.__module__)
+        args = self._create_args(stmt)
+        self._fingerprint = (
+            param_stmt.FunctionStatement,
+            None if stmt.ret_val.is_none_type() else self._name(stmt.ret_val),
+            module,
+            function.__name__,
+            args,
+        )
+
+    def visit_field_statement(self, stmt: field_stmt.FieldStatement) -> None:
+        self._fingerprint = (
+            field_stmt.FieldStatement,
+            self._name(stmt.ret_val),
+            stmt.field.owner,
+            stmt.field.field,
+            self._name(stmt.source),
+        )
+
+    def visit_assignment_statement(self, stmt: assign_stmt.AssignmentStatement) -> None:
+        self._fingerprint = (
+            assign_stmt.AssignmentStatement,
+            self._name(stmt.ret_val),
+            self._name(stmt.rhs),
+        )
+
+    def visit_list_statement(self, stmt: coll_stmt.ListStatement) -> None:
+        self._fingerprint = self._create_collection(stmt)
+
+    def visit_set_statement(self, stmt: coll_stmt.SetStatement) -> None:
+        self._fingerprint = self._create_collection(stmt)
+
+    def visit_tuple_statement(self, stmt: coll_stmt.TupleStatement) -> None:
+        self._fingerprint = self._create_collection(stmt)
+
+    def visit_dict_statement(self, stmt: coll_stmt.DictStatement) -> None:
+        self._fingerprint = (
+            coll_stmt.DictStatement,
+            self._name(stmt.ret_val),
+            tuple((self._name(key), self._name(value)) for key, value in stmt.elements),
+        )
+
+    def _name(self, var: vr.VariableReference) -> str:
+        return self._variable_names.get_name(var)
+
+    def _create_constant(self, stmt: prim_stmt.PrimitiveStatement) -> Tuple[Any, ...]:
+        """Creates the fingerprint of a primitive statement.
+
+        Floats are represented by their string representation, because values like
+        0.0 and -0.0 are equal, although they result in different constants.
+
+        Args:
+            stmt: The primitive statement
+
+        Returns:
+            The fingerprint of the statement
+        """
+        value: Any = stmt.value
+        return (
+            type(stmt),
+            self._name(stmt.ret_val),
+            type(value),
+            repr(value) if isinstance(value, float) else value,
+        )
+
+    def _create_collection(
+        self, stmt: coll_stmt.CollectionStatement[vr.VariableReference]
+    ) -> Tuple[Any, ...]:
+        return (
+            type(stmt),
+            self._name(stmt.ret_val),
+            tuple(self._name(element) for element in stmt.elements),
+        )
+
+    def _create_args(
+        self, stmt: param_stmt.ParametrizedStatement
+    ) -> Tuple[Tuple[str, Any, str], ...]:
+        """Creates the fingerprint of the arguments of a parametrized statement.
+
+        The arguments are ordered as in the signature, because the kind of a
+        parameter determines how the argument is passed.
+
+        Args:
+            stmt: The parametrized statement
+
+        Returns:
+            A tuple of parameter names, parameter kinds, and variable names
+        """
+        gen_callable = cast(GenericCallableAccessibleObject, stmt.accessible_object())
+        parameters = gen_callable.inferred_signature.signature.parameters
+        return tuple(
+            (
+                param_name,
+                parameters[param_name].kind,
+                self._name(stmt.args[param_name]),
+            )
+            for param_name in gen_callable.inferred_signature.parameters
+            if param_name in stmt.args
+        )
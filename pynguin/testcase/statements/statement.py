@@ -48,6 +48,7 @@ class Statement(metaclass=ABCMeta):
             reference: The new return value
         """
         self._ret_val = reference
+        self._test_case.invalidate_object_index()
 
     @property
     def test_case(self) -> tc.TestCase:
@@ -8,7 +8,9 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional, Set, Type
+from bisect import bisect_left
+from heapq import merge
+from typing import Dict, List, Optional, Set, Type
 
 import pynguin.assertion.assertion as ass
 import pynguin.testcase.statements.statement as stmt
@@ -17,7 +19,53 @@ import pynguin.testcase.variable.variablereference as vr
 from pynguin.utils import randomness
 from pynguin.utils.atomicinteger import AtomicInteger
 from pynguin.utils.exceptions import ConstructionFailedException
-from pynguin.utils.type_utils import is_assignable_to, is_type_unknown
+from pynguin.utils.type_utils import is_assignable_to, is_none_type, is_type_unknown
+
+
+class _ObjectIndex:
+    """Indexes the positions of the statements of a test case by the types of
+    their return values.
+
+    The positions of every type are kept in ascending order, thus, the objects of a
+    type that are defined before a position are a prefix of its positions.  The
+    index only covers the first statements of a test case and is extended lazily
+    when statements were appended.
+    """
+
+    def __init__(self) -> None:
+        self.positions_by_type: Dict[Optional[Type], List[int]] = {}
+        # Positions of all statements whose return value is not of NoneType.
+        self.object_positions: List[int] = []
+        self._size = 0
+        self._last: Optional[stmt.Statement] = None
+
+    def covers_prefix_of(self, statements: List[stmt.Statement]) -> bool:
+        """Checks whether the indexed statements are still the first statements.
+
+        Args:
+            statements: The current statements of the test case
+
+        Returns:
+            Whether or not the index can be extended to the given statements
+        """
+        return self._size <= len(statements) and (
+            self._size == 0 or statements[self._size - 1] is self._last
+        )
+
+    def extend(self, statements: List[stmt.Statement]) -> None:
+        """Adds the statements that were appended since the last update.
+
+        Args:
+            statements: The current statements of the test case
+        """
+        for position in range(self._size, len(statements)):
+            variable_type = statements[position].ret_val.variable_type
+            self.positions_by_type.setdefault(variable_type, []).append(position)
+            if not is_none_type(variable_type):
+                self.object_positions.append(position)
+        self._size = len(statements)
+        if statements:
+            self._last = statements[-1]
 
 
 # pylint: disable=too-many-public-methods
@@ -31,6 +79,11 @@ class TestCase(metaclass=ABCMeta):
 
     def __init__(self) -> None:
         self._statements: List[stmt.Statement] = []
+        # Maps the ids of the return values of the statements to the positions of
+        # the statements.  Entries become outdated when statements are inserted or
+        # removed, thus, they are verified on lookup and rebuilt on a mismatch.
+        self._positions: Dict[int, int] = {}
+        self._objects = _ObjectIndex()
 
     @property
     def statements(self) -> List[stmt.Statement]:
@@ -186,6 +239,53 @@ class TestCase(metaclass=ABCMeta):
             a set of variables on which var depends on. # noqa: DAR202
         """
 
+    def get_position_of(self, reference: vr.VariableReference) -> Optional[int]:
+        """Provides the position of the first statement whose return value is the
+        given variable reference.
+
+        The positions are kept in an index, which is extended when statements are
+        appended and rebuilt lazily after statements were inserted, removed, or
+        replaced.  Thus, looking up the positions of many references takes linear
+        time in the number of statements.  The index is verified on every lookup,
+        such that changes to the list of statements that bypass the test case only
+        cause a rebuild.
+
+        Args:
+            reference: The variable reference
+
+        Returns:
+            The position of the statement that defines the reference, if any
+        """
+        statements = self._statements
+        position = self._positions.get(id(reference))
+        if (
+            position is not None
+            and position < len(statements)
+            and statements[position].ret_val is reference
+        ):
+            return position
+        positions: Dict[int, int] = {}
+        for index in range(len(statements) - 1, -1, -1):
+            positions[id(statements[index].ret_val)] = index
+        self._positions = positions
+        return positions.get(id(reference))
+
+    def _index_position(self, position: int) -> None:
+        """Adds an appended statement to the index of positions, unless its return
+        value is already defined by a previous statement.
+
+        Args:
+            position: The position of the appended statement
+        """
+        reference = self._statements[position].ret_val
+        current = self._positions.get(id(reference))
+        if (
+            current is None
+            or current >= position
+            or self._statements[current].ret_val is not reference
+        ):
+            self._positions[id(reference)] = position
+
     def get_objects(
         self, parameter_type: Optional[Type], position: int
     ) -> List[vr.VariableReference]:
@@ -199,6 +299,10 @@ class TestCase(metaclass=ABCMeta):
         If the type for which we search is not specified, all objects up to the given
         position are returned.
 
+        The positions of the objects are looked up in an index by their type, thus,
+        only the types that occur in the test case are checked for assignability,
+        instead of every statement up to the given position.
+
         Args:
             parameter_type: The type of the parameter we search references for
             position: The position in the statement list until we search
@@ -209,17 +313,16 @@ class TestCase(metaclass=ABCMeta):
         if is_type_unknown(parameter_type):
             return self.get_all_objects(position)
 
-        variables: List[vr.VariableReference] = []
+        index = self._get_object_index()
         bound = min(len(self._statements), position)
-        for i in range(bound):
-            statement = self._statements[i]
-            var = statement.ret_val
-            if not var.is_none_type() and is_assignable_to(
-                var.variable_type, parameter_type
-            ):
-                variables.append(var)
-
-        return variables
+        prefixes = [
+            positions[: bisect_left(positions, bound)]
+            for variable_type, positions in index.positions_by_type.items()
+            if not is_none_type(variable_type)
+            and is_assignable_to(variable_type, parameter_type)
+        ]
+        selected = prefixes[0] if len(prefixes) == 1 else merge(*prefixes)
+        return [self._statements[i].ret_val for i in selected]
 
     def get_all_objects(self, position: int) -> List[vr.VariableReference]:
         """Get all objects that are defined up to the given position (exclusive).
@@ -230,13 +333,33 @@ class TestCase(metaclass=ABCMeta):
         Returns:
             A list of all objects defined up to the given position
         """
-        variables: List[vr.VariableReference] = []
+        positions = self._get_object_index().object_positions
         bound = min(len(self._statements), position)
-        for i in range(bound):
-            var = self.get_statement(i).ret_val
-            if not var.is_none_type():
-                variables.append(var)
-        return variables
+        return [
+            self._statements[i].ret_val
+            for i in positions[: bisect_left(positions, bound)]
+        ]
+
+    def _get_object_index(self) -> _ObjectIndex:
+        """Provides the index of the objects that are defined by the statements.
+
+        Returns:
+            The index, which is rebuilt if the statements changed other than by
+            appending statements
+        """
+        if not self._objects.covers_prefix_of(self._statements):
+            self._objects = _ObjectIndex()
+        self._objects.extend(self._statements)
+        return self._objects
+
+    def invalidate_object_index(self) -> None:
+        """Discards the index of the objects that are defined by the statements.
+
+        Must be called whenever the statements change other than by appending
+        statements, or when the type of a return value changes, such that the next
+        lookup of objects rebuilds the index.
+        """
+        self._objects = _ObjectIndex()
 
     def get_random_object(
         self, parameter_type: Optional[Type], position: int
@@ -8,7 +8,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, Set, Type, cast
+from bisect import bisect_left
+from typing import AbstractSet, Any, Dict, List, Optional, Sequence, Set, Type, cast
 
 from typing_inspect import get_args, get_origin
 
@@ -46,6 +47,18 @@ class TestFactory:
 
     def __init__(self, test_cluster: TestCluster):
         self._test_cluster = test_cluster
+        self._skipped_constructions = 0
+
+    @property
+    def skipped_constructions(self) -> int:
+        """Provides the number of constructions that were not attempted, because
+        none of the generators of the requested type could create a value within
+        the maximum recursion depth.
+
+        Returns:
+            The number of skipped constructions
+        """
+        return self._skipped_constructions
 
     def append_statement(
         self,
@@ -605,17 +618,28 @@ class TestFactory:
         """
         variable = test_case.get_statement(position).ret_val
 
+        # The alternatives for the statement at a position are the objects that are
+        # defined before the position, i.e., a prefix of all alternatives.
+        alternatives = [
+            alternative
+            for alternative in test_case.get_objects(
+                variable.variable_type, test_case.size()
+            )
+            if alternative is not variable
+        ]
+        alternative_positions = [
+            alternative.get_statement_position() for alternative in alternatives
+        ]
         changed = False
         for i in range(position + 1, test_case.size()):
-            alternatives = test_case.get_objects(variable.variable_type, i)
-            try:
-                alternatives.remove(variable)
-            except ValueError:
-                pass
-            if len(alternatives) > 0:
+            number_of_alternatives = bisect_left(alternative_positions, i)
+            if number_of_alternatives > 0:
                 statement = test_case.get_statement(i)
                 if statement.references(variable):
-                    statement.replace(variable, randomness.choice(alternatives))
+                    statement.replace(
+                        variable,
+                        randomness.choice(alternatives[:number_of_alternatives]),
+                    )
                     changed = True
 
         deleted = TestFactory.delete_statement(test_case, position)
@@ -657,12 +681,10 @@ class TestFactory:
         positions = set()
         references.add(test_case.get_statement(position).ret_val)
         for i in range(position, test_case.size()):
-            temp = set()
-            for var in references:
-                if test_case.get_statement(i).references(var):
-                    temp.add(test_case.get_statement(i).ret_val)
-                    positions.add(i)
-            references.update(temp)
+            statement = test_case.get_statement(i)
+            if not references.isdisjoint(statement.get_variable_references()):
+                references.add(statement.ret_val)
+                positions.add(i)
         return positions
 
     def change_random_call(
@@ -817,7 +839,7 @@ class TestFactory:
 
     @staticmethod
     def _dependencies_satisfied(
-        dependencies: Set[Type], objects: List[vr.VariableReference]
+        dependencies: AbstractSet[Type], objects: List[vr.VariableReference]
     ) -> bool:
         """Determine if the set of objects is sufficient to satisfy the set of
         dependencies.
@@ -829,14 +851,10 @@ class TestFactory:
         Returns:
             Whether or not the objects are sufficient to satisfy the dependencies
         """
-        for type_ in dependencies:
-            found = False
-            for var in objects:
-                if is_assignable_to(var.variable_type, type_):
-                    found = True
-            if not found:
-                return False
-        return True
+        return all(
+            any(is_assignable_to(var.variable_type, type_) for var in objects)
+            for type_ in dependencies
+        )
 
     # pylint: disable=too-many-arguments, assignment-from-none
     def satisfy_parameters(
@@ -1014,9 +1032,7 @@ class TestFactory:
     ) -> Optional[vr.VariableReference]:
         if is_type_unknown(parameter_type):
             if config.configuration.type_inference.guess_unknown_types:
-                parameter_type = randomness.choice(
-                    self._test_cluster.get_all_generatable_types()
-                )
+                parameter_type = self._test_cluster.get_random_generatable_type()
             else:
                 return None
 
@@ -1092,10 +1108,18 @@ class TestFactory:
                 position,
                 recursion_depth,
             )
-        if type_generators := self._test_cluster.get_generators_for(parameter_type):
+        if type_generators := self._test_cluster.get_feasible_generators_for(
+            parameter_type, recursion_depth
+        ):
             return self._attempt_generation_for_type(
                 test_case, position, recursion_depth, allow_none, type_generators
             )
+        if self._test_cluster.get_generators_for(parameter_type):
+            # Every generator would exceed the maximum recursion depth, unless some
+            # value on the way is reused or set to None.  Such constructions fail
+            # in most cases and are rolled back, thus, they are not attempted, and
+            # the caller falls back to an existing value or None instead.
+            self._skipped_constructions += 1
         return None
 
     def _attempt_generation_for_type(
@@ -1104,9 +1128,9 @@ class TestFactory:
         position: int,
         recursion_depth: int,
         allow_none: bool,
-        type_generators: Set[GenericAccessibleObject],
+        type_generators: Sequence[GenericAccessibleObject],
     ) -> Optional[vr.VariableReference]:
-        type_generator = randomness.choice(list(type_generators))
+        type_generator = randomness.choice(type_generators)
         return self.append_generic_accessible(
             test_case,
             type_generator,
@@ -1124,9 +1148,7 @@ class TestFactory:
     ) -> Optional[vr.VariableReference]:
         return self._create_or_reuse_variable(
             test_case=test_case,
-            parameter_type=randomness.choice(
-                self._test_cluster.get_all_generatable_types()
-            ),
+            parameter_type=self._test_cluster.get_random_generatable_type(),
             position=position,
             recursion_depth=recursion_depth + 1,
             allow_none=allow_none,
@@ -1236,8 +1258,7 @@ class TestFactory:
                 0, config.configuration.test_creation.collection_size
             )
             args = [
-                randomness.choice(self._test_cluster.get_all_generatable_types())
-                for _ in range(size)
+                self._test_cluster.get_random_generatable_type() for _ in range(size)
             ]
         elements = []
         for arg_type in args:
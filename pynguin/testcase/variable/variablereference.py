@@ -72,6 +72,7 @@ class VariableReference(metaclass=ABCMeta):
             variable_type: The new type of this variable
         """
         self._variable_type = variable_type
+        self._test_case.invalidate_object_index()
 
     @property
     def test_case(self) -> tc.TestCase:
@@ -21,9 +21,9 @@ class VariableReferenceImpl(vr.VariableReference):
         ).ret_val
 
     def get_statement_position(self) -> int:
-        for idx, stmt in enumerate(self._test_case.statements):
-            if stmt.ret_val is self:
-                return idx
+        position = self._test_case.get_position_of(self)
+        if position is not None:
+            return position
         raise Exception(
             "Variable reference is not declared in the test case in which it is used"
         )
@@ -9,7 +9,7 @@ Provide wrappers around constructors, methods, function and fields.
 Think of these like the reflection classes in Java.
 """
 import abc
-from typing import Callable, Optional, Set, Type
+from typing import AbstractSet, Callable, FrozenSet, Optional, Set, Type
 
 from pynguin.typeinference.strategy import InferredSignature
 
@@ -83,9 +83,11 @@ class GenericAccessibleObject(metaclass=abc.ABCMeta):
         return 0
 
     @abc.abstractmethod
-    def get_dependencies(self) -> Set[Type]:
+    def get_dependencies(self) -> AbstractSet[Type]:
         """A set of types that are required to use this accessible.
 
+        The returned set must not be modified.
+
         Returns:
             A set of types  # noqa: DAR202
         """
@@ -105,6 +107,7 @@ class GenericCallableAccessibleObject(
         super().__init__(owner)
         self._callable = callable_
         self._inferred_signature = inferred_signature
+        self._dependencies: Optional[FrozenSet[Type]] = None
 
     def generated_type(self) -> Optional[Type]:
         return self._inferred_signature.return_type
@@ -130,7 +133,19 @@ class GenericCallableAccessibleObject(
     def get_num_parameters(self) -> int:
         return len(self.inferred_signature.parameters)
 
-    def get_dependencies(self) -> Set[Type]:
+    def get_dependencies(self) -> AbstractSet[Type]:
+        # The signature does not change once the accessible is part of the test
+        # cluster, thus, the dependencies are collected only once.
+        if self._dependencies is None:
+            self._dependencies = frozenset(self._collect_dependencies())
+        return self._dependencies
+
+    def _collect_dependencies(self) -> Set[Type]:
+        """Collects the types that are required to call this accessible.
+
+        Returns:
+            The known types of the parameters
+        """
         return {
             value
             for value in self.inferred_signature.parameters.values()
@@ -191,9 +206,9 @@ class GenericMethod(GenericCallableAccessibleObject):
     def is_method(self) -> bool:
         return True
 
-    def get_dependencies(self) -> Set[Type]:
+    def _collect_dependencies(self) -> Set[Type]:
         assert self.owner, "Method must have an owner"
-        dependencies = super().get_dependencies()
+        dependencies = super()._collect_dependencies()
         dependencies.add(self.owner)
         return dependencies
 
@@ -262,13 +277,14 @@ class GenericField(GenericAccessibleObject):
         super().__init__(owner)
         self._field = field
         self._field_type = field_type
+        self._dependencies: FrozenSet[Type] = frozenset((owner,))
 
     def is_field(self) -> bool:
         return True
 
-    def get_dependencies(self) -> Set[Type]:
+    def get_dependencies(self) -> AbstractSet[Type]:
         assert self.owner, "Field must have an owner"
-        return {self.owner}
+        return self._dependencies
 
     def generated_type(self) -> Optional[Type]:
         return self._field_type
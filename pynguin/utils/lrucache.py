@@ -0,0 +1,88 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides a bounded cache that evicts the least recently used entry."""
+import typing
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)  # pylint: disable=invalid-name
+V = TypeVar("V")  # pylint: disable=invalid-name
+
+
+class LRUCache(Generic[K, V]):
+    """A bounded cache that counts the hits and misses of its lookups.
+
+    If the cache is full, the least recently used entry is evicted.  A cache with a
+    maximum size of zero stores nothing, i.e., every lookup is a miss.  None cannot
+    be cached, because it denotes a miss.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Create a new cache.
+
+        Args:
+            max_size: The maximum number of cached entries
+        """
+        assert max_size >= 0, "Cache size must not be negative"
+        self._max_size = max_size
+        self._cache: typing.OrderedDict[K, V] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """Provides the value that is cached for the given key.
+
+        Args:
+            key: The key of the entry
+
+        Returns:
+            The cached value, if any
+        """
+        # Pop and re-insert instead of move_to_end(), because a statement from a
+        # timed-out execution might still access a cache from another thread.
+        try:
+            value = self._cache.pop(key)
+        except KeyError:
+            self._misses += 1
+            return None
+        self._cache[key] = value
+        self._hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Caches a value for the given key.
+
+        Args:
+            key: The key of the entry
+            value: The value of the entry
+        """
+        if self._max_size == 0:
+            return
+        self._cache[key] = value
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    @property
+    def hits(self) -> int:
+        """Provides the number of lookups that found a cached value.
+
+        Returns:
+            The number of cache hits
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Provides the number of lookups that found no cached value.
+
+        Returns:
+            The number of cache misses
+        """
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._cache)
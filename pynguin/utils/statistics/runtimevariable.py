@@ -40,6 +40,25 @@ class RuntimeVariable(str, enum.Enum):
     # Execution results
     ExecutionResults = "ExecutionResults"
 
+    # Number of statements whose compiled code was found in the code cache
+    CompiledCodeCacheHits = "CompiledCodeCacheHits"
+
+    # Number of statements that had to be compiled, because their code was not cached
+    CompiledCodeCacheMisses = "CompiledCodeCacheMisses"
+
+    # Number of execution traces whose fitness vector was found in the fitness cache
+    FitnessCacheHits = "FitnessCacheHits"
+
+    # Number of execution traces whose fitness vector had to be computed
+    FitnessCacheMisses = "FitnessCacheMisses"
+
+    # Number of constructions that were not attempted, because they would have
+    # exceeded the maximum recursion depth
+    SkippedConstructions = "SkippedConstructions"
+
+    # Number of statement executions that were skipped by restoring a snapshot
+    ReusedStatementExecutions = "ReusedStatementExecutions"
+
     # Obtained coverage of the chosen testing criterion
     Coverage = "Coverage"
 
@@ -98,6 +117,10 @@ class RuntimeVariable(str, enum.Enum):
     # Number of all generatable types, i.e., the types we can generate values for
     GeneratableTypes = "GeneratableTypes"
 
+    # Time in seconds spent on the control-flow analysis of the SUT during its
+    # instrumentation, zero if the instrumented SUT was loaded from the cache
+    AnalysisTime = "AnalysisTime"
+
     # Branch Coverage that is achieved by simply importing the SUT
     ImportBranchCoverage = "ImportBranchCoverage"
 
@@ -10,7 +10,7 @@ import numbers
 import types
 import typing
 from inspect import isclass, isfunction
-from typing import Any, Callable, Optional, Type
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 from typing_inspect import get_args, get_origin, is_union_type
 
@@ -19,6 +19,9 @@ from pynguin.typeinference.strategy import InferredSignature
 PRIMITIVES = {int, str, bytes, bool, float, complex}
 COLLECTIONS = {list, set, tuple, dict}
 
+# Memoises the results of is_assignable_to() for pairs of hashable types.
+_ASSIGNABILITY: Dict[Tuple[Optional[Type], Optional[Type]], bool] = {}
+
 
 def is_primitive_type(type_: Optional[Type]) -> bool:
     """Check if the given type is a primitive.
@@ -99,6 +102,10 @@ def is_assignable_to(from_type: Optional[Type], to_type: Optional[Type]) -> bool
 
     Currently only unary types, Any and Union are supported.
 
+    The test generation checks the same pairs of types over and over again, while
+    inspecting a union type is comparably expensive.  Thus, the result for a pair
+    of hashable types is memoised.
+
     Args:
         from_type: The type annotation that is used as the source.
         to_type: The type which should be assigned to.
@@ -106,6 +113,18 @@ def is_assignable_to(from_type: Optional[Type], to_type: Optional[Type]) -> bool
     Returns:
         True if `from_type` is assignable to `to_type`
     """
+    try:
+        return _ASSIGNABILITY[from_type, to_type]
+    except KeyError:
+        result = _is_assignable_to(from_type, to_type)
+        _ASSIGNABILITY[from_type, to_type] = result
+        return result
+    except TypeError:
+        # At least one of the types is not hashable.
+        return _is_assignable_to(from_type, to_type)
+
+
+def _is_assignable_to(from_type: Optional[Type], to_type: Optional[Type]) -> bool:
     if to_type == typing.Any:
         return True
     if is_union_type(to_type):
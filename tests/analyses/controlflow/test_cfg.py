@@ -5,10 +5,12 @@
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
 import sys
+from unittest.mock import MagicMock
 
 from bytecode import Bytecode
 
 from pynguin.analyses.controlflow.cfg import CFG
+from pynguin.analyses.controlflow.programgraph import ProgramGraphNode
 from tests.fixtures.programgraph.whileloop import Foo
 
 
@@ -74,3 +76,22 @@ def test_integration_while_loop():
     assert len(while_loop_cfg.nodes) == 3
     assert while_loop_cfg.entry_node.index == -1
     assert while_loop_cfg.exit_nodes.pop().index == sys.maxsize
+
+
+def test_diameter_strongly_connected():
+    cfg = CFG(MagicMock())
+    nodes = [ProgramGraphNode(index=index) for index in range(3)]
+    cfg.add_edge(nodes[0], nodes[1])
+    cfg.add_edge(nodes[1], nodes[2])
+    cfg.add_edge(nodes[2], nodes[0])
+    cfg.add_edge(nodes[0], nodes[2])
+    assert cfg.diameter == 2
+
+
+def test_reversed_cfg_is_independent(conditional_jump_example_bytecode):
+    cfg = CFG.from_bytecode(conditional_jump_example_bytecode)
+    reversed_cfg = cfg.reversed()
+    reversed_cfg.add_edge(ProgramGraphNode(index=42), cfg.entry_node)
+    assert len(cfg.nodes) == 6
+    assert cfg.entry_node.index == -1
+    assert reversed_cfg.entry_node.index == sys.maxsize
@@ -4,7 +4,12 @@
 #
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
+import sys
+from unittest.mock import MagicMock
+
+import pynguin.analyses.controlflow.cfg as cfg
 import pynguin.analyses.controlflow.controldependencegraph as cdt
+import pynguin.analyses.controlflow.programgraph as pg
 
 
 def test_integration(small_control_flow_graph):
@@ -13,20 +18,64 @@ def test_integration(small_control_flow_graph):
     )
     dot_representation = control_dependence_graph.dot
     graph = """strict digraph  {
+"ProgramGraphNode(0)";
 "ProgramGraphNode(2)";
+"ProgramGraphNode(3)";
 "ProgramGraphNode(4)";
+"ProgramGraphNode(5)";
 "ProgramGraphNode(6)";
 "ProgramGraphNode(-9223372036854775807)";
-"ProgramGraphNode(3)";
-"ProgramGraphNode(5)";
-"ProgramGraphNode(0)";
+"ProgramGraphNode(5)" -> "ProgramGraphNode(4)";
+"ProgramGraphNode(5)" -> "ProgramGraphNode(3)";
 "ProgramGraphNode(-9223372036854775807)" -> "ProgramGraphNode(0)";
 "ProgramGraphNode(-9223372036854775807)" -> "ProgramGraphNode(6)";
 "ProgramGraphNode(-9223372036854775807)" -> "ProgramGraphNode(5)";
 "ProgramGraphNode(-9223372036854775807)" -> "ProgramGraphNode(2)";
-"ProgramGraphNode(5)" -> "ProgramGraphNode(3)";
-"ProgramGraphNode(5)" -> "ProgramGraphNode(4)";
 }
 """
     assert dot_representation == graph
     assert control_dependence_graph.entry_node.is_artificial
+
+
+def test_infinite_loop():
+    graph = cfg.CFG(MagicMock())
+    entry = pg.ProgramGraphNode(index=-1, is_artificial=True)
+    exit_ = pg.ProgramGraphNode(index=sys.maxsize, is_artificial=True)
+    nodes = [pg.ProgramGraphNode(index=index) for index in range(3)]
+    for node in [entry, *nodes, exit_]:
+        graph.add_node(node)
+    graph.add_edge(entry, nodes[0])
+    graph.add_edge(nodes[0], nodes[1])
+    graph.add_edge(nodes[0], nodes[2])
+    graph.add_edge(nodes[1], exit_)
+    graph.add_edge(nodes[2], nodes[2])
+
+    control_dependence_graph = cdt.ControlDependenceGraph.compute(graph)
+    assert {
+        (source.index, target.index)
+        for source, target in control_dependence_graph.edges
+    } == {(-sys.maxsize, -1), (-sys.maxsize, 0), (0, 1), (0, 2), (2, 2)}
+
+
+def test_approach_level_index():
+    cdg = cdt.ControlDependenceGraph()
+    entry = pg.ProgramGraphNode(index=-1, is_artificial=True)
+    nodes = [pg.ProgramGraphNode(index=index) for index in range(5)]
+    for predicate_id, node in enumerate(nodes[:4]):
+        node.predicate_id = predicate_id
+    cdg.add_node(entry)
+    for node in nodes:
+        cdg.add_node(node)
+    cdg.add_edge(entry, nodes[0])
+    cdg.add_edge(entry, nodes[3])
+    cdg.add_edge(nodes[0], nodes[1])
+    cdg.add_edge(nodes[0], nodes[4])
+    cdg.add_edge(nodes[1], nodes[2])
+    cdg.add_edge(nodes[3], nodes[2])
+
+    index = cdt.ApproachLevelIndex.compute(cdg)
+    assert index.get_node(2) is nodes[2]
+    assert index.get_approach_levels(0) == []
+    assert index.get_approach_levels(1) == [(1, 0)]
+    assert index.get_approach_levels(2) == [(1, 1), (1, 3), (2, 0)]
+    assert index.get_approach_levels(3) == []
@@ -5,11 +5,14 @@
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
 import sys
+from unittest.mock import MagicMock
 
+import pytest
 from bytecode import Bytecode
 
 import pynguin.analyses.controlflow.cfg as cfg
 import pynguin.analyses.controlflow.dominatortree as pdt
+import pynguin.analyses.controlflow.programgraph as pg
 from tests.fixtures.programgraph.samples import for_loop
 
 
@@ -22,14 +25,14 @@ def test_integration_post_dominator_tree(conditional_jump_example_bytecode):
     graph = """strict digraph  {
 "ProgramGraphNode(9223372036854775807)";
 "ProgramGraphNode(3)";
-"ProgramGraphNode(2)";
-"ProgramGraphNode(1)";
 "ProgramGraphNode(0)";
+"ProgramGraphNode(1)";
+"ProgramGraphNode(2)";
 "ProgramGraphNode(-1)";
 "ProgramGraphNode(9223372036854775807)" -> "ProgramGraphNode(3)";
-"ProgramGraphNode(3)" -> "ProgramGraphNode(2)";
-"ProgramGraphNode(3)" -> "ProgramGraphNode(1)";
 "ProgramGraphNode(3)" -> "ProgramGraphNode(0)";
+"ProgramGraphNode(3)" -> "ProgramGraphNode(1)";
+"ProgramGraphNode(3)" -> "ProgramGraphNode(2)";
 "ProgramGraphNode(0)" -> "ProgramGraphNode(-1)";
 }
 """
@@ -45,14 +48,14 @@ def test_integration(small_control_flow_graph):
     graph = """strict digraph  {
 "ProgramGraphNode(9223372036854775807)";
 "ProgramGraphNode(2)";
-"ProgramGraphNode(4)";
 "ProgramGraphNode(3)";
+"ProgramGraphNode(4)";
 "ProgramGraphNode(5)";
 "ProgramGraphNode(6)";
 "ProgramGraphNode(0)";
 "ProgramGraphNode(9223372036854775807)" -> "ProgramGraphNode(2)";
-"ProgramGraphNode(2)" -> "ProgramGraphNode(4)";
 "ProgramGraphNode(2)" -> "ProgramGraphNode(3)";
+"ProgramGraphNode(2)" -> "ProgramGraphNode(4)";
 "ProgramGraphNode(2)" -> "ProgramGraphNode(5)";
 "ProgramGraphNode(5)" -> "ProgramGraphNode(6)";
 "ProgramGraphNode(6)" -> "ProgramGraphNode(0)";
@@ -95,3 +98,33 @@ def test_integration_dominator_tree():
     dom_tree = pdt.DominatorTree.compute(for_loop_cfg)
     # Every node of the cfg should be in the dominator tree
     assert for_loop_cfg.nodes == dom_tree.nodes
+
+
+@pytest.mark.parametrize(
+    "successors,entry,expected",
+    [
+        pytest.param([[]], 0, [0], id="single node"),
+        pytest.param([[1, 2], [3], [3], []], 0, [0, 0, 0, 0], id="diamond"),
+        pytest.param([[1], [2], [1, 3], []], 0, [0, 0, 1, 2], id="loop"),
+        pytest.param(
+            [[1, 2], [2], [1], []], 0, [0, 0, 0, -1], id="irreducible, unreachable"
+        ),
+        pytest.param([[], [0], [0, 1]], 2, [2, 2, 2], id="other entry"),
+    ],
+)
+def test_compute_immediate_dominators(successors, entry, expected):
+    assert pdt.compute_immediate_dominators(successors, entry) == expected
+
+
+def test_dominator_tree_skips_unreachable_nodes():
+    graph = cfg.CFG(MagicMock())
+    nodes = [pg.ProgramGraphNode(index=index) for index in range(4)]
+    for node in nodes:
+        graph.add_node(node)
+    graph.add_edge(nodes[0], nodes[1])
+    graph.add_edge(nodes[2], nodes[1])
+    graph.add_edge(nodes[3], nodes[2])
+    graph.add_edge(nodes[2], nodes[3])
+    dominator_tree = pdt.DominatorTree.compute(graph)
+    assert dominator_tree.nodes == {nodes[0], nodes[1]}
+    assert dominator_tree.get_successors(nodes[0]) == {nodes[1]}
@@ -9,7 +9,11 @@ from unittest.mock import MagicMock
 import pytest
 from bytecode import BasicBlock
 
-from pynguin.analyses.controlflow.programgraph import ProgramGraph, ProgramGraphNode
+from pynguin.analyses.controlflow.programgraph import (
+    ProgramGraph,
+    ProgramGraphNode,
+    filter_dead_code_nodes,
+)
 
 
 @pytest.fixture
@@ -138,3 +142,102 @@ def test_predicate_id_set():
     node = ProgramGraphNode(index=42)
     node.predicate_id = 1337
     assert node.predicate_id == 1337
+
+
+def test_get_least_common_ancestor_dag(graph, node, second_node, third_node):
+    fourth_node = ProgramGraphNode(index=24)
+    graph.add_edge(node, second_node)
+    graph.add_edge(node, third_node)
+    graph.add_edge(second_node, third_node)
+    graph.add_edge(third_node, fourth_node)
+    graph.add_edge(second_node, fourth_node)
+    assert graph.get_least_common_ancestor(third_node, fourth_node) == third_node
+    assert graph.get_least_common_ancestor(second_node, fourth_node) == second_node
+
+
+def test_get_least_common_ancestor_none(graph, node, second_node):
+    graph.add_node(node)
+    graph.add_node(second_node)
+    assert graph.get_least_common_ancestor(node, second_node) is None
+
+
+def test_edges_in_insertion_order(graph, node, second_node, third_node):
+    graph.add_edge(second_node, third_node)
+    graph.add_edge(second_node, node)
+    graph.add_edge(node, second_node)
+    assert graph.edges == [
+        (second_node, third_node),
+        (second_node, node),
+        (node, second_node),
+    ]
+
+
+def test_add_existing_node_keeps_node(graph, node):
+    graph.add_node(node)
+    graph.add_node(ProgramGraphNode(index=node.index))
+    assert len(graph.nodes) == 1
+    assert next(iter(graph.nodes)) is node
+
+
+def test_modify_queried_graph(graph, node, second_node, third_node):
+    graph.add_edge(node, second_node)
+    assert graph.get_successors(node) == {second_node}
+    graph.add_edge(second_node, third_node)
+    assert graph.get_successors(second_node) == {third_node}
+    assert graph.get_predecessors(third_node) == {second_node}
+    assert graph.exit_nodes == {third_node}
+
+
+def test_remove_nodes(graph, node, second_node, third_node):
+    graph.add_edge(node, second_node, label="true")
+    graph.add_edge(second_node, third_node)
+    graph.add_edge(node, third_node)
+    graph.remove_nodes([second_node])
+    assert graph.nodes == {node, third_node}
+    assert graph.edges == [(node, third_node)]
+    assert list(graph.to_networkx().edges(data=True)) == [(node, third_node, {})]
+
+
+def test_get_shortest_path_lengths(graph, node, second_node, third_node):
+    graph.add_edge(node, second_node)
+    graph.add_edge(second_node, third_node)
+    graph.add_edge(node, third_node)
+    graph.add_edge(third_node, node)
+    assert graph.get_shortest_path_lengths(second_node) == {
+        second_node: 0,
+        third_node: 1,
+        node: 2,
+    }
+
+
+def test_get_adjacency_lists(graph, node, second_node, third_node):
+    graph.add_edge(node, second_node)
+    graph.add_edge(node, third_node)
+    graph.add_edge(second_node, third_node)
+    assert graph.get_adjacency_lists() == (
+        [node, second_node, third_node],
+        [[1, 2], [2], []],
+    )
+    assert graph.get_adjacency_lists(reverse=True) == (
+        [node, second_node, third_node],
+        [[], [0], [0, 1]],
+    )
+
+
+def test_to_networkx_attributes(graph, node, second_node):
+    graph.add_node(node, label="entry")
+    graph.add_edge(node, second_node, label="true")
+    exported = graph.to_networkx()
+    assert exported.nodes[node] == {"label": "entry"}
+    assert exported.edges[node, second_node] == {"label": "true"}
+
+
+def test_filter_dead_code_nodes(graph, node, second_node, third_node, fourth_node):
+    entry = ProgramGraphNode(index=0)
+    graph.add_edge(entry, node)
+    graph.add_edge(second_node, third_node)
+    graph.add_edge(third_node, node)
+    graph.add_edge(fourth_node, fourth_node)
+    result = filter_dead_code_nodes(graph)
+    assert result is graph
+    assert graph.nodes == {entry, node, fourth_node}
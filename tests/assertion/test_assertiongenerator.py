@@ -21,11 +21,13 @@ def test_init():
 
 def test_add_assertions():
     executor = MagicMock()
+    result = MagicMock()
+    executor.execute_many.return_value = iter([result])
     generator = ag.AssertionGenerator(executor)
     test_case = MagicMock()
     with mock.patch.object(generator, "_add_assertions") as add:
         generator.add_assertions([test_case])
-        add.assert_called_with(test_case)
+        add.assert_called_with(test_case, result)
 
 
 @pytest.fixture()
@@ -35,46 +37,47 @@ def generator_setup():
     assertion = MagicMock()
     trace.get_assertions.return_value = {assertion}
     result = MagicMock(output_traces={"": trace})
-    executor.execute.return_value = result
     test_case = MagicMock()
     statement = MagicMock()
     test_case.statements = [statement]
-    return test_case, executor, statement, assertion
+    return test_case, executor, statement, assertion, result
 
 
 def test__add_assertions_short(generator_setup):
-    test_case, executor, statement, assertion = generator_setup
+    test_case, executor, statement, assertion, result = generator_setup
     test_case.size_with_assertions.return_value = 1
     config.configuration.test_case_output.max_length_test_case = 2
 
     generator = ag.AssertionGenerator(executor)
-    generator._add_assertions(test_case)
+    generator._add_assertions(test_case, result)
     statement.add_assertion.assert_called_with(assertion)
 
 
 def test__add_assertions_long(generator_setup):
-    test_case, executor, statement, _ = generator_setup
+    test_case, executor, statement, _, result = generator_setup
     test_case.size_with_assertions.return_value = 3
     config.configuration.test_case_output.max_length_test_case = 2
 
     generator = ag.AssertionGenerator(executor)
-    generator._add_assertions(test_case)
+    generator._add_assertions(test_case, result)
     statement.add_assertion.assert_not_called()
 
 
 def test__filter_failing_assertions(generator_setup):
-    test_case, executor, statement, _ = generator_setup
+    test_case, executor, statement, _, result = generator_setup
 
     statement.assertions = {MagicMock}
     generator = ag.AssertionGenerator(executor)
-    generator._filter_failing_assertions(test_case)
+    generator._filter_failing_assertions(test_case, result)
     assert statement.assertions == set()
 
 
 def test_filter_assertions():
     executor = MagicMock()
+    result = MagicMock()
+    executor.execute_many.side_effect = lambda tests: iter([result] * len(tests))
     generator = ag.AssertionGenerator(executor)
     test_case = MagicMock()
     with mock.patch.object(generator, "_filter_failing_assertions") as filt:
         generator.filter_failing_assertions([test_case])
-        filt.assert_called_with(test_case)
+        filt.assert_called_with(test_case, result)
@@ -0,0 +1,168 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.configuration as config
+import pynguin.coverage.branch.branchcoveragefactory as bcf
+import pynguin.coverage.branch.branchcoveragefitnessengine as bcfe
+import pynguin.ga.testcasechromosome as tcc
+from pynguin.instrumentation.instrumentation import BranchCoverageInstrumentation
+from pynguin.testcase.execution.executionresult import ExecutionResult
+from pynguin.testcase.execution.executiontracer import ExecutionTracer
+from pynguin.testcase.execution.testcaseexecutor import TestCaseExecutor
+
+_SOURCE = """
+def nested(a, b):
+    if a > 0:
+        if b > a:
+            if b > 23:
+                return 1
+            return 2
+        for _ in range(a):
+            if b == 3:
+                return 3
+    elif a < -10:
+        return 4
+    return 0
+
+
+def other(a):
+    while a > 0:
+        a -= 1
+    return a
+
+
+def branchless():
+    return 42
+"""
+
+
+@pytest.fixture
+def module_and_tracer():
+    tracer = ExecutionTracer()
+    tracer.current_thread_ident = threading.current_thread().ident
+    code = BranchCoverageInstrumentation(tracer).instrument_module(
+        compile(_SOURCE, "nestedmodule", "exec")
+    )
+    namespace = {}
+    exec(code, namespace)  # pylint: disable=exec-used
+    return namespace, tracer
+
+
+@pytest.fixture
+def executor(module_and_tracer):
+    executor = MagicMock(TestCaseExecutor)
+    executor.tracer = module_and_tracer[1]
+    return executor
+
+
+def _execute(module_and_tracer, calls) -> ExecutionResult:
+    namespace, tracer = module_and_tracer
+    tracer.clear_trace()
+    for name, args in calls:
+        namespace[name](*args)
+    result = ExecutionResult()
+    result.execution_trace = tracer.get_trace()
+    return result
+
+
+@pytest.mark.parametrize(
+    "calls",
+    [
+        pytest.param([]),
+        pytest.param([("nested", (1, 2))]),
+        pytest.param([("nested", (5, 30)), ("branchless", ())]),
+        pytest.param([("nested", (5, 2))]),
+        pytest.param([("nested", (5, 3)), ("other", (2,))]),
+        pytest.param([("nested", (-5, 0)), ("other", (-1,))]),
+        pytest.param([("nested", (-11, 0))]),
+        pytest.param([("nested", (0, 0)), ("nested", (3, 1))]),
+    ],
+)
+def test_same_fitness_as_goals(module_and_tracer, executor, calls):
+    goals = bcf.BranchCoverageFactory(executor).get_coverage_goals()
+    engine = bcf.BranchCoverageFactory(executor).get_fitness_engine(goals)
+    result = _execute(module_and_tracer, calls)
+    expected = [
+        goal.goal.get_distance(result, executor.tracer).get_resulting_branch_fitness()
+        for goal in goals
+    ]
+    assert engine.compute_fitness_vector_for_result(result) == expected
+
+
+def test_goal_indices(executor):
+    goals = bcf.BranchCoverageFactory(executor).get_coverage_goals()
+    engine = bcfe.BranchCoverageFitnessEngine(executor, goals)
+    assert engine.goals == tuple(goals)
+    assert [engine.index_of(goal) for goal in goals] == list(range(len(goals)))
+
+
+def test_marks_covered_goals(module_and_tracer, executor):
+    goals = bcf.BranchCoverageFactory(executor).get_coverage_goals()
+    engine = bcfe.BranchCoverageFitnessEngine(executor, goals)
+    vector = engine.compute_fitness_vector_for_result(
+        _execute(module_and_tracer, [("nested", (1, 2)), ("branchless", ())])
+    )
+    assert [goal.is_covered for goal in goals] == [fitness == 0.0 for fitness in vector]
+    assert any(goal.is_covered for goal in goals)
+
+
+def test_compute_fitness_vector_executes_outdated(module_and_tracer, executor):
+    goals = bcf.BranchCoverageFactory(executor).get_coverage_goals()
+    engine = bcfe.BranchCoverageFitnessEngine(executor, goals)
+    result = _execute(module_and_tracer, [("other", (3,))])
+    executor.execute.return_value = result
+    chromosome = tcc.TestCaseChromosome(MagicMock())
+    vector = engine.compute_fitness_vector(chromosome)
+    assert vector == engine.compute_fitness_vector_for_result(result)
+    assert chromosome.get_last_execution_result() is result
+    engine.compute_fitness_vector(chromosome)
+    executor.execute.assert_called_once_with(chromosome.test_case)
+
+
+def test_equal_traces_share_vector(module_and_tracer, executor):
+    goals = bcf.BranchCoverageFactory(executor).get_coverage_goals()
+    engine = bcfe.BranchCoverageFitnessEngine(executor, goals)
+    vector = engine.compute_fitness_vector_for_result(
+        _execute(module_and_tracer, [("nested", (5, 30))])
+    )
+    assert (
+        engine.compute_fitness_vector_for_result(
+            _execute(module_and_tracer, [("nested", (5, 30)), ("nested", (5, 30))])
+        )
+        is vector
+    )
+    assert engine.fitness_cache.hits == 1
+    assert engine.fitness_cache.misses == 1
+
+
+def test_different_traces_do_not_share_vector(module_and_tracer, executor):
+    goals = bcf.BranchCoverageFactory(executor).get_coverage_goals()
+    engine = bcfe.BranchCoverageFitnessEngine(executor, goals)
+    vector = engine.compute_fitness_vector_for_result(
+        _execute(module_and_tracer, [("nested", (5, 30))])
+    )
+    other = engine.compute_fitness_vector_for_result(
+        _execute(module_and_tracer, [("nested", (5, 2))])
+    )
+    assert other != vector
+    assert engine.fitness_cache.misses == 2
+
+
+def test_fitness_cache_disabled(module_and_tracer, executor):
+    config.configuration.search_algorithm.fitness_cache_size = 0
+    goals = bcf.BranchCoverageFactory(executor).get_coverage_goals()
+    engine = bcfe.BranchCoverageFitnessEngine(executor, goals)
+    for _ in range(2):
+        engine.compute_fitness_vector_for_result(
+            _execute(module_and_tracer, [("other", (3,))])
+        )
+    assert engine.fitness_cache.hits == 0
+    assert len(engine.fitness_cache) == 0
@@ -13,8 +13,10 @@ from hypothesis import assume, given
 
 from pynguin.coverage.controlflowdistance import (
     ControlFlowDistance,
+    get_non_root_control_flow_distance,
     get_root_control_flow_distance,
 )
+from pynguin.instrumentation.instrumentation import BranchCoverageInstrumentation
 from pynguin.testcase.execution.executionresult import ExecutionResult
 from pynguin.testcase.execution.executiontrace import ExecutionTrace
 from pynguin.testcase.execution.executiontracer import ExecutionTracer
@@ -142,3 +144,69 @@ def test_calculate_control_flow_distance_for_root(
     assert distance == ControlFlowDistance(
         approach_level=approach_level, branch_distance=0.0
     )
+
+
+@pytest.fixture()
+def nested_tracer() -> ExecutionTracer:
+    tracer = ExecutionTracer()
+    source = """
+def foo(x, y):
+    if x > 0:
+        if y > 0:
+            if x > y:
+                return 1
+    return 0
+"""
+    BranchCoverageInstrumentation(tracer).instrument_module(
+        compile(source, "nested", "exec")
+    )
+    return tracer
+
+
+def _nested_result(executed_predicates) -> ExecutionResult:
+    trace = ExecutionTrace()
+    trace.executed_code_objects.update({0, 1})
+    for predicate, (true_distance, false_distance) in executed_predicates.items():
+        trace.executed_predicates[predicate] = 1
+        trace.true_distances[predicate] = true_distance
+        trace.false_distances[predicate] = false_distance
+    result = MagicMock(ExecutionResult)
+    result.execution_trace = trace
+    return result
+
+
+@pytest.mark.parametrize(
+    "executed_predicates, predicate, value, expected",
+    [
+        # Predicates are numbered from the innermost to the outermost condition.
+        pytest.param({2: (0.0, 1.0)}, 2, False, ControlFlowDistance(0, 1.0)),
+        pytest.param({2: (3.0, 0.0)}, 1, True, ControlFlowDistance(1, 3.0)),
+        pytest.param({2: (3.0, 0.0)}, 0, True, ControlFlowDistance(2, 3.0)),
+        pytest.param(
+            {2: (0.0, 1.0), 1: (2.0, 0.0)}, 0, False, ControlFlowDistance(1, 2.0)
+        ),
+    ],
+)
+def test_calculate_control_flow_distance_for_non_root(
+    nested_tracer, executed_predicates, predicate, value, expected
+):
+    result = _nested_result(executed_predicates)
+    distance = get_non_root_control_flow_distance(
+        result, predicate, value, nested_tracer
+    )
+    assert distance == expected
+
+
+def test_calculate_control_flow_distance_for_non_root_not_executed(nested_tracer):
+    result = _nested_result({})
+    result.execution_trace.executed_code_objects.clear()
+    code_object = nested_tracer.get_known_data().existing_code_objects[1]
+    distance = get_non_root_control_flow_distance(result, 0, True, nested_tracer)
+    assert distance == ControlFlowDistance(code_object.cfg.diameter, 0.0)
+
+
+def test_approach_levels_are_indexed_during_instrumentation(nested_tracer):
+    code_object = nested_tracer.get_known_data().existing_code_objects[1]
+    assert code_object.approach_levels is not None
+    assert code_object.get_approach_levels() is code_object.approach_levels
+    assert code_object.approach_levels.get_approach_levels(0) == [(1, 1), (2, 2)]
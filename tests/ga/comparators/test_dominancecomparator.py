@@ -11,6 +11,7 @@ import pytest
 import pynguin.ga.chromosome as chrom
 import pynguin.ga.comparators.dominancecomparator as dc
 import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.goalfitnessengine as gfe
 
 
 @pytest.fixture
@@ -40,3 +41,34 @@ def test_compare_chromosome_1_none(comparator):
 
 def test_compare_chromosome_2_none(comparator):
     assert comparator.compare(MagicMock(chrom.Chromosome), None) == -1
+
+
+class DummyEngine(gfe.GoalFitnessEngine):
+    def compute_fitness_vector(self, individual):
+        pass  # pragma: no cover
+
+
+def _chromosome_with_vector(engine, vector):
+    chromosome = MagicMock(chrom.Chromosome)
+    chromosome.fitness_engine = engine
+    chromosome.get_fitness_vector.return_value = vector
+    return chromosome
+
+
+@pytest.mark.parametrize(
+    "vector_1, vector_2, result",
+    [
+        pytest.param([0.0, 1.0, 5.0], [1.0, 1.0, 0.0], -1),
+        pytest.param([0.0, 2.0, 5.0], [1.0, 1.0, 0.0], 0),
+        pytest.param([1.0, 1.0, 0.0], [1.0, 0.5, 0.0], 1),
+        pytest.param([1.0, 1.0, 5.0], [1.0, 1.0, 0.0], 0),
+    ],
+)
+def test_compare_fitness_vectors(vector_1, vector_2, result):
+    goals = [MagicMock(ff.FitnessFunction) for _ in range(3)]
+    engine = DummyEngine(goals)
+    comparator = dc.DominanceComparator(goals={goals[0], goals[1]})
+    chromosome_1 = _chromosome_with_vector(engine, vector_1)
+    chromosome_2 = _chromosome_with_vector(engine, vector_2)
+    assert comparator.compare(chromosome_1, chromosome_2) == result
+    chromosome_1.get_fitness_for.assert_not_called()
@@ -25,7 +25,7 @@ def test_run_test_suite_chromosome():
     result0 = MagicMock()
     result1 = MagicMock()
     result2 = MagicMock()
-    executor.execute.side_effect = [result0, result1]
+    executor.execute_many.return_value = iter([result0, result1])
     ff = DummyTestSuiteFitnessFunction(executor)
     indiv = tsc.TestSuiteChromosome()
     test_case0 = tcc.TestCaseChromosome(MagicMock())
@@ -41,3 +41,24 @@ def test_run_test_suite_chromosome():
     assert ff._run_test_suite_chromosome(indiv) == [result0, result1, result2]
     assert test_case0.get_last_execution_result() == result0
     assert test_case1.get_last_execution_result() == result1
+    executor.execute_many.assert_called_once_with(
+        [test_case0.test_case, test_case1.test_case]
+    )
+
+
+def test_run_test_suite_chromosomes():
+    executor = MagicMock()
+    result0 = MagicMock()
+    result1 = MagicMock()
+    executor.execute_many.return_value = iter([result0, result1])
+    ff = DummyTestSuiteFitnessFunction(executor)
+    indiv0 = tsc.TestSuiteChromosome()
+    indiv1 = tsc.TestSuiteChromosome()
+    test_case0 = tcc.TestCaseChromosome(MagicMock())
+    test_case1 = tcc.TestCaseChromosome(MagicMock())
+    indiv0.add_test_case_chromosome(test_case0)
+    indiv1.add_test_case_chromosome(test_case1)
+    assert ff._run_test_suite_chromosomes([indiv0, indiv1]) == [[result0], [result1]]
+    executor.execute_many.assert_called_once_with(
+        [test_case0.test_case, test_case1.test_case]
+    )
@@ -45,9 +45,30 @@ def test_compute_fitness_values(known_data_mock, executor_mock, trace_mock):
     executor_mock.tracer.return_value = tracer
     ff = BranchDistanceTestSuiteFitnessFunction(executor_mock)
     indiv = MagicMock()
-    with mock.patch.object(ff, "_run_test_suite_chromosome") as run_suite_mock:
+    with mock.patch.object(ff, "_run_test_suite_chromosomes") as run_suites_mock:
         result = ExecutionResult()
         result.execution_trace = trace_mock
-        run_suite_mock.return_value = [result]
+        run_suites_mock.return_value = [[result]]
         assert ff.compute_fitness_values(indiv) == FitnessValues(0, 1)
-        run_suite_mock.assert_called_with(indiv)
+        run_suites_mock.assert_called_with([indiv])
+
+
+def test_compute_fitness_values_batch(known_data_mock, executor_mock):
+    known_data_mock.branch_less_code_objects = {0, 1}
+    executor_mock.tracer.get_known_data.return_value = known_data_mock
+    ff = BranchDistanceTestSuiteFitnessFunction(executor_mock)
+    individuals = [MagicMock(), MagicMock()]
+    results = []
+    for executed_code_objects in ({0}, {0, 1}):
+        result = ExecutionResult()
+        result.execution_trace = ExecutionTrace(
+            executed_code_objects=executed_code_objects
+        )
+        results.append([result])
+    with mock.patch.object(ff, "_run_test_suite_chromosomes") as run_suites_mock:
+        run_suites_mock.return_value = results
+        assert ff.compute_fitness_values_batch(individuals) == [
+            FitnessValues(1, 0.5),
+            FitnessValues(0, 1),
+        ]
+        run_suites_mock.assert_called_with(individuals)
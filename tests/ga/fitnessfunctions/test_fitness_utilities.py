@@ -13,7 +13,9 @@ from hypothesis import given
 from pynguin.ga.fitnessfunctions.fitness_utilities import (
     analyze_results,
     compute_branch_coverage,
+    compute_branch_coverage_batch,
     compute_branch_distance_fitness,
+    compute_branch_distance_fitness_batch,
     normalise,
 )
 from pynguin.testcase.execution.executionresult import ExecutionResult
@@ -139,3 +141,47 @@ def test_analyze_traces_merge(trace_mock):
     results.append(result)
     trace = analyze_results(results)
     assert trace == trace_mock
+
+
+def test_fitness_unknown_predicate(trace_mock, known_data_mock):
+    trace_mock.executed_predicates[3] = 2
+    trace_mock.true_distances[3] = 0.0
+    trace_mock.false_distances[3] = 3.0
+    assert compute_branch_distance_fitness(trace_mock, known_data_mock) == 0.0
+
+
+def test_fitness_executed_twice_without_distance(trace_mock, known_data_mock):
+    known_data_mock.existing_predicates[0] = MagicMock(PredicateMetaData)
+    trace_mock.executed_predicates[0] = 2
+    trace_mock.false_distances[0] = 0.0
+    assert compute_branch_distance_fitness(trace_mock, known_data_mock) == 1.0
+
+
+def test_fitness_batch(known_data_mock):
+    known_data_mock.existing_predicates[0] = MagicMock(PredicateMetaData)
+    known_data_mock.branch_less_code_objects = {0}
+    covered = ExecutionTrace()
+    covered.executed_code_objects.add(0)
+    covered.executed_predicates[0] = 2
+    covered.true_distances[0] = 0.0
+    covered.false_distances[0] = 0.0
+    partially_covered = ExecutionTrace()
+    partially_covered.executed_predicates[0] = 2
+    partially_covered.true_distances[0] = 1.0
+    partially_covered.false_distances[0] = 0.0
+    traces = [covered, partially_covered, ExecutionTrace()]
+    assert compute_branch_distance_fitness_batch(traces, known_data_mock) == [
+        0.0,
+        1.5,
+        3.0,
+    ]
+    assert compute_branch_coverage_batch(traces, known_data_mock) == [
+        1.0,
+        1 / 3,
+        0.0,
+    ]
+
+
+def test_batch_empty(known_data_mock):
+    assert compute_branch_distance_fitness_batch([], known_data_mock) == []
+    assert compute_branch_coverage_batch([], known_data_mock) == []
@@ -0,0 +1,72 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.ga.chromosome as chrom
+import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.goalfitnessengine as gfe
+from pynguin.ga.operators.ranking.crowdingdistance import (
+    fast_epsilon_dominance_assignment,
+)
+
+
+@pytest.fixture
+def goals():
+    return [MagicMock(ff.FitnessFunction) for _ in range(2)]
+
+
+def _front(goals, rows):
+    front = []
+    for row in rows:
+        test = MagicMock(chrom.Chromosome)
+        values = dict(zip(goals, row))
+        test.get_fitness_for.side_effect = values.get
+        front.append(test)
+    return front
+
+
+def test_fast_epsilon_dominance_assignment(goals):
+    front = _front(goals, [(0.0, 1.0), (0.0, 2.0), (1.0, 1.0), (2.0, 2.0)])
+    fast_epsilon_dominance_assignment(front, set(goals))
+    assert [test.distance for test in front] == [0.5, 0.5, 0.5, 0]
+
+
+def test_fast_epsilon_dominance_assignment_equal_values(goals):
+    front = _front(goals, [(1.0, 1.0), (1.0, 1.0)])
+    fast_epsilon_dominance_assignment(front, set(goals))
+    assert [test.distance for test in front] == [0, 0]
+
+
+def test_fast_epsilon_dominance_assignment_empty_front(goals):
+    fast_epsilon_dominance_assignment([], set(goals))
+
+
+def test_fast_epsilon_dominance_assignment_fitness_vectors():
+    class DummyEngine(gfe.GoalFitnessEngine):
+        def compute_fitness_vector(self, individual):
+            pass  # pragma: no cover
+
+    goals = [MagicMock(ff.FitnessFunction) for _ in range(4)]
+    engine = DummyEngine(goals)
+    front = []
+    for vector in ([0.0, 1.0, 1.0, 2.0], [1.0, 0.0, 0.0, 2.0], [1.0, 1.0, 1.0, 0.0]):
+        test = MagicMock(chrom.Chromosome)
+        test.fitness_engine = engine
+        test.get_fitness_vector.return_value = vector
+        front.append(test)
+    fast_epsilon_dominance_assignment(front, set(goals))
+    assert [test.distance for test in front] == [2 / 3, 2 / 3, 2 / 3]
+    for test in front:
+        test.get_fitness_for.assert_not_called()
+
+
+def test_fast_epsilon_dominance_assignment_several_minima(goals):
+    front = _front(goals, [(0.0, 2.0), (1.0, 1.0), (0.0, 1.0), (1.0, 2.0)])
+    fast_epsilon_dominance_assignment(front, set(goals))
+    assert [test.distance for test in front] == [0.5, 0.5, 0.5, 0]
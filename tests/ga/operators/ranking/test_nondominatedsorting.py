@@ -0,0 +1,77 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.ga.chromosome as chrom
+import pynguin.ga.fitnessfunction as ff
+from pynguin.ga.comparators.dominancecomparator import DominanceComparator
+from pynguin.ga.operators.ranking.nondominatedsorting import fast_non_dominated_sort
+from pynguin.utils import randomness
+
+
+def _solutions(goals, rows):
+    solutions = []
+    for row in rows:
+        solution = MagicMock(chrom.Chromosome)
+        values = dict(zip(goals, row))
+        solution.get_fitness_for.side_effect = values.get
+        solutions.append(solution)
+    return solutions
+
+
+@pytest.mark.parametrize(
+    "rows, expected",
+    [
+        pytest.param([], []),
+        pytest.param([(1, 1)], [[0]]),
+        pytest.param([(1, 1), (0, 0), (2, 2)], [[1], [0], [2]]),
+        pytest.param([(0, 1), (1, 0), (1, 1)], [[0, 1], [2]]),
+        pytest.param([(1, 1), (1, 1), (0, 2)], [[0, 1, 2]]),
+        pytest.param([(1, 1), (1, 2), (1, 1)], [[0, 2], [1]]),
+    ],
+)
+def test_fast_non_dominated_sort(rows, expected):
+    goals = [MagicMock(ff.FitnessFunction) for _ in range(2)]
+    solutions = _solutions(goals, rows)
+    fronts = list(fast_non_dominated_sort(solutions, goals))
+    assert fronts == [[solutions[index] for index in front] for front in expected]
+
+
+def test_fast_non_dominated_sort_without_goals():
+    solutions = _solutions([], [(), ()])
+    assert list(fast_non_dominated_sort(solutions, [])) == [solutions]
+
+
+def test_fast_non_dominated_sort_is_lazy():
+    goals = [MagicMock(ff.FitnessFunction)]
+    solutions = _solutions(goals, [(2,), (1,), (0,)])
+    assert next(fast_non_dominated_sort(solutions, goals)) == [solutions[2]]
+
+
+def test_fast_non_dominated_sort_agrees_with_dominance_comparator():
+    goals = [MagicMock(ff.FitnessFunction) for _ in range(3)]
+    solutions = _solutions(
+        goals,
+        [tuple(randomness.choice([0.0, 0.5, 1.0]) for _ in goals) for _ in range(25)],
+    )
+    comparator = DominanceComparator(goals=set(goals))
+    ranks = {}
+    for rank, front in enumerate(fast_non_dominated_sort(solutions, goals)):
+        for solution in front:
+            ranks[solution] = rank
+    for solution_1 in solutions:
+        for solution_2 in solutions:
+            if comparator.compare(solution_1, solution_2) < 0:
+                assert ranks[solution_1] < ranks[solution_2]
+        if ranks[solution_1] > 0:
+            assert any(
+                comparator.compare(other, solution_1) < 0
+                and ranks[other] == ranks[solution_1] - 1
+                for other in solutions
+            )
@@ -10,6 +10,8 @@ import pytest
 
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
+import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.goalfitnessengine as gfe
 from pynguin.ga.operators.ranking.rankingfunction import (
     RankBasedPreferenceSorting,
     RankedFronts,
@@ -72,3 +74,45 @@ def test_compute_ranking_assignment(ranking_function):
 
     result = ranking_function.compute_ranking_assignment(solutions, set())
     assert result == expected
+
+
+class DummyEngine(gfe.GoalFitnessEngine):
+    def compute_fitness_vector(self, individual):
+        pass  # pragma: no cover
+
+
+def test_get_zero_front():
+    goals = [MagicMock(ff.FitnessFunction) for _ in range(3)]
+    engine = DummyEngine(goals)
+    solutions = []
+    for vector, length in (([0.0, 1.0, 2.0], 3), ([0.0, 0.5, 2.0], 4), ([1, 1, 2], 1)):
+        solution = MagicMock(chrom.Chromosome)
+        solution.fitness_engine = engine
+        solution.get_fitness_vector.return_value = vector
+        solution.length.return_value = length
+        solutions.append(solution)
+    zero_front = RankBasedPreferenceSorting._get_zero_front(solutions, set(goals))
+    assert set(zero_front) == set(solutions)
+    for solution in solutions:
+        assert solution.rank == 0
+        solution.get_fitness_for.assert_not_called()
+
+
+def test_compute_ranking_assignment_non_dominated_fronts(ranking_function):
+    goals = [MagicMock(ff.FitnessFunction) for _ in range(2)]
+    engine = DummyEngine(goals)
+    solutions = []
+    for vector in ([0.0, 3.0], [3.0, 0.0], [1.0, 1.0], [2.0, 2.0], [3.0, 3.0]):
+        solution = MagicMock(chrom.Chromosome)
+        solution.fitness_engine = engine
+        solution.get_fitness_vector.return_value = vector
+        solution.length.return_value = 1
+        solutions.append(solution)
+    config.configuration.search_algorithm.population = 4
+    result = ranking_function.compute_ranking_assignment(solutions, set(goals))
+    assert [set(front) for front in result.fronts] == [
+        {solutions[0], solutions[1]},
+        {solutions[2]},
+        {solutions[3]},
+    ]
+    assert [solution.rank for solution in solutions[:4]] == [0, 0, 1, 2]
@@ -10,6 +10,7 @@ import pytest
 
 import pynguin.ga.chromosome as chrom
 import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.goalfitnessengine as gfe
 from pynguin.ga.chromosome import Chromosome
 
 
@@ -137,3 +138,86 @@ def test_fitness_values_two_fitness_functions(chromosome, fitness_function):
     chromosome.add_fitness_function(fitness_func2)
     chromosome._update_fitness_values(fitness_func2, ff.FitnessValues(0.23, 0.5))
     assert len(chromosome.fitness_values) == 2
+
+
+def test_evaluate_all(chromosome, fitness_function):
+    other = type(chromosome)()
+    unchanged = type(chromosome)()
+    for individual in (chromosome, other, unchanged):
+        individual.add_fitness_function(fitness_function)
+    unchanged.set_changed(False)
+    fitness_function.compute_fitness_values_batch.return_value = [
+        ff.FitnessValues(1, 0.5),
+        ff.FitnessValues(2, 0.25),
+    ]
+    Chromosome.evaluate_all([chromosome, other, unchanged])
+    fitness_function.compute_fitness_values_batch.assert_called_once_with(
+        [chromosome, other]
+    )
+    assert chromosome.get_fitness() == 1
+    assert other.get_coverage() == 0.25
+    assert chromosome.get_number_of_evaluations() == 1
+    assert not other.has_changed()
+    assert unchanged.get_number_of_evaluations() == 0
+    fitness_function.compute_fitness_values.assert_not_called()
+
+
+def test_evaluate_all_no_fitness_functions(chromosome):
+    with pytest.raises(AssertionError):
+        Chromosome.evaluate_all([chromosome])
+
+
+@pytest.fixture
+def engine_goals():
+    goals = [MagicMock(ff.FitnessFunction) for _ in range(2)]
+    for goal in goals:
+        goal.is_maximisation_function.return_value = False
+    return goals
+
+
+@pytest.fixture
+def engine(engine_goals):
+    class DummyEngine(gfe.GoalFitnessEngine):
+        compute_fitness_vector = MagicMock(return_value=[0.0, 0.5])
+
+    return DummyEngine(engine_goals)
+
+
+def test_fitness_engine(chromosome, fitness_function, engine, engine_goals):
+    for goal in [fitness_function] + engine_goals:
+        chromosome.add_fitness_function(goal)
+    chromosome.set_fitness_engine(engine)
+    fitness_function.compute_fitness_values.return_value = ff.FitnessValues(2, 0.0)
+    assert chromosome.fitness_engine is engine
+    assert chromosome.get_fitness_vector() == [0.0, 0.5]
+    assert chromosome.get_fitness_for(engine_goals[1]) == 0.5
+    assert chromosome.get_coverage_for(engine_goals[0]) == 1.0
+    assert chromosome.get_fitness() == 2.5
+    assert chromosome.get_coverage() == pytest.approx(1 / 3)
+    assert chromosome.fitness_values == {fitness_function: ff.FitnessValues(2, 0.0)}
+    engine.compute_fitness_vector.assert_called_once_with(chromosome)
+    for goal in engine_goals:
+        goal.compute_fitness_values.assert_not_called()
+
+
+def test_fitness_engine_set_after_evaluation(chromosome, engine, engine_goals):
+    chromosome.add_fitness_function(engine_goals[0])
+    engine_goals[0].compute_fitness_values.return_value = ff.FitnessValues(1, 0.0)
+    assert chromosome.get_fitness() == 1
+    chromosome.set_fitness_engine(engine)
+    assert chromosome.get_fitness() == 0.0
+    assert chromosome.fitness_values == {}
+
+
+def test_evaluate_all_fitness_engine(chromosome, engine, engine_goals):
+    other = type(chromosome)()
+    for individual in (chromosome, other):
+        for goal in engine_goals:
+            individual.add_fitness_function(goal)
+        individual.set_fitness_engine(engine)
+    Chromosome.evaluate_all([chromosome, other])
+    assert engine.compute_fitness_vector.call_count == 2
+    assert not chromosome.has_changed()
+    assert other.get_fitness_for(engine_goals[1]) == 0.5
+    for goal in engine_goals:
+        goal.compute_fitness_values_batch.assert_not_called()
@@ -4,6 +4,8 @@
 #
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
+from unittest.mock import MagicMock
+
 import pynguin.ga.fitnessfunction as ff
 
 
@@ -25,3 +27,18 @@ def test_validation_wrong_coverage():
 def test_validation_both_wrong():
     values = ff.FitnessValues(-1, 5)
     assert len(values.validate()) == 2
+
+
+def test_compute_fitness_values_batch():
+    class DummyFitnessFunction(ff.FitnessFunction):
+        def compute_fitness_values(self, individual) -> ff.FitnessValues:
+            return ff.FitnessValues(individual, 0)
+
+        def is_maximisation_function(self) -> bool:
+            return False  # pragma: no cover
+
+    fitness_function = DummyFitnessFunction(MagicMock())
+    assert fitness_function.compute_fitness_values_batch([1, 2]) == [
+        ff.FitnessValues(1, 0),
+        ff.FitnessValues(2, 0),
+    ]
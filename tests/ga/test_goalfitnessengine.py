@@ -0,0 +1,109 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.ga.chromosome as chrom
+import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.goalfitnessengine as gfe
+
+
+class DummyEngine(gfe.GoalFitnessEngine):
+    def compute_fitness_vector(self, individual):
+        pass  # pragma: no cover
+
+
+@pytest.fixture
+def goals():
+    return [MagicMock(ff.FitnessFunction) for _ in range(3)]
+
+
+@pytest.fixture
+def engine(goals):
+    return DummyEngine(goals)
+
+
+def test_goals(engine, goals):
+    assert engine.goals == tuple(goals)
+
+
+def test_index_of(engine, goals):
+    assert engine.index_of(goals[2]) == 2
+    assert engine.index_of(MagicMock(ff.FitnessFunction)) is None
+
+
+@pytest.mark.parametrize(
+    "indices, expected",
+    [
+        pytest.param([], ()),
+        pytest.param([1], (0.5,)),
+        pytest.param([2, 0], (1.0, 0.0)),
+    ],
+)
+def test_create_selector(engine, goals, indices, expected):
+    selector = engine.create_selector([goals[index] for index in indices])
+    assert selector([0.0, 0.5, 1.0]) == expected
+
+
+def test_create_selector_unknown_goal(engine, goals):
+    assert engine.create_selector([goals[0], MagicMock(ff.FitnessFunction)]) is None
+
+
+def _solution(engine, vector):
+    solution = MagicMock(chrom.Chromosome)
+    solution.fitness_engine = engine
+    solution.get_fitness_vector.return_value = vector
+    return solution
+
+
+def test_get_fitness_rows(engine, goals):
+    solutions = [_solution(engine, [0.0, 0.5, 1.0]), _solution(engine, [1, 2, 3])]
+    rows = gfe.get_fitness_rows(solutions, [goals[1], goals[2]])
+    assert rows == [(0.5, 1.0), (2, 3)]
+    for solution in solutions:
+        solution.get_fitness_for.assert_not_called()
+
+
+@pytest.mark.parametrize("other_engine", [None, DummyEngine([])])
+def test_get_fitness_rows_without_shared_engine(engine, goals, other_engine):
+    solutions = [_solution(engine, []), _solution(other_engine, [])]
+    for solution in solutions:
+        solution.get_fitness_for.side_effect = lambda goal: goals.index(goal) / 2
+    rows = gfe.get_fitness_rows(solutions, [goals[2], goals[1]])
+    assert rows == [[1.0, 0.5], [1.0, 0.5]]
+
+
+def test_get_fitness_rows_unmanaged_goal(engine, goals):
+    solution = _solution(engine, [0.0, 0.5, 1.0])
+    goal = MagicMock(ff.FitnessFunction)
+    solution.get_fitness_for.return_value = 42
+    assert gfe.get_fitness_rows([solution], [goals[0], goal]) == [[42, 42]]
+
+
+def test_get_shared_engine(engine):
+    solutions = [_solution(engine, []), _solution(engine, [])]
+    assert gfe.get_shared_engine(solutions) is engine
+
+
+@pytest.mark.parametrize("other_engine", [None, DummyEngine([])])
+def test_get_shared_engine_different_engines(engine, other_engine):
+    solutions = [_solution(engine, []), _solution(other_engine, [])]
+    assert gfe.get_shared_engine(solutions) is None
+
+
+@pytest.mark.parametrize(
+    "vector, expected",
+    [
+        pytest.param([], []),
+        pytest.param([1.0, 0.5], []),
+        pytest.param([0.0, 1.0, 0.0, 0.0], [0, 2, 3]),
+        pytest.param([2.0, 0.0], [1]),
+    ],
+)
+def test_get_covered_indices(vector, expected):
+    assert list(gfe.get_covered_indices(vector)) == expected
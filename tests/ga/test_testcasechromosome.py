@@ -298,9 +298,6 @@ def test_crossover_wrong_type(test_case_chromosome):
 def test_crossover_success():
     test_factory = MagicMock()
     test_case0 = MagicMock(dtc.DefaultTestCase)
-    test_case0_clone = MagicMock(dtc.DefaultTestCase)
-    test_case0_clone.size.return_value = 5
-    test_case0.clone.return_value = test_case0_clone
     test_case1 = MagicMock(dtc.DefaultTestCase)
     test_case1.size.return_value = 7
     left = tcc.TestCaseChromosome(test_case0, test_factory=test_factory)
@@ -308,25 +305,37 @@ def test_crossover_success():
 
     left.cross_over(right, 4, 3)
     assert test_case0.get_statement.call_count == 4
-    assert test_case0_clone.add_statement.call_count == 4
+    assert left.test_case.size() == 4
     assert test_case1.get_statement.call_count == 4
     assert test_factory.append_statement.call_count == 4
+    test_case0.clone.assert_not_called()
 
 
 def test_crossover_too_large():
     test_factory = MagicMock()
     test_case0 = MagicMock(dtc.DefaultTestCase)
-    test_case0_clone = MagicMock(dtc.DefaultTestCase)
-    test_case0_clone.size.return_value = 5
-    test_case0.clone.return_value = test_case0_clone
     test_case1 = MagicMock(dtc.DefaultTestCase)
     test_case1.size.return_value = 7
     left = tcc.TestCaseChromosome(test_case0, test_factory=test_factory)
     right = tcc.TestCaseChromosome(test_case1, test_factory=test_factory)
     config.configuration.search_algorithm.chromosome_length = 3
     left.set_changed(False)
-    left.cross_over(right, 1, 2)
+    left.cross_over(right, 3, 2)
     assert not left.has_changed()
+    assert left.test_case is test_case0
+
+
+def test_crossover_shared_test_case():
+    test_factory = MagicMock()
+    test_case0 = MagicMock(dtc.DefaultTestCase)
+    test_case1 = MagicMock(dtc.DefaultTestCase)
+    test_case1.size.return_value = 7
+    left = tcc.TestCaseChromosome(test_case0, test_factory=test_factory)
+    clone = left.clone()
+    right = tcc.TestCaseChromosome(test_case1, test_factory=test_factory)
+    left.cross_over(right, 4, 3)
+    assert clone.test_case is test_case0
+    test_case0.clone.assert_not_called()
 
 
 def test_is_failing(test_case_chromosome):
@@ -346,3 +355,94 @@ def test_accept(test_case_chromosome):
     visitor = MagicMock()
     test_case_chromosome.accept(visitor)
     visitor.visit_test_case_chromosome.assert_called_once_with(test_case_chromosome)
+
+
+def test_execution_result_outdated_default(test_case_chromosome):
+    assert test_case_chromosome.is_execution_result_outdated()
+
+
+def test_execution_result_not_outdated(test_case_chromosome):
+    test_case_chromosome.set_last_execution_result(MagicMock(ExecutionResult))
+    assert not test_case_chromosome.is_execution_result_outdated()
+    # The fitness values still have to be computed.
+    assert test_case_chromosome.has_changed()
+
+
+def test_execution_result_outdated_after_change(test_case_chromosome):
+    test_case_chromosome.set_last_execution_result(MagicMock(ExecutionResult))
+    test_case_chromosome.set_changed(True)
+    assert test_case_chromosome.is_execution_result_outdated()
+
+
+def test_execution_result_outdated_clone(test_case_chromosome):
+    test_case_chromosome.set_last_execution_result(MagicMock(ExecutionResult))
+    assert not test_case_chromosome.clone().is_execution_result_outdated()
+
+
+def test_clone_shares_test_case(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    clone = chromosome.clone()
+    assert clone._test_case is test_case
+    assert clone == chromosome
+
+
+def test_clone_copies_test_case_on_access(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    clone = chromosome.clone()
+    clone.test_case.add_statement(prim.IntPrimitiveStatement(clone.test_case, 7))
+    assert clone.test_case is not test_case
+    assert clone.size() == 2
+    assert chromosome.size() == 1
+    # The original does not share its test case anymore, thus, it is not copied.
+    assert chromosome.test_case is test_case
+
+
+def test_clone_of_clone_shares_test_case(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    clone = chromosome.clone()
+    clone_of_clone = clone.clone()
+    assert clone.test_case is not test_case
+    assert clone_of_clone._test_case is test_case
+    assert chromosome._is_test_case_shared()
+    assert chromosome.test_case is not clone_of_clone.test_case
+
+
+def test_mutate_shared_uses_test_case_as_backup(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    clone = chromosome.clone()
+    config.configuration.search_algorithm.test_insert_probability = 0.0
+    config.configuration.search_algorithm.test_change_probability = 0.0
+    config.configuration.search_algorithm.test_delete_probability = 1.0
+    with mock.patch.object(test_case, "clone", wraps=test_case.clone) as clone_mock:
+        with mock.patch.object(clone, "_test_factory") as factory_mock:
+            factory_mock.has_call_on_sut.return_value = True
+            factory_mock.delete_statement_gracefully.side_effect = (
+                lambda test, idx: test.remove(idx) is None
+            )
+            clone.mutate()
+        assert clone_mock.call_count == 1
+    assert clone.size() == 0
+    assert chromosome.size() == 1
+    assert chromosome.test_case is test_case
+
+
+def test_mutate_shared_restores_backup(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
+    clone = chromosome.clone()
+    config.configuration.search_algorithm.test_insert_probability = 0.0
+    config.configuration.search_algorithm.test_change_probability = 0.0
+    config.configuration.search_algorithm.test_delete_probability = 1.0
+    with mock.patch.object(clone, "_test_factory") as factory_mock:
+        factory_mock.has_call_on_sut.return_value = False
+        factory_mock.delete_statement_gracefully.side_effect = (
+            lambda test, idx: test.remove(idx) is None
+        )
+        with mock.patch.object(clone, "_mutation_insert"):
+            clone.mutate()
+    assert clone.test_case == test_case
+    assert clone.test_case is not test_case
+    assert chromosome.test_case is test_case
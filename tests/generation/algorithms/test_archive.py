@@ -11,6 +11,7 @@ import pytest
 
 import pynguin.ga.chromosome as chrom
 import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.goalfitnessengine as gfe
 from pynguin.generation.algorithms.archive import Archive
 
 
@@ -76,3 +77,89 @@ def test_update_solution(objectives, chromosomes):
     archive.update(chromosomes)
     solution = archive.solutions
     assert solution == {chromosomes[0]}
+
+
+class DummyEngine(gfe.GoalFitnessEngine):
+    def compute_fitness_vector(self, individual):
+        pass  # pragma: no cover
+
+
+def test_update_reads_fitness_vectors(objectives):
+    engine = DummyEngine(list(objectives))
+    chromosomes = []
+    for size in (3, 2):
+        chromosome = MagicMock(chrom.Chromosome)
+        chromosome.size.return_value = size
+        chromosome.fitness_engine = engine
+        chromosome.get_fitness_vector.return_value = [0.0] * len(objectives)
+        chromosomes.append(chromosome)
+    archive = Archive(objectives)
+    archive.update(chromosomes)
+    assert archive.covered_goals == objectives
+    assert archive.uncovered_goals == set()
+    for chromosome in chromosomes:
+        chromosome.get_fitness_for.assert_not_called()
+
+
+def _engine_solution(engine, size, vector):
+    chromosome = MagicMock(chrom.Chromosome)
+    chromosome.size.return_value = size
+    chromosome.fitness_engine = engine
+    chromosome.get_fitness_vector.return_value = vector
+    return chromosome
+
+
+@pytest.fixture
+def goals() -> List[ff.FitnessFunction]:
+    return [MagicMock(ff.FitnessFunction) for _ in range(3)]
+
+
+def test_update_replaces_longer_solution(goals):
+    engine = DummyEngine(goals)
+    long_solution = _engine_solution(engine, 5, [0.0, 0.0, 1.0])
+    short_solution = _engine_solution(engine, 2, [0.0, 1.0, 1.0])
+    archive = Archive(set(goals))
+    archive.update([long_solution])
+    archive.update([short_solution])
+    assert archive.covered_goals == {goals[0], goals[1]}
+    assert archive.uncovered_goals == {goals[2]}
+    assert archive.solutions == {long_solution, short_solution}
+    shortest_solution = _engine_solution(engine, 1, [0.0, 0.0, 1.0])
+    archive.update([shortest_solution])
+    assert archive.solutions == {shortest_solution}
+
+
+def test_update_keeps_first_of_equally_long_solutions(goals):
+    engine = DummyEngine(goals)
+    solutions = [_engine_solution(engine, 2, [0.0, 1.0, 1.0]) for _ in range(2)]
+    archive = Archive(set(goals))
+    archive.update(solutions)
+    archive.update(reversed(solutions))
+    assert archive.solutions == {solutions[0]}
+
+
+def test_update_objectives_not_managed_by_engine(goals):
+    engine = DummyEngine(goals[:2])
+    solution = _engine_solution(engine, 2, [1.0, 0.0])
+    solution.get_fitness_for.return_value = 0.0
+    archive = Archive(set(goals))
+    archive.update([solution])
+    assert archive.covered_goals == {goals[1], goals[2]}
+    solution.get_fitness_for.assert_called_once_with(goals[2])
+
+
+def test_update_changing_engines(goals):
+    archive = Archive(set(goals))
+    archive.update([_engine_solution(DummyEngine(goals), 2, [1.0, 1.0, 1.0])])
+    solution = _engine_solution(DummyEngine(list(reversed(goals))), 2, [0.0, 1.0, 1.0])
+    archive.update([solution])
+    assert archive.covered_goals == {goals[2]}
+
+
+def test_reset_clears_solutions(goals):
+    engine = DummyEngine(goals)
+    archive = Archive(set(goals))
+    archive.update([_engine_solution(engine, 2, [0.0, 1.0, 1.0])])
+    archive.reset()
+    assert archive.solutions == set()
+    assert archive.uncovered_goals == set(goals)
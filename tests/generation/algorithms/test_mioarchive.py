@@ -7,6 +7,7 @@
 from unittest import mock
 from unittest.mock import MagicMock
 
+import pynguin.generation.algorithms.mioarchive as mioa
 from pynguin.generation.algorithms.mioarchive import (
     MIOArchive,
     Population,
@@ -162,7 +163,7 @@ def test_population_shrink_solution_already_covered():
         assert population.num_solutions == 1
 
 
-def test_population_make_sure_sorted():
+def test_population_make_sure_worst_first():
     population = Population(3)
     with mock.patch.object(population, "_is_pair_better_than_current") as better_mock:
         better_mock.return_value = False
@@ -172,11 +173,29 @@ def test_population_make_sure_sorted():
         population.add_solution(0.2, second)
         population.add_solution(0.1, first)
         population.add_solution(0.3, third)
-        assert [p.test_case_chromosome for p in population._solutions] == [
-            third,
-            second,
-            first,
-        ]
+        assert population._solutions[0].test_case_chromosome is first
+
+
+def test_population_replace_worst_keeps_best():
+    population = Population(3)
+    solutions = [MagicMock() for _ in range(4)]
+    for h, solution in zip((0.2, 0.1, 0.3, 0.25), solutions):
+        population.add_solution(h, solution)
+    assert {pair.test_case_chromosome for pair in population._solutions} == {
+        solutions[0],
+        solutions[2],
+        solutions[3],
+    }
+    assert population._solutions[0].h == 0.2
+
+
+def test_population_shrink_keeps_best():
+    population = Population(4)
+    for h in (0.2, 0.4, 0.1, 0.3):
+        population.add_solution(h, MagicMock())
+    population.shrink_population(2)
+    assert sorted(pair.h for pair in population._solutions) == [0.3, 0.4]
+    assert population._solutions[0].h == 0.3
 
 
 def test_is_better():
@@ -354,3 +373,64 @@ def test_archive_num_covered_targets():
     clone.get_fitness_for.return_value = 0.0
     archive.update_archive(solution)
     assert archive.num_covered_targets == 1
+
+
+def test_counter_index_choose_empty():
+    index = mioa._CounterIndex()
+    assert index.choose() is None
+    assert len(index) == 0
+
+
+def test_counter_index_choose_lowest_counter():
+    index = mioa._CounterIndex()
+    index.add("foo", 3)
+    index.add("bar", 1)
+    index.add("baz", 2)
+    assert index.choose() == "bar"
+    index.update("bar", 4)
+    assert index.choose() == "baz"
+    index.remove("baz")
+    assert index.choose() == "foo"
+    assert "baz" not in index
+    assert len(index) == 2
+
+
+def test_counter_index_choose_ties_at_random():
+    index = mioa._CounterIndex()
+    for target in ("foo", "bar", "baz"):
+        index.add(target, 0)
+    index.remove("foo")
+    assert {index.choose() for _ in range(100)} == {"bar", "baz"}
+
+
+def _solution_with_fitness(fitness_values):
+    solution = MagicMock()
+    clone = MagicMock()
+    solution.clone.return_value = clone
+    clone.get_fitness_for.side_effect = lambda target: fitness_values[target]
+    clone.get_last_execution_result.return_value.has_test_exceptions.return_value = (
+        False
+    )
+    return solution
+
+
+def test_archive_get_solution_prefers_lowest_counter():
+    targets = [MagicMock(), MagicMock()]
+    archive = MIOArchive(targets, 3)
+    archive.update_archive(_solution_with_fitness({targets[0]: 0.5, targets[1]: 0.5}))
+    archive.get_solution()
+    counters = [archive._archive[target].counter for target in targets]
+    assert sorted(counters) == [0, 1]
+    archive.get_solution()
+    assert [archive._archive[target].counter for target in targets] == [1, 1]
+
+
+def test_archive_get_solution_prefers_uncovered():
+    targets = [MagicMock(), MagicMock()]
+    archive = MIOArchive(targets, 3)
+    archive.update_archive(_solution_with_fitness({targets[0]: 0.0, targets[1]: 0.5}))
+    for _ in range(3):
+        archive.get_solution()
+    assert archive._archive[targets[0]].counter == 0
+    assert archive._archive[targets[1]].counter == 3
+    assert archive.num_covered_targets == 1
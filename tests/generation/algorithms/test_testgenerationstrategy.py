@@ -9,8 +9,11 @@ from unittest.mock import MagicMock
 import pytest
 
 import pynguin.ga.chromosome as chrom
+import pynguin.ga.testcasechromosome as tcc
 from pynguin.generation.algorithms.testgenerationstrategy import TestGenerationStrategy
 from pynguin.generation.stoppingconditions.stoppingcondition import StoppingCondition
+from pynguin.testcase.execution.executionresult import ExecutionResult
+from pynguin.testcase.execution.testcaseexecutor import TestCaseExecutor
 
 
 class _TestGenerationStrategy(TestGenerationStrategy):
@@ -38,3 +41,23 @@ def test_is_not_fulfilled(algorithm):
     stopping_condition = MagicMock(StoppingCondition)
     stopping_condition.is_fulfilled.return_value = False
     assert not algorithm.is_fulfilled(stopping_condition)
+
+
+def test_execute_outdated_test_cases(algorithm):
+    executor = MagicMock(TestCaseExecutor)
+    result = MagicMock(ExecutionResult)
+    executor.execute_many.return_value = [result]
+    algorithm.executor = executor
+    outdated = tcc.TestCaseChromosome(MagicMock())
+    up_to_date = tcc.TestCaseChromosome(MagicMock())
+    up_to_date.set_last_execution_result(MagicMock(ExecutionResult))
+    algorithm._execute_outdated_test_cases([outdated, up_to_date])
+    executor.execute_many.assert_called_once_with([outdated.test_case])
+    assert outdated.get_last_execution_result() == result
+
+
+def test_execute_outdated_test_cases_nothing_outdated(algorithm):
+    executor = MagicMock(TestCaseExecutor)
+    algorithm.executor = executor
+    algorithm._execute_outdated_test_cases([])
+    executor.execute_many.assert_not_called()
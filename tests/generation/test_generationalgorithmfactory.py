@@ -71,3 +71,19 @@ def test_unknown_strategy(algorithm_factory):
     config.configuration.algorithm = MagicMock()
     with pytest.raises(ConfigurationException):
         algorithm_factory.get_search_algorithm()
+
+
+@pytest.mark.parametrize(
+    "algorithm, has_engine",
+    [
+        pytest.param(config.Algorithm.MOSA, True),
+        pytest.param(config.Algorithm.DYNAMOSA, True),
+        pytest.param(config.Algorithm.MIO, True),
+        pytest.param(config.Algorithm.RANDOM_TEST_CASE_SEARCH, False),
+        pytest.param(config.Algorithm.WHOLE_SUITE, False),
+    ],
+)
+def test_fitness_engine(algorithm, has_engine, algorithm_factory):
+    config.configuration.algorithm = algorithm
+    strategy = algorithm_factory.get_search_algorithm()
+    assert (strategy.fitness_engine is not None) == has_engine
@@ -7,6 +7,7 @@
 import importlib
 import os
 import threading
+from types import FunctionType
 from unittest import mock
 from unittest.mock import MagicMock, call
 
@@ -54,6 +55,13 @@ def test_entered_function(simple_module, tracer_mock):
     tracer_mock.executed_code_object.assert_called_once()
 
 
+def test_analysis_time(simple_module, tracer_mock):
+    instr = BranchCoverageInstrumentation(tracer_mock)
+    assert instr.analysis_time == 0.0
+    instr._instrument_code_recursive(simple_module.for_loop.__code__)
+    assert instr.analysis_time > 0.0
+
+
 def test_entered_for_loop_no_jump(simple_module, tracer_mock):
     instr = BranchCoverageInstrumentation(tracer_mock)
     simple_module.for_loop.__code__ = instr._instrument_code_recursive(
@@ -233,6 +241,66 @@ def test_integrate_branch_distance_instrumentation(
     assert len(list(tracer.get_known_data().existing_predicates)) == branches_count
 
 
+@pytest.mark.parametrize(
+    "function_name, args",
+    [
+        pytest.param("cmp_predicate", (1, 2)),
+        pytest.param("bool_predicate", (True,)),
+        pytest.param("for_loop", (3,)),
+        pytest.param("full_for_loop", (3,)),
+        pytest.param("multi_loop", (3,)),
+        pytest.param("comprehension", (10, 3)),
+        pytest.param("conditional_assignment", (0,)),
+        pytest.param("conditionally_nested_class", (6,)),
+    ],
+)
+def test_adaptive_instrumentation_same_distances(simple_module, function_name, args):
+    traces = []
+    for adaptive in (False, True):
+        tracer = ExecutionTracer()
+        tracer.current_thread_ident = threading.currentThread().ident
+        function_callable = getattr(simple_module, function_name)
+        code = BranchCoverageInstrumentation(
+            tracer, adaptive
+        )._instrument_code_recursive(function_callable.__code__, 0)
+        result = FunctionType(code, function_callable.__globals__)(*args)
+        traces.append((result, tracer.get_trace()))
+    (result, trace), (adaptive_result, adaptive_trace) = traces
+    assert result == adaptive_result
+    assert trace.true_distances == adaptive_trace.true_distances
+    assert trace.false_distances == adaptive_trace.false_distances
+    assert trace.executed_predicates.keys() == adaptive_trace.executed_predicates.keys()
+
+
+def test_adaptive_instrumentation_skips_saturated_predicate(comparison_module):
+    tracer = ExecutionTracer()
+    tracer.current_thread_ident = threading.currentThread().ident
+    function_callable = comparison_module._lt
+    function_callable.__code__ = BranchCoverageInstrumentation(
+        tracer, True
+    )._instrument_code_recursive(function_callable.__code__, 0)
+    function_callable(1, 2)
+    assert list(tracer.saturated_predicates) == [0]
+    function_callable(2, 1)
+    assert list(tracer.saturated_predicates) == [1]
+    with mock.patch.object(tracer, "executed_compare_predicate") as trace_mock:
+        function_callable(1, 2)
+        trace_mock.assert_not_called()
+        tracer.clear_trace()
+        function_callable(1, 2)
+        trace_mock.assert_called_once_with(1, 2, 0, Compare.LT)
+
+
+def test_adaptive_instrumentation_keeps_for_loop_semantics(simple_module):
+    tracer = ExecutionTracer()
+    tracer.current_thread_ident = threading.currentThread().ident
+    simple_module.multi_loop.__code__ = BranchCoverageInstrumentation(
+        tracer, True
+    )._instrument_code_recursive(simple_module.multi_loop.__code__, 0)
+    assert simple_module.multi_loop(3) == 9
+    assert simple_module.multi_loop(0) == 0
+
+
 @pytest.mark.parametrize(
     "op",
     [pytest.param(op) for op in Compare if op != Compare.EXC_MATCH],
@@ -0,0 +1,131 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+import io
+import threading
+from unittest import mock
+
+from bytecode import ControlFlowGraph, Instr
+
+import pynguin.instrumentation.instrumentationcache as ic
+from pynguin.instrumentation.instrumentation import BranchCoverageInstrumentation
+from pynguin.testcase.execution.executiontracer import ExecutionTracer
+
+SOURCE = b"""
+def foo(x):
+    for i in range(x):
+        if i > 3:
+            return i
+    return -1
+"""
+
+
+def _instrument(tracer):
+    return BranchCoverageInstrumentation(tracer, True).instrument_module(
+        compile(SOURCE, "foo", "exec")
+    )
+
+
+def test_key_depends_on_source_and_settings():
+    key = ic.InstrumentationCache.key(SOURCE, (True, False))
+    assert key == ic.InstrumentationCache.key(SOURCE, (True, False))
+    assert key != ic.InstrumentationCache.key(SOURCE + b"\n", (True, False))
+    assert key != ic.InstrumentationCache.key(SOURCE, (False, False))
+
+
+def test_key_depends_on_implementation():
+    key = ic.InstrumentationCache.key(SOURCE, (True, False))
+    with mock.patch.object(ic, "_implementation_digest", return_value="other"):
+        assert key != ic.InstrumentationCache.key(SOURCE, (True, False))
+
+
+def test_load_missing(tmp_path):
+    cache = ic.InstrumentationCache(str(tmp_path))
+    assert cache.load("foo", "key", ExecutionTracer()) is None
+
+
+def test_load_corrupt(tmp_path):
+    (tmp_path / "foo-key.pickle").write_bytes(b"no pickle")
+    cache = ic.InstrumentationCache(str(tmp_path))
+    assert cache.load("foo", "key", ExecutionTracer()) is None
+
+
+def test_load_foreign_entry(tmp_path):
+    with open(tmp_path / "foo-key.pickle", "wb") as file:
+        ic._CachePickler(file, {}).dump(("no code", "no known data"))
+    cache = ic.InstrumentationCache(str(tmp_path))
+    assert cache.load("foo", "key", ExecutionTracer()) is None
+
+
+def test_store_and_load(tmp_path):
+    tracer = ExecutionTracer()
+    cache = ic.InstrumentationCache(str(tmp_path / "cache"))
+    cache.store("foo", "key", _instrument(tracer), tracer)
+
+    other_tracer = ExecutionTracer()
+    other_tracer.current_thread_ident = threading.currentThread().ident
+    code = cache.load("foo", "key", other_tracer)
+    assert code is not None
+    known_data = other_tracer.get_known_data()
+    assert known_data.existing_code_objects.keys() == {0, 1}
+    assert known_data.existing_predicates.keys() == {0, 1}
+    assert len(other_tracer.saturated_predicates) == 2
+    namespace = {}
+    exec(code, namespace)  # pylint: disable=exec-used
+    other_tracer.clear_trace()
+    assert namespace["foo"](10) == 4
+    assert dict(other_tracer.get_trace().executed_predicates) == {0: 5, 1: 1}
+    assert dict(other_tracer.get_trace().true_distances) == {0: 0.0, 1: 0.0}
+
+
+def test_store_creates_private_directory(tmp_path):
+    tracer = ExecutionTracer()
+    cache = ic.InstrumentationCache(str(tmp_path / "cache"))
+    cache.store("foo", "key", _instrument(tracer), tracer)
+    assert (tmp_path / "cache").stat().st_mode & 0o077 == 0
+
+
+def test_store_failure_is_ignored(tmp_path):
+    cache = ic.InstrumentationCache(str(tmp_path))
+    tracer = ExecutionTracer()
+    tracer.get_known_data().existing_predicates[0] = lambda: None
+    cache.store("foo", "key", _instrument(ExecutionTracer()), tracer)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_write_leaves_no_temporary_file(tmp_path):
+    cache = ic.InstrumentationCache(str(tmp_path))
+    tracer = ExecutionTracer()
+    with mock.patch("os.replace", side_effect=OSError("cannot replace")):
+        cache.store("foo", "key", _instrument(tracer), tracer)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_pickle_long_block_chain():
+    bytecode_cfg = ControlFlowGraph()
+    previous = bytecode_cfg[0]
+    previous.append(Instr("NOP"))
+    for _ in range(5000):
+        block = bytecode_cfg.add_block([Instr("NOP")])
+        previous.next_block = block
+        previous = block
+    previous.extend([Instr("LOAD_CONST", None), Instr("RETURN_VALUE")])
+    bytecode_cfg[0].append(Instr("JUMP_ABSOLUTE", previous))
+
+    data = io.BytesIO()
+    pickler = ic._CachePickler(data, {"unset": ic.UNSET})
+    pickler.dump(bytecode_cfg)
+    pickler.dump_blocks()
+    data.seek(0)
+    unpickler = ic._CacheUnpickler(data, {"unset": ic.UNSET})
+    restored = unpickler.load()
+    unpickler.load_blocks()
+
+    assert len(restored) == len(bytecode_cfg)
+    assert restored[0][-1].arg is restored[-1]
+    assert restored[0].next_block is restored[1]
+    assert restored.get_block_index(restored[-1]) == len(bytecode_cfg) - 1
+    assert restored.to_code().co_code == bytecode_cfg.to_code().co_code
@@ -7,9 +7,12 @@
 import asyncio
 import importlib
 import threading
+from unittest import mock
 
+import pynguin.configuration as config
 from pynguin.instrumentation.machinery import install_import_hook
 from pynguin.testcase.execution.executiontracer import ExecutionTracer
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 
 def test_hook():
@@ -21,6 +24,21 @@ def test_hook():
         assert module.function(6) == 0
 
 
+def test_hook_tracks_analysis_time():
+    tracer = ExecutionTracer()
+    with mock.patch(
+        "pynguin.utils.statistics.statistics.track_output_variable"
+    ) as track_mock:
+        with install_import_hook("tests.fixtures.instrumentation.mixed", tracer):
+            module = importlib.import_module("tests.fixtures.instrumentation.mixed")
+            importlib.reload(module)
+    # The module is analysed twice, if it was not imported before.
+    assert track_mock.call_count in (1, 2)
+    for call in track_mock.call_args_list:
+        assert call[0][0] == RuntimeVariable.AnalysisTime
+        assert call[0][1] > 0.0
+
+
 def test_module_instrumentation_integration():
     """Small integration test, which tests the instrumentation for various function types."""
     tracer = ExecutionTracer()
@@ -46,3 +64,45 @@ async def run_async_generator(gen):
     async for i in gen:
         the_sum += i
     return the_sum
+
+
+def test_module_instrumentation_cache(tmp_path):
+    config.configuration.execution.instrumentation_cache_dir = str(tmp_path)
+    try:
+        results = []
+        for _ in range(2):
+            tracer = ExecutionTracer()
+            tracer.current_thread_ident = threading.currentThread().ident
+            with install_import_hook("tests.fixtures.instrumentation.mixed", tracer):
+                mixed = importlib.import_module("tests.fixtures.instrumentation.mixed")
+                mixed = importlib.reload(mixed)
+                tracer.clear_trace()
+                assert mixed.function(6) == 0
+            results.append(
+                (
+                    len(tracer.get_known_data().existing_code_objects),
+                    dict(tracer.get_trace().executed_predicates),
+                    tracer.get_trace().executed_code_objects,
+                )
+            )
+    finally:
+        config.configuration.execution.instrumentation_cache_dir = None
+    assert len(list(tmp_path.iterdir())) == 1
+    assert results[0] == results[1]
+
+
+def test_cached_instrumentation_tracks_no_analysis_time(tmp_path):
+    config.configuration.execution.instrumentation_cache_dir = str(tmp_path)
+    analysis_times = []
+    for _ in range(2):
+        with mock.patch(
+            "pynguin.utils.statistics.statistics.track_output_variable"
+        ) as track_mock:
+            with install_import_hook(
+                "tests.fixtures.instrumentation.mixed", ExecutionTracer()
+            ):
+                module = importlib.import_module("tests.fixtures.instrumentation.mixed")
+                importlib.reload(module)
+        analysis_times.append([call[0][1] for call in track_mock.call_args_list])
+    assert analysis_times[0][0] > 0.0
+    assert all(time == 0.0 for time in analysis_times[1])
@@ -9,9 +9,14 @@ from unittest.mock import MagicMock
 
 import pytest
 
+import pynguin.configuration as config
 from pynguin.setup.testcluster import TestCluster
+from pynguin.typeinference.strategy import InferredSignature
 from pynguin.utils.exceptions import ConstructionFailedException
-from pynguin.utils.generic.genericaccessibleobject import GenericMethod
+from pynguin.utils.generic.genericaccessibleobject import (
+    GenericConstructor,
+    GenericMethod,
+)
 from pynguin.utils.type_utils import COLLECTIONS, PRIMITIVES
 
 
@@ -119,9 +124,15 @@ def test_select_concrete_type_union_unary(type_, result):
     assert TestCluster().select_concrete_type(type_) in result
 
 
+def _add_mock_generator(cluster):
+    generator = MagicMock(GenericMethod)
+    generator.generated_type.return_value = MagicMock
+    cluster.add_generator(generator)
+
+
 def test_select_concrete_type_any():
     cluster = TestCluster()
-    cluster._generators[MagicMock] = MagicMock
+    _add_mock_generator(cluster)
     assert cluster.select_concrete_type(Any) in list(PRIMITIVES) + list(COLLECTIONS) + [
         MagicMock
     ]
@@ -134,7 +145,112 @@ def test_get_all_generatable_types_only_primitive():
 
 def test_get_all_generatable_types():
     cluster = TestCluster()
-    cluster._generators[MagicMock] = MagicMock
+    _add_mock_generator(cluster)
     assert cluster.get_all_generatable_types() == [MagicMock] + list(PRIMITIVES) + list(
         COLLECTIONS
     )
+
+
+def test_get_random_generatable_type():
+    cluster = TestCluster()
+    _add_mock_generator(cluster)
+    assert cluster.get_random_generatable_type() in (
+        [MagicMock] + list(PRIMITIVES) + list(COLLECTIONS)
+    )
+
+
+class _First:
+    pass
+
+
+class _Second:
+    pass
+
+
+class _Third:
+    pass
+
+
+class _Cyclic:
+    pass
+
+
+def _signature(parameters, return_type):
+    return InferredSignature(
+        signature=MagicMock(), parameters=parameters, return_type=return_type
+    )
+
+
+@pytest.fixture
+def cluster_with_depths():
+    cluster = TestCluster()
+    first = GenericConstructor(_First, _signature({}, _First))
+    second = GenericConstructor(_Second, _signature({"first": _First}, _Second))
+    third_by_method = GenericMethod(
+        _First, MagicMock(), _signature({"value": int}, _Third)
+    )
+    third_by_constructor = GenericConstructor(
+        _Third, _signature({"second": _Second}, _Third)
+    )
+    cyclic = GenericConstructor(_Cyclic, _signature({"cyclic": _Cyclic}, _Cyclic))
+    for generator in (first, second, third_by_constructor, third_by_method, cyclic):
+        cluster.add_generator(generator)
+    cluster.freeze()
+    return cluster, third_by_method, third_by_constructor
+
+
+@pytest.mark.parametrize(
+    "recursion_depth,feasible",
+    [
+        pytest.param(0, [0, 1]),
+        pytest.param(5, [0, 1]),
+        pytest.param(6, [0]),
+        pytest.param(8, [0]),
+        pytest.param(9, []),
+    ],
+)
+def test_get_feasible_generators_for(cluster_with_depths, recursion_depth, feasible):
+    config.configuration.test_creation.max_recursion = 10
+    cluster, third_by_method, third_by_constructor = cluster_with_depths
+    generators = (third_by_method, third_by_constructor)
+    assert cluster.get_feasible_generators_for(_Third, recursion_depth) == tuple(
+        generators[i] for i in feasible
+    )
+
+
+@pytest.mark.parametrize(
+    "type_,recursion_depth,feasible",
+    [
+        pytest.param(_First, 9, True),
+        pytest.param(_First, 10, False),
+        pytest.param(_Second, 7, True),
+        pytest.param(_Second, 8, False),
+        pytest.param(_Cyclic, 0, False),
+        pytest.param(MagicMock, 0, False),
+    ],
+)
+def test_get_feasible_generators_for_types(
+    cluster_with_depths, type_, recursion_depth, feasible
+):
+    config.configuration.test_creation.max_recursion = 10
+    cluster, _, _ = cluster_with_depths
+    assert bool(cluster.get_feasible_generators_for(type_, recursion_depth)) == (
+        feasible
+    )
+
+
+def test_freeze():
+    cluster = TestCluster()
+    assert not cluster.frozen
+    cluster.freeze()
+    assert cluster.frozen
+    with pytest.raises(AssertionError):
+        cluster.add_modifier(int, MagicMock(GenericMethod))
+
+
+def test_index_rebuilt_after_modification():
+    cluster = TestCluster()
+    assert cluster.get_random_accessible() is None
+    accessible = MagicMock(GenericMethod)
+    cluster.add_accessible_object_under_test(accessible)
+    assert cluster.get_random_accessible() is accessible
@@ -8,8 +8,15 @@ from pathlib import Path
 from unittest import mock
 from unittest.mock import MagicMock
 
+import pytest
+
 import pynguin.configuration as config
 import pynguin.generator as gen
+from pynguin.testcase.execution.executiontracer import (
+    ExecutionTracer,
+    FastExecutionTracer,
+)
+from pynguin.testcase.execution.paralleltestcaseexecutor import ParallelTestCaseExecutor
 
 
 def test_init_with_configuration():
@@ -94,6 +101,19 @@ def test_setup_hook():
         hook_mock.assert_called_once()
 
 
+@pytest.mark.parametrize(
+    "fast_tracer,tracer_class", [(True, FastExecutionTracer), (False, ExecutionTracer)]
+)
+def test_setup_hook_tracer(fast_tracer, tracer_class):
+    gen.set_configuration(
+        configuration=MagicMock(
+            log_file=None, execution=MagicMock(fast_tracer=fast_tracer)
+        )
+    )
+    with mock.patch.object(gen, "install_import_hook"):
+        assert type(gen._setup_import_hook()) is tracer_class
+
+
 def test_run(tmp_path):
     gen.set_configuration(
         configuration=MagicMock(log_file=None, project_path=tmp_path / "nope")
@@ -121,3 +141,26 @@ def test_integrate(tmp_path):
     gen.set_configuration(configuration)
     result = gen.run_pynguin()
     assert result == gen.ReturnCode.OK
+
+
+def test_setup_executor_sequential():
+    config.configuration.execution.number_of_workers = 1
+    executor = gen._setup_executor(MagicMock())
+    assert not isinstance(executor, ParallelTestCaseExecutor)
+
+
+def test_setup_executor_parallel():
+    config.configuration.execution.number_of_workers = 4
+    with mock.patch.object(ParallelTestCaseExecutor, "is_supported") as supported:
+        supported.return_value = True
+        executor = gen._setup_executor(MagicMock())
+    assert isinstance(executor, ParallelTestCaseExecutor)
+    assert executor.number_of_workers == 4
+
+
+def test_setup_executor_parallel_not_supported():
+    config.configuration.execution.number_of_workers = 4
+    with mock.patch.object(ParallelTestCaseExecutor, "is_supported") as supported:
+        supported.return_value = False
+        executor = gen._setup_executor(MagicMock())
+    assert not isinstance(executor, ParallelTestCaseExecutor)
@@ -6,8 +6,10 @@
 #
 from unittest.mock import MagicMock
 
+import astor
 import pytest
 
+from pynguin.testcase.execution.compiledcodecache import CompiledCodeCache
 from pynguin.testcase.execution.executioncontext import ExecutionContext
 
 
@@ -32,3 +34,48 @@ def test_get_variable_value_success():
     name = ctx._variable_names.get_name(test_var)
     ctx._local_namespace[name] = "foo"
     assert ctx.get_variable_value(test_var) == "foo"
+
+
+def test_executable_code_for_caches_code(short_test_case):
+    cache = CompiledCodeCache(10)
+    ctx = ExecutionContext()
+    first = [
+        ctx.executable_code_for(statement, cache)
+        for statement in short_test_case.statements
+    ]
+    ctx = ExecutionContext()
+    second = [
+        ctx.executable_code_for(statement, cache)
+        for statement in short_test_case.clone().statements
+    ]
+    assert cache.hits == 2
+    assert cache.misses == 2
+    assert first == second
+    assert "module0" in ctx.global_namespace
+
+
+def test_executable_code_for_executes(short_test_case):
+    ctx = ExecutionContext()
+    int_stmt = short_test_case.statements[0]
+    code = ctx.executable_code_for(int_stmt, CompiledCodeCache(10))
+    exec(code, ctx.global_namespace, ctx.local_namespace)  # nosec
+    assert ctx.get_variable_value(int_stmt.ret_val) == 5
+
+
+def test_executable_node_for_test_case(short_test_case):
+    ctx = ExecutionContext()
+    module = ctx.executable_node_for_test_case(short_test_case)
+    assert [node.lineno for node in module.body] == [1, 2]
+    assert astor.to_source(module) == ("var0 = 5\nvar1 = module0.SomeType(var0)\n")
+    assert "module0" in ctx.global_namespace
+
+
+def test_executable_code_for_test_case_caches_code(short_test_case):
+    cache = CompiledCodeCache(10)
+    first = ExecutionContext().executable_code_for_test_case(short_test_case, cache)
+    second = ExecutionContext().executable_code_for_test_case(
+        short_test_case.clone(), cache
+    )
+    assert first is second
+    assert cache.hits == 1
+    assert cache.misses == 1
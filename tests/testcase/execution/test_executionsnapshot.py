@@ -0,0 +1,91 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+from unittest import mock
+
+import pytest
+
+from pynguin.testcase.execution.executionsnapshot import (
+    ExecutionSnapshot,
+    ExecutionSnapshotCache,
+)
+from pynguin.testcase.execution.executiontrace import ExecutionTrace
+
+
+@pytest.fixture()
+def snapshot():
+    return ExecutionSnapshot({"var0": 42}, ExecutionTrace())
+
+
+def test_prefix_keys_are_chained():
+    keys = ExecutionSnapshotCache.prefix_keys(["a", "b", "c"])
+    assert len(keys) == 3
+    assert ExecutionSnapshotCache.prefix_keys(["a", "b"]) == keys[:2]
+    assert ExecutionSnapshotCache.prefix_keys(["b", "b"])[1] != keys[1]
+
+
+def test_no_prefix():
+    cache = ExecutionSnapshotCache(10)
+    assert cache.get_longest_prefix(["a", "b"]) == (0, None)
+
+
+def test_longest_prefix(snapshot):
+    other = ExecutionSnapshot({}, ExecutionTrace())
+    cache = ExecutionSnapshotCache(10)
+    cache.put(["a", "b", "c", "d"], {1: other, 2: snapshot, 4: other})
+    assert cache.get_longest_prefix(["a", "b", "c"]) == (2, snapshot)
+
+
+def test_complete_test_case(snapshot):
+    cache = ExecutionSnapshotCache(10)
+    cache.put(["a", "b"], {2: snapshot})
+    assert cache.get_longest_prefix(["a", "b"]) == (2, snapshot)
+
+
+def test_colliding_key_is_not_a_prefix(snapshot):
+    cache = ExecutionSnapshotCache(10)
+    cache.put(["a", "b"], {2: snapshot})
+    with mock.patch.object(ExecutionSnapshotCache, "prefix_keys", return_value=[0, 1]):
+        assert cache.get_longest_prefix(["a", "c"]) == (0, None)
+
+
+def test_evicts_least_recently_used_test_case(snapshot):
+    cache = ExecutionSnapshotCache(2)
+    cache.put(["a", "b"], {1: snapshot, 2: snapshot})
+    cache.put(["b"], {1: snapshot})
+    cache.get_longest_prefix(["a"])
+    cache.put(["c"], {1: snapshot})
+    assert len(cache) == 3
+    assert cache.get_longest_prefix(["b"]) == (0, None)
+    assert cache.get_longest_prefix(["a", "b"]) == (2, snapshot)
+
+
+def test_keeps_prefix_shared_with_recent_test_case(snapshot):
+    other = ExecutionSnapshot({}, ExecutionTrace())
+    cache = ExecutionSnapshotCache(1)
+    cache.put(["a", "b"], {1: snapshot, 2: snapshot})
+    cache.put(["a", "c"], {1: other, 2: other})
+    assert len(cache) == 2
+    assert cache.get_longest_prefix(["a", "b"]) == (1, other)
+
+
+def test_record_reuse():
+    cache = ExecutionSnapshotCache(10)
+    cache.record_reuse(2)
+    cache.record_reuse(3)
+    assert cache.reused_statements == 5
+
+
+def test_disabled(snapshot):
+    cache = ExecutionSnapshotCache(0)
+    cache.put(["a"], {1: snapshot})
+    assert not cache.enabled
+    assert len(cache) == 0
+
+
+def test_negative_size():
+    with pytest.raises(AssertionError):
+        ExecutionSnapshotCache(-1)
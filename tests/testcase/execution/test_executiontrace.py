@@ -4,7 +4,15 @@
 #
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
-from pynguin.testcase.execution.executiontrace import ExecutionTrace
+import math
+
+import pytest
+
+from pynguin.testcase.execution.executiontrace import (
+    ExecutionTrace,
+    PredicateCounts,
+    PredicateDistances,
+)
 
 
 def test_merge():
@@ -54,7 +62,163 @@ def test_merge_full():
 
 
 def test_merge_min():
-    dict0 = {0: 0.5, 1: 0.2}
-    dict1 = {0: 0.3, 1: 0.6}
-    ExecutionTrace._merge_min(dict0, dict1)
-    assert dict0 == {0: 0.3, 1: 0.2}
+    distances0 = PredicateDistances()
+    distances0.update({0: 0.5, 1: 0.2})
+    distances1 = PredicateDistances()
+    distances1.update({0: 0.3, 1: 0.6, 2: 0.1})
+    distances0.merge(distances1)
+    assert distances0 == {0: 0.3, 1: 0.2, 2: 0.1}
+
+
+def test_merge_add():
+    counts0 = PredicateCounts()
+    counts0.update({0: 1, 3: 2})
+    counts1 = PredicateCounts()
+    counts1.update({0: 2})
+    counts0.merge(counts1)
+    assert counts0 == {0: 3, 3: 2}
+
+
+def test_for_predicates():
+    trace = ExecutionTrace.for_predicates(5)
+    assert trace == ExecutionTrace()
+    assert len(trace.executed_predicates) == 0
+
+
+def test_predicate_values_missing():
+    distances = PredicateDistances(3)
+    assert 1 not in distances
+    assert 5 not in distances
+    assert distances.get(1) is None
+    with pytest.raises(KeyError):
+        distances[1]  # pylint: disable=pointless-statement
+    with pytest.raises(KeyError):
+        distances[-1]  # pylint: disable=pointless-statement
+
+
+def test_predicate_values_set_and_get():
+    counts = PredicateCounts()
+    counts[4] = 2
+    assert counts[4] == 2
+    assert counts.get(4) == 2
+    assert 4 in counts
+    assert list(counts.items()) == [(4, 2)]
+    assert len(counts) == 1
+
+
+def test_predicate_values_delete():
+    counts = PredicateCounts()
+    counts[1] = 2
+    del counts[1]
+    assert counts == {}
+    with pytest.raises(KeyError):
+        del counts[1]
+
+
+def test_predicate_values_negative_key():
+    with pytest.raises(AssertionError):
+        PredicateCounts()[-1] = 1
+
+
+def test_predicate_distances_infinite_distance_is_missing():
+    distances = PredicateDistances()
+    distances[0] = math.inf
+    assert 0 not in distances
+
+
+def test_predicate_values_repr():
+    distances = PredicateDistances()
+    distances[0] = 1.0
+    assert repr(distances) == "PredicateDistances({0: 1.0})"
+
+
+@pytest.mark.parametrize("number_of_values", [1, 10])
+def test_merge_sparse_and_dense(number_of_values):
+    distances0 = PredicateDistances(10)
+    distances0[1] = 0.5
+    distances1 = PredicateDistances(10)
+    distances1.update({idx: 1.0 / (idx + 1) for idx in range(number_of_values)})
+    distances0.merge(distances1)
+    expected = {idx: 1.0 / (idx + 1) for idx in range(number_of_values)}
+    expected[1] = 0.5
+    assert distances0 == expected
+    assert len(distances0) == len(expected)
+
+
+def test_values_array():
+    counts = PredicateCounts(3)
+    counts[1] = 4
+    assert list(counts.values_array) == [0, 4, 0]
+
+
+def test_set_default_removes_value():
+    counts = PredicateCounts()
+    counts[1] = 4
+    counts[1] = 0
+    assert counts == {}
+
+
+def test_reserve_predicates():
+    trace = ExecutionTrace()
+    trace.reserve_predicates(3)
+    assert len(trace.executed_predicates.values_array) == 3
+    assert len(trace.true_distances.values_array) == 3
+    assert len(trace.false_distances.values_array) == 3
+    assert trace == ExecutionTrace()
+
+
+@pytest.mark.parametrize("number_of_predicates", [0, 3])
+def test_update_predicate(number_of_predicates):
+    trace = ExecutionTrace.for_predicates(number_of_predicates)
+    assert not trace.update_predicate(2, 3.0, 0.0)
+    assert trace.update_predicate(2, 0.0, 5.0)
+    assert trace.update_predicate(2, 1.0, 0.0)
+    assert not trace.update_predicate(1, math.inf, 0.0)
+    assert dict(trace.executed_predicates) == {2: 3, 1: 1}
+    assert dict(trace.true_distances) == {2: 0.0}
+    assert dict(trace.false_distances) == {2: 0.0, 1: 0.0}
+    assert list(trace.false_distances) == [2, 1]
+
+
+def test_fingerprint_independent_of_size():
+    trace0 = ExecutionTrace.for_predicates(10)
+    trace1 = ExecutionTrace()
+    for trace in (trace0, trace1):
+        trace.executed_code_objects.add(0)
+        trace.update_predicate(2, 0.0, 3.0)
+    assert trace0.get_fingerprint() == trace1.get_fingerprint()
+
+
+def test_fingerprint_ignores_counts():
+    trace0 = ExecutionTrace()
+    trace0.update_predicate(1, 0.0, 3.0)
+    trace1 = ExecutionTrace()
+    trace1.update_predicate(1, 0.0, 3.0)
+    trace1.update_predicate(1, 0.0, 3.0)
+    assert trace0.get_fingerprint() == trace1.get_fingerprint()
+
+
+@pytest.mark.parametrize(
+    "code_object, predicate, distance_true, distance_false",
+    [
+        pytest.param(1, 1, 0.0, 3.0),
+        pytest.param(0, 2, 0.0, 3.0),
+        pytest.param(0, 1, 1.0, 3.0),
+        pytest.param(0, 1, 0.0, 2.0),
+    ],
+)
+def test_fingerprint_differs(code_object, predicate, distance_true, distance_false):
+    trace0 = ExecutionTrace()
+    trace0.executed_code_objects.add(0)
+    trace0.update_predicate(1, 0.0, 3.0)
+    trace1 = ExecutionTrace()
+    trace1.executed_code_objects.add(code_object)
+    trace1.update_predicate(predicate, distance_true, distance_false)
+    assert trace0.get_fingerprint() != trace1.get_fingerprint()
+
+
+def test_fingerprint_contains_executed_predicates():
+    trace0 = ExecutionTrace()
+    trace1 = ExecutionTrace()
+    trace1.executed_predicates[0] = 1
+    assert trace0.get_fingerprint() != trace1.get_fingerprint()
@@ -14,6 +14,7 @@ from bytecode import Compare
 from pynguin.testcase.execution.executiontracer import (
     CodeObjectMetaData,
     ExecutionTracer,
+    FastExecutionTracer,
     _le,
     _lt,
 )
@@ -41,8 +42,9 @@ def test_predicate_exists():
     assert 0 in tracer.get_known_data().existing_predicates
 
 
-def test_update_metrics_covered():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_update_metrics_covered(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     tracer.executed_compare_predicate(1, 0, 0, Compare.EQ)
@@ -58,8 +60,9 @@ def test_update_metrics_assertions(true_dist, false_dist):
         tracer._update_metrics(false_dist, true_dist, 0)
 
 
-def test_update_metrics_true_dist_min():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_update_metrics_true_dist_min(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     tracer.executed_compare_predicate(5, 0, 0, Compare.EQ)
@@ -68,8 +71,9 @@ def test_update_metrics_true_dist_min():
     assert (0, 4) in tracer.get_trace().true_distances.items()
 
 
-def test_update_metrics_false_dist_min():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_update_metrics_false_dist_min(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     tracer.executed_compare_predicate(3, 1, 0, Compare.NE)
@@ -78,16 +82,18 @@ def test_update_metrics_false_dist_min():
     assert (0, 1) in tracer.get_trace().false_distances.items()
 
 
-def test_passed_cmp_predicate():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_passed_cmp_predicate(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     tracer.executed_compare_predicate(1, 0, 0, Compare.EQ)
     assert (0, 1) in tracer.get_trace().executed_predicates.items()
 
 
-def test_passed_exception_match():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_passed_exception_match(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     tracer.executed_exception_match(ValueError(), ValueError, 0)
@@ -96,8 +102,9 @@ def test_passed_exception_match():
     assert (0, 1.0) in tracer.get_trace().false_distances.items()
 
 
-def test_passed_exception_match_not():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_passed_exception_match_not(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     tracer.executed_exception_match(NameError(), ValueError, 0)
@@ -148,33 +155,38 @@ def test_passed_exception_match_not():
         pytest.param(Compare.IS_NOT, 0, 1, 0, 1),
     ],
 )
-def test_cmp(cmp, val1, val2, true_dist, false_dist):
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_cmp(tracer_class, cmp, val1, val2, true_dist, false_dist):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     tracer.executed_compare_predicate(val1, val2, 0, cmp)
-    assert (0, true_dist) in tracer.get_trace().true_distances.items()
-    assert (0, false_dist) in tracer.get_trace().false_distances.items()
+    # Infinite distances are not stored, see PredicateDistances.
+    assert tracer.get_trace().true_distances.get(0, inf) == true_dist
+    assert tracer.get_trace().false_distances.get(0, inf) == false_dist
 
 
-def test_unknown_comp():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_unknown_comp(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     with pytest.raises(Exception):
         tracer.executed_compare_predicate(1, 1, 0, Compare.EXC_MATCH)
 
 
-def test_passed_bool_predicate():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_passed_bool_predicate(tracer_class):
+    tracer = tracer_class()
     tracer.register_predicate(MagicMock(code_object_id=0))
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.executed_bool_predicate(True, 0)
     assert (0, 1) in tracer.get_trace().executed_predicates.items()
 
 
-def test_bool_distance_true():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_bool_distance_true(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     tracer.executed_bool_predicate(True, 0)
@@ -182,8 +194,9 @@ def test_bool_distance_true():
     assert (0, 1.0) in tracer.get_trace().false_distances.items()
 
 
-def test_bool_distance_false():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_bool_distance_false(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     tracer.executed_bool_predicate(False, 0)
@@ -201,8 +214,9 @@ def test_clear():
     assert tracer.get_trace() != trace
 
 
-def test_enable_disable_cmp():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_enable_disable_cmp(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     assert len(tracer.get_trace().executed_predicates) == 0
@@ -216,8 +230,9 @@ def test_enable_disable_cmp():
     assert len(tracer.get_trace().executed_predicates) == 1
 
 
-def test_enable_disable_bool():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_enable_disable_bool(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_predicate(MagicMock(code_object_id=0))
     assert len(tracer.get_trace().executed_predicates) == 0
@@ -263,8 +278,9 @@ def test_no_branchless_code_object_register_multiple():
     assert tracer.get_known_data().branch_less_code_objects == {1}
 
 
-def test_code_object_executed_other_thread():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_code_object_executed_other_thread(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_code_object(MagicMock())
     thread = threading.Thread(target=tracer.executed_code_object, args=(0,))
@@ -273,8 +289,9 @@ def test_code_object_executed_other_thread():
     assert tracer.get_trace().executed_code_objects == set()
 
 
-def test_bool_predicate_executed_other_thread():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_bool_predicate_executed_other_thread(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_code_object(MagicMock())
     tracer.register_code_object(MagicMock(code_object_id=0))
@@ -284,8 +301,9 @@ def test_bool_predicate_executed_other_thread():
     assert tracer.get_trace().executed_predicates == {}
 
 
-def test_compare_predicate_executed_other_thread():
-    tracer = ExecutionTracer()
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_compare_predicate_executed_other_thread(tracer_class):
+    tracer = tracer_class()
     tracer.current_thread_ident = threading.currentThread().ident
     tracer.register_code_object(MagicMock())
     tracer.register_code_object(MagicMock(code_object_id=0))
@@ -295,3 +313,112 @@ def test_compare_predicate_executed_other_thread():
     thread.start()
     thread.join()
     assert tracer.get_trace().executed_predicates == {}
+
+
+def test_fast_tracer_distance_computations_by_op():
+    for cmp_op, computation in ExecutionTracer._DISTANCE_COMPUTATIONS.items():
+        assert FastExecutionTracer._DISTANCE_COMPUTATIONS_BY_OP[cmp_op] is computation
+
+
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_unsupported_compare_predicate(tracer_class):
+    tracer = tracer_class()
+    tracer.current_thread_ident = threading.currentThread().ident
+    tracer.register_predicate(MagicMock(code_object_id=0))
+    with pytest.raises(KeyError):
+        tracer.executed_compare_predicate(1, 0, 0, Compare.EXC_MATCH)
+
+
+def test_fast_tracer_reserves_predicate_slots():
+    tracer = FastExecutionTracer()
+    tracer.register_predicate(MagicMock(code_object_id=0))
+    tracer.register_predicate(MagicMock(code_object_id=0))
+    assert len(tracer.get_trace().executed_predicates.values_array) == 2
+    assert len(tracer.get_trace().true_distances.values_array) == 2
+
+
+def test_fast_tracer_disabled_while_computing_truth_value():
+    tracer = FastExecutionTracer()
+    tracer.current_thread_ident = threading.currentThread().ident
+    tracer.register_predicate(MagicMock(code_object_id=0))
+    tracer.register_predicate(MagicMock(code_object_id=0))
+
+    class Truthy:
+        def __bool__(self):
+            tracer.executed_bool_predicate(False, 1)
+            return True
+
+    tracer.executed_bool_predicate(Truthy(), 0)
+    assert dict(tracer.get_trace().executed_predicates) == {0: 1}
+    assert (0, 0.0) in tracer.get_trace().true_distances.items()
+    assert tracer._is_disabled() is False
+
+
+def test_fast_tracer_enabled_after_failing_comparison():
+    tracer = FastExecutionTracer()
+    tracer.current_thread_ident = threading.currentThread().ident
+    tracer.register_predicate(MagicMock(code_object_id=0))
+
+    class Failing:
+        def __eq__(self, other):
+            raise ValueError()
+
+    with pytest.raises(ValueError):
+        tracer.executed_compare_predicate(Failing(), 0, 0, Compare.EQ)
+    assert tracer._is_disabled() is False
+    assert len(tracer.get_trace().executed_predicates) == 0
+
+
+def test_fast_tracer_same_trace_as_tracer():
+    traces = []
+    for tracer in (ExecutionTracer(), FastExecutionTracer()):
+        tracer.current_thread_ident = threading.currentThread().ident
+        for _ in range(3):
+            tracer.register_predicate(MagicMock(code_object_id=0))
+        tracer.executed_bool_predicate(True, 0)
+        tracer.store_import_trace()
+        tracer.register_predicate(MagicMock(code_object_id=0))
+        tracer.executed_compare_predicate(3, 5, 1, Compare.LT)
+        tracer.executed_compare_predicate(7, 5, 1, Compare.LT)
+        tracer.executed_compare_predicate("a", 5, 2, Compare.EQ)
+        tracer.executed_exception_match(ValueError(), KeyError, 3)
+        traces.append(tracer.get_trace())
+    assert traces[0] == traces[1]
+
+
+@pytest.mark.parametrize("tracer_class", [ExecutionTracer, FastExecutionTracer])
+def test_saturated_predicates(tracer_class):
+    tracer = tracer_class()
+    tracer.current_thread_ident = threading.currentThread().ident
+    tracer.register_predicate(MagicMock(code_object_id=0))
+    tracer.register_predicate(MagicMock(code_object_id=0))
+    tracer.executed_bool_predicate(True, 1)
+    tracer.executed_compare_predicate(1, 2, 1, Compare.LT)
+    assert list(tracer.saturated_predicates) == [0, 0]
+    tracer.executed_compare_predicate(2, 1, 1, Compare.LT)
+    assert list(tracer.saturated_predicates) == [0, 1]
+    flags = tracer.saturated_predicates
+    tracer.clear_trace()
+    assert tracer.saturated_predicates is flags
+    assert list(flags) == [0, 0]
+
+
+def test_reset_replaces_saturated_predicates():
+    tracer = ExecutionTracer()
+    tracer.register_predicate(MagicMock(code_object_id=0))
+    flags = tracer.saturated_predicates
+    tracer.reset()
+    assert tracer.saturated_predicates is not flags
+    assert len(tracer.saturated_predicates) == 0
+
+
+def test_code_object_meta_data_computes_missing_approach_levels():
+    cdg = MagicMock()
+    cdg.nodes = set()
+    meta = CodeObjectMetaData(
+        code_object=MagicMock(), parent_code_object_id=None, cfg=MagicMock(), cdg=cdg
+    )
+    assert meta.approach_levels is None
+    index = meta.get_approach_levels()
+    assert meta.approach_levels is index
+    assert meta.get_approach_levels() is index
@@ -0,0 +1,149 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+import importlib
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.configuration as config
+import pynguin.generation.generationalgorithmfactory as gaf
+import pynguin.testcase.defaulttestcase as dtc
+import pynguin.testcase.execution.paralleltestcaseexecutor as pte
+import pynguin.testcase.statements.parametrizedstatements as param_stmt
+import pynguin.testcase.statements.primitivestatements as prim_stmt
+from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.setup.testclustergenerator import TestClusterGenerator
+from pynguin.testcase.execution.executionresult import ExecutionResult
+from pynguin.testcase.execution.executiontracer import ExecutionTracer
+from pynguin.testcase.execution.testcaseexecutor import TestCaseExecutor
+
+pytestmark = pytest.mark.skipif(
+    not pte.ParallelTestCaseExecutor.is_supported(),
+    reason="Platform does not support forking processes",
+)
+
+
+class _UnpicklableError(Exception):
+    def __init__(self, message, code):
+        super().__init__(message)
+        self.code = code
+
+
+@pytest.fixture
+def failing_test_case(method_mock):
+    test_case = dtc.DefaultTestCase()
+    int_stmt = prim_stmt.IntPrimitiveStatement(test_case, 5)
+    method_stmt = param_stmt.MethodStatement(test_case, method_mock, int_stmt.ret_val)
+    test_case.add_statement(int_stmt)
+    test_case.add_statement(method_stmt)
+    return test_case
+
+
+def test_execute_many(short_test_case, failing_test_case):
+    config.configuration.module_name = "tests.fixtures.accessibles.accessible"
+    tracer = ExecutionTracer()
+    with install_import_hook(config.configuration.module_name, tracer):
+        module = importlib.import_module(config.configuration.module_name)
+        importlib.reload(module)
+        executor = pte.ParallelTestCaseExecutor(tracer, 2)
+        try:
+            results = list(
+                executor.execute_many(
+                    [short_test_case, failing_test_case, short_test_case]
+                )
+            )
+        finally:
+            executor.shutdown()
+        sequential = TestCaseExecutor(tracer).execute(short_test_case)
+    assert [result.has_test_exceptions() for result in results] == [
+        False,
+        True,
+        False,
+    ]
+    assert results[1].get_first_position_of_thrown_exception() == 1
+    assert results[0].execution_trace == sequential.execution_trace
+
+
+def test_execute_many_with_observers_executes_locally(short_test_case):
+    executor = pte.ParallelTestCaseExecutor(ExecutionTracer(), 2)
+    executor.add_observer(MagicMock())
+    executor.execute_many([short_test_case, short_test_case])
+    assert executor._pool is None
+
+
+def test_execute_many_single_test_case_executes_locally(short_test_case):
+    executor = pte.ParallelTestCaseExecutor(ExecutionTracer(), 2)
+    assert len(list(executor.execute_many([short_test_case]))) == 1
+    assert executor._pool is None
+
+
+def test_execute_many_falls_back_on_dispatch_error(short_test_case):
+    executor = pte.ParallelTestCaseExecutor(ExecutionTracer(), 2)
+    pool = MagicMock()
+    pool.map.side_effect = TypeError("cannot pickle")
+    executor._pool = pool
+    results = list(executor.execute_many([short_test_case, short_test_case]))
+    assert len(results) == 2
+
+
+def test_number_of_workers():
+    executor = pte.ParallelTestCaseExecutor(ExecutionTracer(), 3)
+    assert executor.number_of_workers == 3
+
+
+def test_shutdown_without_pool():
+    executor = pte.ParallelTestCaseExecutor(ExecutionTracer(), 2)
+    executor.shutdown()
+    assert executor._pool is None
+
+
+def test_make_transferable_replaces_unpicklable_exception():
+    result = ExecutionResult()
+    result.report_new_thrown_exception(3, _UnpicklableError("foo", 42))
+    pte._make_transferable(result)
+    assert isinstance(result.exceptions[3], RuntimeError)
+
+
+def test_make_transferable_keeps_picklable_exception():
+    result = ExecutionResult()
+    error = ValueError("foo")
+    result.report_new_thrown_exception(3, error)
+    pte._make_transferable(result)
+    assert result.exceptions[3] is error
+
+
+@pytest.mark.parametrize(
+    "algorithm", [config.Algorithm.MOSA, config.Algorithm.WHOLE_SUITE]
+)
+def test_integrate_search(algorithm):
+    module_name = "tests.fixtures.examples.triangle"
+    config.configuration.algorithm = algorithm
+    config.configuration.stopping.budget = 1
+    config.configuration.module_name = module_name
+    config.configuration.search_algorithm.population = 4
+    tracer = ExecutionTracer()
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+
+        executor = pte.ParallelTestCaseExecutor(tracer, 2)
+        cluster = TestClusterGenerator(module_name).generate_cluster()
+        search = gaf.TestSuiteGenerationAlgorithmFactory(
+            executor, cluster
+        ).get_search_algorithm()
+        try:
+            test_suite = search.generate_tests()
+        finally:
+            executor.shutdown()
+        assert test_suite.get_coverage() > 0.0
+
+
+def test_execute_many_after_shutdown_executes_locally(short_test_case):
+    executor = pte.ParallelTestCaseExecutor(ExecutionTracer(), 2)
+    executor.shutdown()
+    assert len(list(executor.execute_many([short_test_case, short_test_case]))) == 2
+    assert executor._pool is None
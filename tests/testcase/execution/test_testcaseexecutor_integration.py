@@ -6,8 +6,12 @@
 #
 """Integration tests for the executor."""
 import importlib
+import threading
+from unittest import mock
 from unittest.mock import MagicMock
 
+import pytest
+
 import pynguin.configuration as config
 import pynguin.testcase.defaulttestcase as dtc
 import pynguin.testcase.statements.parametrizedstatements as param_stmt
@@ -66,3 +70,223 @@ def test_observers(short_test_case):
     assert observer.before_statement_execution.call_count == 2
     assert observer.after_statement_execution.call_count == 2
     assert observer.after_test_case_execution.call_count == 1
+
+
+def test_execute_many(short_test_case):
+    tracer = ExecutionTracer()
+    executor = TestCaseExecutor(tracer)
+    results = list(executor.execute_many([short_test_case, short_test_case]))
+    assert len(results) == 2
+    assert not any(result.has_test_exceptions() for result in results)
+
+
+def test_execute_many_is_lazy(short_test_case):
+    executor = TestCaseExecutor(ExecutionTracer())
+    observer = MagicMock()
+    executor.add_observer(observer)
+    results = executor.execute_many([short_test_case, short_test_case])
+    assert observer.before_test_case_execution.call_count == 0
+    next(results)
+    assert observer.after_test_case_execution.call_count == 1
+    next(results)
+    assert observer.after_test_case_execution.call_count == 2
+
+
+def test_execute_many_reuses_worker(short_test_case):
+    executor = TestCaseExecutor(ExecutionTracer())
+    with mock.patch.object(
+        executor, "_start_worker", wraps=executor._start_worker
+    ) as start_worker:
+        list(executor.execute_many([short_test_case] * 3))
+        start_worker.assert_called_once()
+
+
+def test_execute_many_timeout_restarts_worker():
+    test_case = dtc.DefaultTestCase()
+    test_case.add_statement(prim_stmt.IntPrimitiveStatement(test_case, 5))
+    executor = TestCaseExecutor(ExecutionTracer())
+    blocker = threading.Event()
+    execute_test_case = executor._execute_test_case
+
+    def _execute_test_case(test_case):
+        if not blocker.is_set():
+            blocker.wait()
+        return execute_test_case(test_case)
+
+    with mock.patch.object(
+        executor, "_execute_test_case", side_effect=_execute_test_case
+    ), mock.patch.object(
+        executor, "_start_worker", wraps=executor._start_worker
+    ) as start_worker, mock.patch.object(
+        executor, "_logger"
+    ):
+        results = executor.execute_many([test_case, test_case])
+        assert next(results).timeout
+        blocker.set()
+        assert not next(results).timeout
+        assert start_worker.call_count == 2
+
+
+def test_reuses_compiled_code(short_test_case):
+    config.configuration.module_name = "tests.fixtures.accessibles.accessible"
+    config.configuration.execution.whole_test_case_compilation = False
+    tracer = ExecutionTracer()
+    with install_import_hook(config.configuration.module_name, tracer):
+        module = importlib.import_module(config.configuration.module_name)
+        importlib.reload(module)
+        executor = TestCaseExecutor(tracer)
+        executor.execute(short_test_case)
+        result = executor.execute(short_test_case.clone())
+        assert not result.has_test_exceptions()
+        assert executor.code_cache.hits == 2
+        assert executor.code_cache.misses == 2
+
+
+def test_reuses_compiled_test_case(short_test_case):
+    config.configuration.module_name = "tests.fixtures.accessibles.accessible"
+    tracer = ExecutionTracer()
+    with install_import_hook(config.configuration.module_name, tracer):
+        module = importlib.import_module(config.configuration.module_name)
+        importlib.reload(module)
+        executor = TestCaseExecutor(tracer)
+        executor.execute(short_test_case)
+        result = executor.execute(short_test_case.clone())
+        assert not result.has_test_exceptions()
+        assert executor.code_cache.hits == 1
+        assert executor.code_cache.misses == 1
+
+
+@pytest.mark.parametrize("whole_test_case_compilation", [True, False])
+def test_attributes_exception_to_statement(
+    short_test_case, method_mock, whole_test_case_compilation
+):
+    config.configuration.module_name = "tests.fixtures.accessibles.accessible"
+    config.configuration.execution.whole_test_case_compilation = (
+        whole_test_case_compilation
+    )
+    # simple_method is called on an int, which does not provide this method.
+    int_stmt = short_test_case.statements[0]
+    short_test_case.add_statement(
+        param_stmt.MethodStatement(
+            short_test_case, method_mock, int_stmt.ret_val, {"x": int_stmt.ret_val}
+        )
+    )
+    short_test_case.add_statement(prim_stmt.IntPrimitiveStatement(short_test_case, 3))
+    tracer = ExecutionTracer()
+    with install_import_hook(config.configuration.module_name, tracer):
+        module = importlib.import_module(config.configuration.module_name)
+        importlib.reload(module)
+        executor = TestCaseExecutor(tracer)
+        result = executor.execute(short_test_case)
+        assert list(result.exceptions) == [2]
+        assert isinstance(result.exceptions[2], AttributeError)
+
+
+def test_observed_execution_executes_statements_on_their_own(short_test_case):
+    config.configuration.module_name = "tests.fixtures.accessibles.accessible"
+    tracer = ExecutionTracer()
+    with install_import_hook(config.configuration.module_name, tracer):
+        module = importlib.import_module(config.configuration.module_name)
+        importlib.reload(module)
+        executor = TestCaseExecutor(tracer)
+        observer = MagicMock()
+        executor.add_observer(observer)
+        executor.execute(short_test_case)
+        assert observer.before_statement_execution.call_count == 2
+        assert executor.code_cache.misses == 2
+
+
+def _execute_with_snapshots(test_cases):
+    config.configuration.module_name = "tests.fixtures.accessibles.accessible"
+    config.configuration.execution.deterministic_sut = True
+    tracer = ExecutionTracer()
+    with install_import_hook(config.configuration.module_name, tracer):
+        module = importlib.import_module(config.configuration.module_name)
+        importlib.reload(module)
+        executor = TestCaseExecutor(tracer)
+        return executor, list(executor.execute_many(test_cases))
+
+
+def _append_method_call(test_case, method_mock):
+    test_case.add_statement(
+        param_stmt.MethodStatement(
+            test_case,
+            method_mock,
+            test_case.statements[1].ret_val,
+            {"x": test_case.statements[0].ret_val},
+        )
+    )
+    return test_case
+
+
+def test_resumes_from_snapshot(short_test_case, method_mock):
+    offspring = _append_method_call(short_test_case.clone(), method_mock)
+    executor, results = _execute_with_snapshots([short_test_case, offspring])
+    assert executor.snapshot_cache.reused_statements == 2
+    assert not results[1].has_test_exceptions()
+    _, fresh_results = _execute_with_snapshots([offspring])
+    assert results[1].execution_trace == fresh_results[0].execution_trace
+
+
+def test_resumed_execution_attributes_exception(short_test_case, method_mock):
+    offspring = short_test_case.clone()
+    int_stmt = offspring.statements[0]
+    # simple_method is called on an int, which does not provide this method.
+    offspring.add_statement(
+        param_stmt.MethodStatement(
+            offspring, method_mock, int_stmt.ret_val, {"x": int_stmt.ret_val}
+        )
+    )
+    executor, results = _execute_with_snapshots([short_test_case, offspring])
+    assert executor.snapshot_cache.reused_statements == 2
+    assert list(results[1].exceptions) == [2]
+
+
+def test_uncopyable_state_is_not_snapshot(short_test_case):
+    with mock.patch(
+        "copy.deepcopy", side_effect=TypeError("cannot copy")
+    ) as deepcopy_mock:
+        executor, results = _execute_with_snapshots([short_test_case])
+    assert not results[0].has_test_exceptions()
+    assert len(executor.snapshot_cache) == 0
+    deepcopy_mock.assert_called_once()
+
+
+def test_failed_restore_executes_from_scratch(short_test_case):
+    executor, _ = _execute_with_snapshots([short_test_case])
+    with mock.patch("copy.deepcopy", side_effect=TypeError("cannot copy")):
+        result = executor.execute(short_test_case.clone())
+    assert not result.has_test_exceptions()
+    assert executor.snapshot_cache.reused_statements == 0
+
+
+def test_disabled_snapshot_cache_takes_no_snapshots(short_test_case):
+    config.configuration.execution.snapshot_cache_size = 0
+    with mock.patch("copy.deepcopy") as deepcopy_mock:
+        _, results = _execute_with_snapshots([short_test_case])
+    assert not results[0].has_test_exceptions()
+    deepcopy_mock.assert_not_called()
+
+
+def test_snapshot_interval_must_be_positive():
+    config.configuration.execution.snapshot_interval = 0
+    with pytest.raises(AssertionError):
+        TestCaseExecutor(ExecutionTracer())
+
+
+def test_snapshots_after_interval_and_last_statement(short_test_case, method_mock):
+    config.configuration.execution.snapshot_interval = 2
+    offspring = _append_method_call(short_test_case.clone(), method_mock)
+    executor, _ = _execute_with_snapshots([offspring])
+    assert len(executor.snapshot_cache) == 2
+    assert not executor.execute(short_test_case).has_test_exceptions()
+    assert executor.snapshot_cache.reused_statements == 2
+
+
+def test_resumes_statement_by_statement(short_test_case, method_mock):
+    config.configuration.execution.whole_test_case_compilation = False
+    offspring = _append_method_call(short_test_case.clone(), method_mock)
+    executor, results = _execute_with_snapshots([short_test_case, offspring])
+    assert executor.snapshot_cache.reused_statements == 2
+    assert executor.code_cache.misses == 3
+    assert not results[1].has_test_exceptions()
@@ -192,22 +192,22 @@ def test_primitive_statement_equals_other_type(statement_type, value):
     ],
 )
 def test_primitive_statement_equals_clone(statement_type, value):
-    test_case = MagicMock(tc.TestCase)
+    test_case = dtc.DefaultTestCase()
     statement = statement_type(test_case, value)
-    test_case.statements = [statement]
-    test_case2 = MagicMock(tc.TestCase)
+    test_case.add_statement(statement)
+    test_case2 = dtc.DefaultTestCase()
     clone = statement.clone(test_case2)
-    test_case2.statements = [clone]
+    test_case2.add_statement(clone)
     assert statement.__eq__(clone)
 
 
 def test_none_statement_equals_clone():
-    test_case = MagicMock(tc.TestCase)
+    test_case = dtc.DefaultTestCase()
     statement = prim.NoneStatement(test_case, type(None))
-    test_case.statements = [statement]
-    test_case2 = MagicMock(tc.TestCase)
+    test_case.add_statement(statement)
+    test_case2 = dtc.DefaultTestCase()
     clone = statement.clone(test_case2)
-    test_case2.statements = [clone]
+    test_case2.add_statement(clone)
     assert statement.__eq__(clone)
 
 
@@ -4,6 +4,7 @@
 #
 #  SPDX-License-Identifier: LGPL-3.0-or-later
 #
+from typing import Any, Union
 from unittest.mock import MagicMock
 
 import pytest
@@ -228,6 +229,95 @@ def test_get_objects(default_test_case):
     assert result == [vri_1]
 
 
+def _add_mixed_statements(test_case):
+    statements = [
+        prim.IntPrimitiveStatement(test_case, 1),
+        prim.FloatPrimitiveStatement(test_case, 2.0),
+        prim.NoneStatement(test_case, type(None)),
+        prim.IntPrimitiveStatement(test_case, 3),
+        prim.StringPrimitiveStatement(test_case, "foo"),
+    ]
+    for statement in statements:
+        test_case.add_statement(statement)
+    return [statement.ret_val for statement in statements]
+
+
+@pytest.mark.parametrize(
+    "parameter_type,position,expected",
+    [
+        pytest.param(int, 5, [0, 3]),
+        pytest.param(int, 3, [0]),
+        pytest.param(int, 42, [0, 3]),
+        pytest.param(Union[int, str], 5, [0, 3, 4]),
+        pytest.param(Any, 4, [0, 1, 3]),
+        pytest.param(None, 5, [0, 1, 3, 4]),
+        pytest.param(bytes, 5, []),
+    ],
+)
+def test_get_objects_by_type(default_test_case, parameter_type, position, expected):
+    references = _add_mixed_statements(default_test_case)
+    assert default_test_case.get_objects(parameter_type, position) == [
+        references[i] for i in expected
+    ]
+
+
+def test_get_objects_after_append(default_test_case):
+    references = _add_mixed_statements(default_test_case)
+    assert default_test_case.get_objects(int, 5) == [references[0], references[3]]
+    appended = default_test_case.add_statement(
+        prim.IntPrimitiveStatement(default_test_case, 4)
+    )
+    assert default_test_case.get_objects(int, 6) == [
+        references[0],
+        references[3],
+        appended,
+    ]
+
+
+def test_get_objects_after_insert_remove_and_set(default_test_case):
+    references = _add_mixed_statements(default_test_case)
+    assert default_test_case.get_objects(int, 5) == [references[0], references[3]]
+    inserted = default_test_case.add_statement(
+        prim.IntPrimitiveStatement(default_test_case, 4), 1
+    )
+    assert default_test_case.get_objects(int, 6) == [
+        references[0],
+        inserted,
+        references[3],
+    ]
+    default_test_case.remove(0)
+    assert default_test_case.get_objects(int, 5) == [inserted, references[3]]
+    replacement = default_test_case.set_statement(
+        prim.StringPrimitiveStatement(default_test_case, "bar"), 0
+    )
+    assert default_test_case.get_objects(int, 5) == [references[3]]
+    assert default_test_case.get_objects(str, 5) == [replacement, references[4]]
+
+
+def test_get_objects_after_type_change(default_test_case):
+    references = _add_mixed_statements(default_test_case)
+    assert default_test_case.get_objects(int, 5) == [references[0], references[3]]
+    references[1].variable_type = int
+    assert default_test_case.get_objects(int, 5) == references[:2] + [references[3]]
+
+
+def test_get_objects_after_return_value_change(default_test_case):
+    references = _add_mixed_statements(default_test_case)
+    assert default_test_case.get_objects(float, 5) == [references[1]]
+    replacement = vri.VariableReferenceImpl(default_test_case, float)
+    default_test_case.get_statement(0).ret_val = replacement
+    assert default_test_case.get_objects(float, 5) == [replacement, references[1]]
+
+
+def test_get_all_objects(default_test_case):
+    references = _add_mixed_statements(default_test_case)
+    assert default_test_case.get_all_objects(4) == [
+        references[0],
+        references[1],
+        references[3],
+    ]
+
+
 def test_get_objects_without_type(default_test_case):
     result = default_test_case.get_objects(None, 42)
     assert result == []
@@ -303,3 +393,68 @@ def test_get_assertions_multiple_statements(default_test_case_with_assertions):
 def test_get_size_with_assertions(default_test_case_with_assertions):
     test_case, assertions = default_test_case_with_assertions
     assert test_case.size_with_assertions() == 6  # 3 stmts + 3 assertions
+
+
+def _add_int_statements(test_case, count):
+    statements = [prim.IntPrimitiveStatement(test_case, i) for i in range(count)]
+    for statement in statements:
+        test_case.add_statement(statement)
+    return statements
+
+
+def test_get_position_of(default_test_case):
+    statements = _add_int_statements(default_test_case, 3)
+    assert [
+        default_test_case.get_position_of(statement.ret_val) for statement in statements
+    ] == [0, 1, 2]
+
+
+def test_get_position_of_unknown(default_test_case):
+    _add_int_statements(default_test_case, 2)
+    reference = vri.VariableReferenceImpl(default_test_case, int)
+    assert default_test_case.get_position_of(reference) is None
+
+
+def test_get_position_of_after_insert_and_remove(default_test_case):
+    statements = _add_int_statements(default_test_case, 3)
+    inserted = prim.IntPrimitiveStatement(default_test_case, 42)
+    default_test_case.add_statement(inserted, 1)
+    assert default_test_case.get_position_of(statements[2].ret_val) == 3
+    default_test_case.remove(0)
+    assert default_test_case.get_position_of(inserted.ret_val) == 0
+    assert default_test_case.get_position_of(statements[0].ret_val) is None
+    default_test_case.chop(0)
+    assert default_test_case.get_position_of(statements[1].ret_val) is None
+
+
+def test_get_position_of_after_external_change(default_test_case):
+    statements = _add_int_statements(default_test_case, 3)
+    default_test_case.get_position_of(statements[2].ret_val)
+    default_test_case.statements.reverse()
+    assert default_test_case.get_position_of(statements[2].ret_val) == 0
+    assert default_test_case.get_position_of(statements[0].ret_val) == 2
+
+
+def test_get_position_of_first_definition(default_test_case):
+    statements = _add_int_statements(default_test_case, 2)
+    assignment = MagicMock(st.Statement)
+    assignment.ret_val = statements[0].ret_val
+    default_test_case.add_statement(assignment)
+    assert default_test_case.get_position_of(statements[0].ret_val) == 0
+    default_test_case.add_statement(prim.IntPrimitiveStatement(default_test_case, 3), 0)
+    assert default_test_case.get_position_of(statements[0].ret_val) == 1
+
+
+def test_clone_long_test_case(default_test_case, function_mock):
+    previous = prim.FloatPrimitiveStatement(default_test_case, 1.0)
+    default_test_case.add_statement(previous)
+    for _ in range(500):
+        call = ps.FunctionStatement(
+            default_test_case, function_mock, {"z": previous.ret_val}
+        )
+        default_test_case.add_statement(call)
+        previous = prim.FloatPrimitiveStatement(default_test_case, 1.0)
+        default_test_case.add_statement(previous)
+    cloned = default_test_case.clone()
+    assert cloned == default_test_case
+    assert cloned.get_position_of(cloned.statements[-1].ret_val) == 1000
@@ -0,0 +1,231 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+import inspect
+
+import pytest
+
+import pynguin.testcase.defaulttestcase as dtc
+import pynguin.testcase.statement_to_fingerprint as stmt_to_fp
+import pynguin.testcase.statements.assignmentstatement as assign_stmt
+import pynguin.testcase.statements.collectionsstatements as coll_stmt
+import pynguin.testcase.statements.fieldstatement as field_stmt
+import pynguin.testcase.statements.parametrizedstatements as param_stmt
+import pynguin.testcase.statements.primitivestatements as prim_stmt
+from pynguin.utils.namingscope import NamingScope
+
+
+def _fingerprints(test_case):
+    module_aliases = NamingScope(prefix="module")
+    variable_names = NamingScope()
+    fingerprints = []
+    for statement in test_case.statements:
+        visitor = stmt_to_fp.StatementToFingerprintVisitor(
+            module_aliases, variable_names
+        )
+        statement.accept(visitor)
+        fingerprints.append(visitor.fingerprint)
+    return fingerprints
+
+
+def _primitive_fingerprint(statement_type, value):
+    test_case = dtc.DefaultTestCase()
+    test_case.add_statement(statement_type(test_case, value))
+    return _fingerprints(test_case)[0]
+
+
+def test_no_statement_visited():
+    visitor = stmt_to_fp.StatementToFingerprintVisitor(NamingScope(), NamingScope())
+    with pytest.raises(AssertionError):
+        visitor.fingerprint  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize(
+    "statement_type,value",
+    [
+        (prim_stmt.IntPrimitiveStatement, 42),
+        (prim_stmt.FloatPrimitiveStatement, 1.5),
+        (prim_stmt.StringPrimitiveStatement, "foo"),
+        (prim_stmt.BytesPrimitiveStatement, b"foo"),
+        (prim_stmt.BooleanPrimitiveStatement, True),
+        (prim_stmt.NoneStatement, None),
+    ],
+)
+def test_primitive_equal_values(statement_type, value):
+    assert _primitive_fingerprint(statement_type, value) == _primitive_fingerprint(
+        statement_type, value
+    )
+
+
+@pytest.mark.parametrize(
+    "first,second",
+    [
+        ((prim_stmt.IntPrimitiveStatement, 1), (prim_stmt.IntPrimitiveStatement, 2)),
+        (
+            (prim_stmt.IntPrimitiveStatement, 1),
+            (prim_stmt.BooleanPrimitiveStatement, True),
+        ),
+        (
+            (prim_stmt.FloatPrimitiveStatement, 0.0),
+            (prim_stmt.FloatPrimitiveStatement, -0.0),
+        ),
+        (
+            (prim_stmt.StringPrimitiveStatement, "foo"),
+            (prim_stmt.BytesPrimitiveStatement, b"foo"),
+        ),
+    ],
+)
+def test_primitive_different_values(first, second):
+    assert _primitive_fingerprint(*first) != _primitive_fingerprint(*second)
+
+
+def test_float_nan_is_stable():
+    nan = float("nan")
+    assert _primitive_fingerprint(
+        prim_stmt.FloatPrimitiveStatement, nan
+    ) == _primitive_fingerprint(prim_stmt.FloatPrimitiveStatement, nan)
+
+
+def test_registers_names():
+    test_case = dtc.DefaultTestCase()
+    int_stmt = prim_stmt.IntPrimitiveStatement(test_case, 5)
+    test_case.add_statement(int_stmt)
+    variable_names = NamingScope()
+    visitor = stmt_to_fp.StatementToFingerprintVisitor(
+        NamingScope(prefix="module"), variable_names
+    )
+    int_stmt.accept(visitor)
+    assert int_stmt.ret_val in variable_names.known_name_indices
+
+
+def test_clone_has_same_fingerprints(short_test_case):
+    assert _fingerprints(short_test_case) == _fingerprints(short_test_case.clone())
+
+
+def test_constructor_registers_module(short_test_case):
+    module_aliases = NamingScope(prefix="module")
+    variable_names = NamingScope()
+    for statement in short_test_case.statements:
+        statement.accept(
+            stmt_to_fp.StatementToFingerprintVisitor(module_aliases, variable_names)
+        )
+    assert list(module_aliases.known_name_indices) == [
+        "tests.fixtures.accessibles.accessible"
+    ]
+
+
+def test_changed_argument_changes_fingerprint(short_test_case):
+    fingerprints = _fingerprints(short_test_case)
+    clone = short_test_case.clone()
+    # Use an additional int as argument of the constructor.
+    int_stmt = prim_stmt.IntPrimitiveStatement(clone, 5)
+    clone.add_statement(int_stmt, 1)
+    clone.statements[2].replace(clone.statements[0].ret_val, int_stmt.ret_val)
+    cloned_fingerprints = _fingerprints(clone)
+    assert cloned_fingerprints[0] == fingerprints[0]
+    assert cloned_fingerprints[2] != fingerprints[1]
+
+
+@pytest.fixture()
+def test_case_with_calls(constructor_mock, method_mock, function_mock):
+    test_case = dtc.DefaultTestCase()
+    float_stmt = prim_stmt.FloatPrimitiveStatement(test_case, 5.0)
+    int_stmt = prim_stmt.IntPrimitiveStatement(test_case, 5)
+    constructor_stmt = param_stmt.ConstructorStatement(
+        test_case, constructor_mock, {"y": float_stmt.ret_val}
+    )
+    test_case.add_statement(float_stmt)
+    test_case.add_statement(int_stmt)
+    test_case.add_statement(constructor_stmt)
+    method_stmt = param_stmt.MethodStatement(
+        test_case, method_mock, constructor_stmt.ret_val, {"x": int_stmt.ret_val}
+    )
+    function_stmt = param_stmt.FunctionStatement(
+        test_case, function_mock, {"z": float_stmt.ret_val}
+    )
+    test_case.add_statement(method_stmt)
+    test_case.add_statement(function_stmt)
+    return test_case
+
+
+def test_calls(test_case_with_calls):
+    fingerprints = _fingerprints(test_case_with_calls)
+    assert fingerprints[2:] == [
+        (
+            param_stmt.ConstructorStatement,
+            "var2",
+            "module0",
+            "SomeType",
+            (("y", inspect.Parameter.POSITIONAL_OR_KEYWORD, "var0"),),
+        ),
+        (
+            param_stmt.MethodStatement,
+            "var3",
+            "var2",
+            "simple_method",
+            (("x", inspect.Parameter.POSITIONAL_OR_KEYWORD, "var1"),),
+        ),
+        (
+            param_stmt.FunctionStatement,
+            "var4",
+            "module0",
+            "simple_function",
+            (("z", inspect.Parameter.POSITIONAL_OR_KEYWORD, "var0"),),
+        ),
+    ]
+
+
+def test_field_and_assignment(short_test_case, field_mock):
+    constructor_stmt = short_test_case.statements[1]
+    f_stmt = field_stmt.FieldStatement(
+        short_test_case, field_mock, constructor_stmt.ret_val
+    )
+    short_test_case.add_statement(f_stmt)
+    a_stmt = assign_stmt.AssignmentStatement(
+        short_test_case, f_stmt.ret_val, short_test_case.statements[0].ret_val
+    )
+    short_test_case.add_statement(a_stmt)
+    fingerprints = _fingerprints(short_test_case)
+    assert fingerprints[2] == (
+        field_stmt.FieldStatement,
+        "var2",
+        field_mock.owner,
+        "y",
+        "var1",
+    )
+    assert fingerprints[3] == (assign_stmt.AssignmentStatement, "var2", "var0")
+
+
+@pytest.mark.parametrize(
+    "statement_type",
+    [coll_stmt.ListStatement, coll_stmt.SetStatement, coll_stmt.TupleStatement],
+)
+def test_collections(statement_type):
+    test_case = dtc.DefaultTestCase()
+    int_stmt = prim_stmt.IntPrimitiveStatement(test_case, 5)
+    test_case.add_statement(int_stmt)
+    collection_stmt = statement_type(
+        test_case, list, [int_stmt.ret_val, int_stmt.ret_val]
+    )
+    test_case.add_statement(collection_stmt)
+    assert _fingerprints(test_case)[1] == (statement_type, "var1", ("var0", "var0"))
+
+
+def test_dict():
+    test_case = dtc.DefaultTestCase()
+    int_stmt = prim_stmt.IntPrimitiveStatement(test_case, 5)
+    str_stmt = prim_stmt.StringPrimitiveStatement(test_case, "foo")
+    test_case.add_statement(int_stmt)
+    test_case.add_statement(str_stmt)
+    dict_stmt = coll_stmt.DictStatement(
+        test_case, dict, [(str_stmt.ret_val, int_stmt.ret_val)]
+    )
+    test_case.add_statement(dict_stmt)
+    assert _fingerprints(test_case)[2] == (
+        coll_stmt.DictStatement,
+        "var2",
+        (("var1", "var0"),),
+    )
@@ -30,6 +30,7 @@ from tests.fixtures.examples.monkey import Monkey
 def test_cluster_mock():
     cluster = MagicMock(TestCluster)
     cluster.get_generators_for.return_value = set()
+    cluster.get_feasible_generators_for.return_value = ()
     return cluster
 
 
@@ -242,7 +243,7 @@ def test_attempt_generation_for_type(test_case_mock):
     factory = tf.TestFactory(MagicMock(TestCluster))
     factory.append_generic_accessible = mock_method
     factory._attempt_generation_for_type(
-        test_case_mock, 0, 0, True, {MagicMock(gao.GenericAccessibleObject)}
+        test_case_mock, 0, 0, True, (MagicMock(gao.GenericAccessibleObject),)
     )
 
 
@@ -282,7 +283,7 @@ def test_attempt_generation_for_type_from_cluster(test_case_mock):
         )  # pragma: no cover
 
     cluster = TestCluster()
-    cluster.get_generators_for = lambda t: MagicMock(
+    cluster.get_feasible_generators_for = lambda t, d: MagicMock(
         gao.GenericAccessibleObject
     )  # pragma: no cover
     factory = tf.TestFactory(cluster)
@@ -290,6 +291,47 @@ def test_attempt_generation_for_type_from_cluster(test_case_mock):
     factory._attempt_generation(test_case_mock, MagicMock(tf.TestFactory), 0, 0, True)
 
 
+@pytest.mark.parametrize("allow_none", [True, False])
+def test_attempt_generation_skips_infeasible_generators(test_cluster_mock, allow_none):
+    config.configuration.test_creation.none_probability = 0.0
+    test_cluster_mock.select_concrete_type.side_effect = lambda t: t
+    test_cluster_mock.get_generators_for.return_value = {
+        MagicMock(gao.GenericConstructor)
+    }
+    factory = tf.TestFactory(test_cluster_mock)
+    test_case = dtc.DefaultTestCase()
+    assert factory._attempt_generation(test_case, Monkey, 0, 3, allow_none) is None
+    test_cluster_mock.get_feasible_generators_for.assert_called_with(Monkey, 3)
+    assert test_case.size() == 0
+    assert factory.skipped_constructions == 1
+
+
+def test_infeasible_generators_fall_back_to_existing_object(test_cluster_mock):
+    config.configuration.test_creation.none_probability = 0.0
+    config.configuration.test_creation.object_reuse_probability = 0.0
+    config.configuration.type_inference.guess_unknown_types = False
+    test_cluster_mock.select_concrete_type.side_effect = lambda t: t
+    test_cluster_mock.get_generators_for.return_value = {
+        MagicMock(gao.GenericConstructor)
+    }
+    factory = tf.TestFactory(test_cluster_mock)
+    test_case = MagicMock(dtc.DefaultTestCase)
+    existing = MagicMock(vri.VariableReferenceImpl)
+    test_case.get_objects.return_value = [existing]
+    assert factory._create_or_reuse_variable(test_case, Monkey, 1, 3, True) is existing
+    assert factory.skipped_constructions == 1
+
+
+def test_attempt_generation_without_generators(test_cluster_mock):
+    config.configuration.test_creation.none_probability = 0.0
+    test_cluster_mock.select_concrete_type.side_effect = lambda t: t
+    factory = tf.TestFactory(test_cluster_mock)
+    assert (
+        factory._attempt_generation(dtc.DefaultTestCase(), Monkey, 0, 0, True) is None
+    )
+    assert factory.skipped_constructions == 0
+
+
 def test__rollback_changes_mid():
     test_case = dtc.DefaultTestCase()
     test_case.add_statement(prim.IntPrimitiveStatement(test_case, 5))
@@ -961,3 +1003,20 @@ def test_create_or_reuse_variable_no_guessing(test_case_mock):
     factory = tf.TestFactory(cluster)
     config.configuration.type_inference.guess_unknown_types = False
     assert factory._create_or_reuse_variable(test_case_mock, None, 1, 1, True) is None
+
+
+def test_delete_statement_gracefully_only_previous_alternatives(function_mock):
+    test_case = dtc.DefaultTestCase()
+    float_prim0 = prim.FloatPrimitiveStatement(test_case, 5.0)
+    float_prim1 = prim.FloatPrimitiveStatement(test_case, 5.0)
+    float_function = par_stmt.FunctionStatement(
+        test_case, function_mock, {"z": float_prim1.ret_val}
+    )
+    float_prim2 = prim.FloatPrimitiveStatement(test_case, 5.0)
+    test_case.add_statement(float_prim0)
+    test_case.add_statement(float_prim1)
+    test_case.add_statement(float_function)
+    test_case.add_statement(float_prim2)
+    assert tf.TestFactory.delete_statement_gracefully(test_case, 1)
+    assert test_case.statements == [float_prim0, float_function, float_prim2]
+    assert float_function.references(float_prim0.ret_val)
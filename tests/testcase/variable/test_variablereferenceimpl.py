@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+import pynguin.testcase.defaulttestcase as dtc
 import pynguin.testcase.statements.statement as stmt
 import pynguin.testcase.testcase as tc
 import pynguin.testcase.variable.variablereferenceimpl as vri
@@ -28,9 +29,7 @@ def test_setters(test_case_mock):
 
 def test_clone(test_case_mock):
     orig_ref = vri.VariableReferenceImpl(test_case_mock, int)
-    orig_statement = MagicMock(stmt.Statement)
-    orig_statement.ret_val = orig_ref
-    test_case_mock.statements = [orig_statement]
+    test_case_mock.get_position_of.return_value = 0
 
     new_test_case = MagicMock(tc.TestCase)
     new_ref = vri.VariableReferenceImpl(new_test_case, int)
@@ -44,9 +43,7 @@ def test_clone(test_case_mock):
 
 def test_clone_with_offset(test_case_mock):
     orig_ref = vri.VariableReferenceImpl(test_case_mock, int)
-    orig_statement = MagicMock(stmt.Statement)
-    orig_statement.ret_val = orig_ref
-    test_case_mock.statements = [orig_statement]
+    test_case_mock.get_position_of.return_value = 0
 
     new_test_case = MagicMock(tc.TestCase)
     new_test_case.get_statement.return_value = MagicMock(stmt.Statement)
@@ -54,18 +51,17 @@ def test_clone_with_offset(test_case_mock):
     new_test_case.get_statement.assert_called_once_with(5)
 
 
-def test_get_position(test_case_mock):
-    ref = vri.VariableReferenceImpl(test_case_mock, int)
-    ref._test_case = test_case_mock
+def test_get_position():
+    test_case = dtc.DefaultTestCase()
+    ref = vri.VariableReferenceImpl(test_case, int)
     statement = MagicMock(stmt.Statement)
     statement.ret_val = ref
-    test_case_mock.statements = [statement]
+    test_case.add_statement(statement)
     assert ref.get_statement_position() == 0
 
 
-def test_get_position_no_statements(test_case_mock):
-    ref = vri.VariableReferenceImpl(test_case_mock, int)
-    test_case_mock.statements = []
+def test_get_position_no_statements():
+    ref = vri.VariableReferenceImpl(dtc.DefaultTestCase(), int)
     with pytest.raises(Exception):
         ref.get_statement_position()
 
@@ -93,6 +93,10 @@ def test_generic_method_dependencies(method_mock):
     assert method_mock.get_dependencies() == {int, SomeType}
 
 
+def test_generic_method_dependencies_cached(method_mock):
+    assert method_mock.get_dependencies() is method_mock.get_dependencies()
+
+
 def test_generic_function_eq_self(function_mock):
     assert function_mock == function_mock
 
@@ -0,0 +1,49 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2021 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+import pytest
+
+from pynguin.utils.lrucache import LRUCache
+
+
+def test_miss():
+    cache = LRUCache(10)
+    assert cache.get("foo") is None
+    assert cache.misses == 1
+    assert cache.hits == 0
+
+
+def test_hit():
+    cache = LRUCache(10)
+    vector = [0.0, 1.0]
+    cache.put("foo", vector)
+    assert cache.get("foo") is vector
+    assert cache.misses == 0
+    assert cache.hits == 1
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("foo", 0)
+    cache.put("bar", 1)
+    cache.get("foo")
+    cache.put("baz", 2)
+    assert len(cache) == 2
+    assert cache.get("bar") is None
+    assert cache.get("foo") == 0
+    assert cache.get("baz") == 2
+
+
+def test_disabled():
+    cache = LRUCache(0)
+    cache.put("foo", 0)
+    assert len(cache) == 0
+    assert cache.get("foo") is None
+
+
+def test_negative_size():
+    with pytest.raises(AssertionError):
+        LRUCache(-1)
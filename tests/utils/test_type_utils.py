@@ -95,6 +95,21 @@ def test_function_in_module(module, result):
 )
 def test_is_assignable_to(from_type, to_type, result):
     assert is_assignable_to(from_type, to_type) == result
+    assert is_assignable_to(from_type, to_type) == result
+
+
+def test_is_assignable_to_memoised():
+    with patch("pynguin.utils.type_utils.is_union_type") as union_mock:
+        union_mock.return_value = False
+        assert not is_assignable_to(bool, Union[complex, bytes])
+        assert not is_assignable_to(bool, Union[complex, bytes])
+    union_mock.assert_called_once()
+
+
+def test_is_assignable_to_unhashable():
+    unhashable = [int]
+    assert is_assignable_to(unhashable, unhashable)
+    assert not is_assignable_to(int, unhashable)
 
 
 @pytest.mark.parametrize(